@@ -1,24 +1,24 @@
-from datetime import datetime
-
 from langchain.agents import create_agent
 from langchain.agents.middleware import ModelRequest, dynamic_prompt
-from langgraph.checkpoint.memory import MemorySaver
 
 from app.agent.ecos_tools import (
     get_statistic_data,
     get_statistic_item_list,
     search_statistics,
 )
-from app.core.dependencies import get_chat_model
-
+from app.agent.middleware import deadline_model_call
+from app.core.callbacks import (
+    MetricsCallback,
+    TokenUsageCallback,
+    TracingCallback,
+)
+from app.core.dependencies import get_chat_model, get_checkpointer
+from app.core.prompts import build_prompt, date_context
 
-@dynamic_prompt
-def date_aware_system_prompt(request: ModelRequest) -> str:
-    today = datetime.now().strftime("%Y%m%d")
-    return f"""You are a helpful AI assistant specialized in Korean Economic Statistics (ECOS).
+ECOS_AGENT_INSTRUCTIONS = """You are a helpful AI assistant specialized in Korean Economic Statistics (ECOS).
 
     *** CRITICAL INSTRUCTION ***
-    Current Date: {today} (Format: YYYYMMDD).
+    The Current Date (Format: YYYYMMDD) is given at the end of this prompt.
     The current year is **2026**.
     IGNORE your internal knowledge cutoff or training date.
     You are operating in **2026**.
@@ -36,7 +36,7 @@ Workflow:
 2. INSPECT ITEMS (RECOMMENDED):
    - For complex statistics (e.g., "GDP", "CPI", "Balance of Payments") that have many sub-items (Agriculture, Manufacturing, etc.):
    - Call **'get_statistic_item_list'** to see available sub-items.
-   - Example output: `[{{'code': '1400', 'name': 'GDP', 'start_time': '1960Q1', 'end_time': '2024Q2'}}]`
+   - Example output: `[{'code': '1400', 'name': 'GDP', 'start_time': '1960Q1', 'end_time': '2024Q2'}]`
    - **CRITICAL**: Check `end_time` in the result. If the data ends in "2023", DO NOT fetch "2024" or "2025". Adjust your `start_time` and `end_time` to match the **available range**.
    - Pick the **Item Code** that best matches the user's intent (e.g., "1400" for Total GDP).
 
@@ -47,7 +47,7 @@ Workflow:
      - **Monthly (M)**: YYYYMM (e.g., "202401")
      - **Daily (D)**: YYYYMMDD (e.g., "20240101")
    - **DATE LOGIC**:
-     - "Recent" = Last 2 years from Today ({today}) OR **Last 2 years of Available Data** (if data ends early).
+     - "Recent" = Last 2 years from Today (Current Date) OR **Last 2 years of Available Data** (if data ends early).
      - For **Daily(D)** data, if a specific date (e.g., Holiday/Weekend) has no data, **Retry with the nearest preceding business day**.
      - **CRITICAL**: If 'get_statistic_data' returns an error saying "INFO-200" or excludes data for your range, **DO NOT** call 'get_statistic_data' again with the **exact same parameters**. Change the date, cycle, or item_code before retrying. 
    - CALL 'get_statistic_data' (Use `item_code` if found in Step 2).
@@ -70,17 +70,28 @@ Workflow:
 Example:
 User: "GDP trend?"
 Search Result: "200Y105" (Nominal GDP)
-Item List: get_statistic_item_list("200Y105") -> Found `{{'code': '1400', 'name': '국내총생산(GDP)', 'end_time': '2025Q4'}}`
+Item List: get_statistic_item_list("200Y105") -> Found `{'code': '1400', 'name': '국내총생산(GDP)', 'end_time': '2025Q4'}`
 Tool Call: get_statistic_data(code="200Y105", cycle=Q, start="2024Q1", end="2025Q4", item_code="1400")
 """
 
 
+@dynamic_prompt
+def date_aware_system_prompt(request: ModelRequest) -> str:
+    return build_prompt(ECOS_AGENT_INSTRUCTIONS, date_context())
+
+
 llm = get_chat_model()
 tools = [search_statistics, get_statistic_data, get_statistic_item_list]
 
 ecos_agent = create_agent(
     model=llm,
     tools=tools,
-    middleware=[date_aware_system_prompt],
-    checkpointer=MemorySaver(),
+    middleware=[date_aware_system_prompt, deadline_model_call],
+    checkpointer=get_checkpointer("ecos_agent"),
+).with_config(
+    callbacks=[
+        TokenUsageCallback("ecos_agent"),
+        MetricsCallback("ecos_agent"),
+        TracingCallback("ecos_agent"),
+    ]
 )
@@ -0,0 +1,24 @@
+from typing import Awaitable, Callable
+
+from langchain.agents.middleware import ModelRequest, ModelResponse, wrap_model_call
+
+from app.core.config import settings
+from app.core.deadline import DeadlineExceeded, remaining, with_timeout
+
+
+@wrap_model_call
+async def deadline_model_call(
+    request: ModelRequest,
+    handler: Callable[[ModelRequest], Awaitable[ModelResponse]],
+) -> ModelResponse:
+    """
+    Bound each agent model call by the run's time budget: LLM_TIMEOUT shortened
+    to what is left, and no new call once the deadline has passed.
+    """
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceeded(
+            f"The request exceeded its {settings.REQUEST_BUDGET_SECONDS:g}s "
+            "time budget. Try a narrower question."
+        )
+    return await with_timeout(handler(request), settings.LLM_TIMEOUT)
@@ -1,52 +1,83 @@
-from datetime import datetime
-
 from langchain.agents import create_agent
 from langchain.agents.middleware import ModelRequest, dynamic_prompt
-from langgraph.checkpoint.memory import MemorySaver
 
-from app.agent.news_tools import search_naver_news, scrape_news_article
-from app.core.dependencies import get_chat_model
+from app.agent.middleware import deadline_model_call
+from app.agent.news_tools import (
+    scrape_news_article,
+    scrape_news_articles,
+    search_naver_news,
+)
+from app.core.callbacks import (
+    MetricsCallback,
+    TokenUsageCallback,
+    TracingCallback,
+)
+from app.core.dependencies import get_chat_model, get_checkpointer
+from app.core.prompts import build_prompt, date_context
+
+NEWS_AGENT_INSTRUCTIONS = (
+    "You are an Economic News Analysis Agent. Today's date is given at the end of this "
+    "prompt.\n"
+    "\n"
+    "Goal: Answer the user's economic question by finding and analyzing real news "
+    "articles.\n"
+    "\n"
+    "Workflow:\n"
+    "1. **Search**: Use `search_naver_news` to find relevant articles. \n"
+    "   - Keywords: Extract key economic terms from the user query.\n"
+    "   - **Retry on Empty**: If the search returns 0 results, you MUST try again with "
+    "a different, broader, or alternative query. Try up to 2-3 retries if needed.\n"
+    "   - **Retry on UNRELATED NEWS**: If the search returns articles that are not "
+    "related to the user query, you MUST try again with a different, broader, or "
+    "alternative query. Try up to 2-3 retries if needed.\n"
+    "2. **Select & Scrape**: Look at the titles and dates. Select 2~3 most relevant "
+    "and recent articles.\n"
+    "   - Use `scrape_news_articles` with all selected links in ONE call to get their "
+    "full content. Use `scrape_news_article` only for a single article.\n"
+    "   - Always pass the user's question as `query`, so the most relevant passages "
+    "(numbers, quotes) are returned.\n"
+    "   - **Retry on Error**: If scraping fails (an error message, or an article "
+    "returned with an error), you MUST try searching again (refresh results) or select "
+    "a different article. Do NOT stop at the error.\n"
+    "   - Do NOT scrape everything. Be selective.\n"
+    "   - Before extracting/scraping, you MUST evaluate if the search results match "
+    'the User Intention. If mismatch: "Do NOT scrape. Retry with better keywords or '
+    'stop if retries fail."\n'
+    "3. **Analyze & Answer**:\n"
+    "   - Synthesize the information from the scraped articles.\n"
+    "   - **MANDATORY**: When answering, you MUST cite the source.\n"
+    '   - **Format**: Append a "[References]" section at the end of your response '
+    "listing the articles used with their Titles and Links.\n"
+    "     Example:\n"
+    "     [References]\n"
+    "     1. Article Title (https://link.com)\n"
+    "     2. Another Title (https://link.com)\n"
+    '   - If user asks about specific numbers (e.g. "Current Exchange Rate"), rely on '
+    "the LATEST news.\n"
+    "   - If absolutely no news is found after 3 retries, then admit it.\n"
+    "\n"
+    "User Query Context:\n"
+    "The user is asking about Korean/Global economy.\n"
+)
 
 
 @dynamic_prompt
 def news_system_prompt(request: ModelRequest) -> str:
-    today = datetime.now().strftime("%Y%m%d")
-    return f"""You are an Economic News Analysis Agent. today is {today}.
-
-Goal: Answer the user's economic question by finding and analyzing real news articles.
-
-Workflow:
-1. **Search**: Use `search_naver_news` to find relevant articles. 
-   - Keywords: Extract key economic terms from the user query.
-   - **Retry on Empty**: If the search returns 0 results, you MUST try again with a different, broader, or alternative query. Try up to 2-3 retries if needed.
-   - **Retry on UNRELATED NEWS**: If the search returns articles that are not related to the user query, you MUST try again with a different, broader, or alternative query. Try up to 2-3 retries if needed.
-2. **Select & Scrape**: Look at the titles and dates. Select 2~3 most relevant and recent articles.
-   - Use `scrape_news_article` to get the full content of these selected articles.
-   - **Retry on Error**: If `scrape_news_article` fails (returns an error message), you MUST try searching again (refresh results) or select a different article. Do NOT stop at the error.
-   - Do NOT scrape everything. Be selective.
-   - Before extracting/scraping, you MUST evaluate if the search results match the User Intention. If mismatch: "Do NOT use scrape_news_article. Retry with better keywords or stop if retries fail."
-3. **Analyze & Answer**:
-   - Synthesize the information from the scraped articles.
-   - **MANDATORY**: When answering, you MUST cite the source.
-   - **Format**: Append a "[References]" section at the end of your response listing the articles used with their Titles and Links.
-     Example:
-     [References]
-     1. Article Title (https://link.com)
-     2. Another Title (https://link.com)
-   - If user asks about specific numbers (e.g. "Current Exchange Rate"), rely on the LATEST news.
-   - If absolutely no news is found after 3 retries, then admit it.
-
-User Query Context:
-The user is asking about Korean/Global economy.
-"""
+    return build_prompt(NEWS_AGENT_INSTRUCTIONS, date_context())
 
 
 llm = get_chat_model()
-tools = [search_naver_news, scrape_news_article]
+tools = [search_naver_news, scrape_news_articles, scrape_news_article]
 
 news_agent = create_agent(
     model=llm,
     tools=tools,
-    middleware=[news_system_prompt],
-    checkpointer=MemorySaver(),
+    middleware=[news_system_prompt, deadline_model_call],
+    checkpointer=get_checkpointer("news_agent"),
+).with_config(
+    callbacks=[
+        TokenUsageCallback("news_agent"),
+        MetricsCallback("news_agent"),
+        TracingCallback("news_agent"),
+    ]
 )
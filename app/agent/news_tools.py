@@ -1,5 +1,5 @@
-from app.schema.news import News, NewsItem
-from typing import List
+from app.schema.news import News, NewsItem, ScrapedArticle
+from typing import List, Optional
 from langchain_core.tools import tool
 from app.services.news_service import news_service
 
@@ -9,6 +9,8 @@ async def search_naver_news(query: str, display: int = 5) -> List[News]:
     """
     Search for Naver News articles related to the given query.
     Returns a list of articles with titles, dates, and links.
+    Copies of the same story from several outlets are merged into one result;
+    'cluster_size' tells how many outlets carried it.
     """
     try:
         return await news_service.search_news(query, display)
@@ -17,12 +19,29 @@ async def search_naver_news(query: str, display: int = 5) -> List[News]:
 
 
 @tool
-async def scrape_news_article(url: str) -> NewsItem:
+async def scrape_news_article(url: str, query: Optional[str] = None) -> NewsItem:
     """
     Scrape the full content of a news article from the given URL.
     Use this to read the details of a specific news item found by 'search_naver_news'.
+    Pass the user's question as 'query' to get the passages most relevant to it.
     """
     try:
-        return await news_service.scrape_article(url)
+        return await news_service.scrape_article(url, query)
     except Exception as e:
         return f"Error fetching article {url}: {str(e)}"
+
+
+@tool
+async def scrape_news_articles(
+    urls: List[str], query: Optional[str] = None
+) -> List[ScrapedArticle]:
+    """
+    Scrape the full content of several news articles at once (in parallel).
+    Prefer this over calling 'scrape_news_article' repeatedly.
+    Pass the user's question as 'query' to get the passages most relevant to it.
+    Articles that fail or time out are returned with an error instead of content.
+    """
+    try:
+        return await news_service.scrape_articles(urls, query)
+    except Exception as e:
+        return f"Error fetching articles: {str(e)}"
@@ -0,0 +1,116 @@
+import asyncio
+import functools
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
+
+from app.core.logger import get_logger
+from app.core.metrics import metrics
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+admission_in_flight = metrics.gauge(
+    "admission_in_flight", "Admitted calls currently running.", ["tool"]
+)
+admission_queue_depth = metrics.gauge(
+    "admission_queue_depth", "Calls waiting for a free slot.", ["tool"]
+)
+admission_wait = metrics.histogram(
+    "admission_wait_seconds",
+    "Time calls waited in the admission queue.",
+    ["tool"],
+    buckets=(0.005, 0.05, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+admission_rejected = metrics.counter(
+    "admission_rejected_total",
+    "Calls rejected because the queue was full or the wait timed out.",
+    ["tool", "reason"],
+)
+
+
+class ServerBusyError(Exception):
+    """The call was not admitted; the client should retry later."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    Concurrency limit with a bounded wait queue for one tool.
+    Calls beyond `max_concurrency` wait up to `queue_timeout` seconds for a slot;
+    when `max_queue` calls are already waiting, new ones are rejected at once.
+    """
+
+    def __init__(
+        self, name: str, max_concurrency: int, max_queue: int, queue_timeout: float
+    ):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self.running = 0
+        self.waiting = 0
+
+    def _reject(self, reason: str, message: str) -> ServerBusyError:
+        admission_rejected.labels(self.name, reason).inc()
+        logger.warning(f"🚦 {self.name} busy ({reason}): {message}")
+        return ServerBusyError(
+            f"Server busy: {message}. Retry in a few seconds.",
+            retry_after=self.queue_timeout,
+        )
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        if self._slots.locked():
+            if self.waiting >= self.max_queue:
+                raise self._reject(
+                    "queue_full",
+                    f"{self.running} {self.name} calls running, {self.waiting} waiting",
+                )
+
+            self.waiting += 1
+            admission_queue_depth.labels(self.name).inc()
+            started = time.perf_counter()
+            try:
+                await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                raise self._reject(
+                    "timeout", f"no {self.name} slot within {self.queue_timeout:g}s"
+                ) from None
+            finally:
+                self.waiting -= 1
+                admission_queue_depth.labels(self.name).dec()
+                admission_wait.labels(self.name).observe(time.perf_counter() - started)
+        else:
+            await self._slots.acquire()
+            admission_wait.labels(self.name).observe(0.0)
+
+        self.running += 1
+        admission_in_flight.labels(self.name).inc()
+        try:
+            yield
+        finally:
+            self.running -= 1
+            admission_in_flight.labels(self.name).dec()
+            self._slots.release()
+
+
+def admitted(
+    controller: AdmissionController,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Run an async function under `controller` (keeps its signature for MCP)."""
+
+    def decorator(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs) -> T:
+            async with controller.admit():
+                return await fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
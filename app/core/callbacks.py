@@ -1,10 +1,28 @@
 import logging
-from typing import Any, Dict, List, Optional, Union
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from uuid import UUID
 
 from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage
 from langchain_core.outputs import LLMResult
 
+from app.core.metrics import (
+    graph_run_duration,
+    graph_runs_in_flight,
+    llm_duration,
+    metric_line,
+    metrics,
+    node_duration,
+    node_errors,
+    tool_duration,
+    tool_errors,
+    upstream_duration,
+    upstream_requests,
+)
+from app.core.tracing import Span, tracer
+
 
 class AgentLoggingCallback(BaseCallbackHandler):
     """
@@ -68,3 +86,464 @@ class AgentLoggingCallback(BaseCallbackHandler):
 
     def on_llm_new_token(self, token: str, **kwargs: Any) -> Any:
         pass
+
+
+class TokenUsageTracker:
+    """
+    Accumulates LLM token usage per (graph, node), including prompt cache hits.
+    """
+
+    def __init__(self):
+        self._usage: Dict[tuple, Dict[str, int]] = defaultdict(
+            lambda: {
+                "calls": 0,
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "cached_tokens": 0,
+            }
+        )
+
+    def record(self, scope: str, node: str, usage: Dict[str, Any]) -> None:
+        entry = self._usage[(scope, node)]
+        entry["calls"] += 1
+        entry["input_tokens"] += usage.get("input_tokens", 0)
+        entry["output_tokens"] += usage.get("output_tokens", 0)
+        details = usage.get("input_token_details") or {}
+        entry["cached_tokens"] += details.get("cache_read", 0) or 0
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        result: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (scope, node), entry in self._usage.items():
+            input_tokens = entry["input_tokens"]
+            result.setdefault(scope, {})[node] = {
+                **entry,
+                "cache_hit_ratio": round(entry["cached_tokens"] / input_tokens, 4)
+                if input_tokens
+                else 0.0,
+            }
+        return result
+
+
+token_usage = TokenUsageTracker()
+
+
+def _token_usage_metrics() -> Iterator[str]:
+    name = "llm_tokens_total"
+    yield f"# HELP {metrics.prefix}{name} LLM tokens by graph, node and type."
+    yield f"# TYPE {metrics.prefix}{name} counter"
+    for scope, nodes in token_usage.snapshot().items():
+        for node, entry in nodes.items():
+            for kind in ("input", "output", "cached"):
+                yield metric_line(
+                    name,
+                    ("graph", "node", "type"),
+                    (scope, node, kind),
+                    entry[f"{kind}_tokens"],
+                )
+
+
+metrics.register_collector(_token_usage_metrics)
+
+
+class TokenUsageCallback(BaseCallbackHandler):
+    """
+    Record prompt, completion and cached tokens of every chat model call,
+    attributed to the LangGraph node that made it.
+    """
+
+    run_inline = True
+
+    def __init__(self, scope: str, tracker: TokenUsageTracker = token_usage):
+        self.scope = scope
+        self.tracker = tracker
+        self._nodes: Dict[UUID, str] = {}
+
+    def on_chat_model_start(
+        self,
+        serialized: Dict[str, Any],
+        messages: List[List[BaseMessage]],
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        self._nodes[run_id] = (metadata or {}).get("langgraph_node", "unknown")
+
+    def on_llm_end(
+        self,
+        response: LLMResult,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> Any:
+        node = self._nodes.pop(run_id, "unknown")
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                usage = getattr(message, "usage_metadata", None)
+                if usage:
+                    self.tracker.record(self.scope, node, usage)
+
+    def on_llm_error(
+        self,
+        error: BaseException,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> Any:
+        self._nodes.pop(run_id, None)
+
+
+class MetricsCallback(BaseCallbackHandler):
+    """
+    Feed app.core.metrics: graph runs in flight and their duration, per-node,
+    per-tool and per-LLM-call latency, and OpenAI call outcomes.
+    """
+
+    run_inline = True
+
+    def __init__(self, scope: str):
+        self.scope = scope
+        # run_id -> (kind, label, started)
+        self._runs: Dict[UUID, Tuple[str, str, float]] = {}
+
+    def on_chain_start(
+        self,
+        serialized: Dict[str, Any],
+        inputs: Dict[str, Any],
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        node = (metadata or {}).get("langgraph_node")
+        if parent_run_id is None:
+            graph_runs_in_flight.labels(self.scope).inc()
+            self._runs[run_id] = ("graph", self.scope, time.perf_counter())
+        elif node and kwargs.get("name") == node:
+            # The node itself, not a runnable nested inside it
+            self._runs[run_id] = ("node", node, time.perf_counter())
+
+    def _end_chain(self, run_id: UUID, failed: bool) -> None:
+        run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+        kind, label, started = run
+        elapsed = time.perf_counter() - started
+        if kind == "graph":
+            graph_runs_in_flight.labels(self.scope).dec()
+            graph_run_duration.labels(self.scope).observe(elapsed)
+        else:
+            node_duration.labels(self.scope, label).observe(elapsed)
+            if failed:
+                node_errors.labels(self.scope, label).inc()
+
+    def on_chain_end(
+        self,
+        outputs: Dict[str, Any],
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> Any:
+        self._end_chain(run_id, failed=False)
+
+    def on_chain_error(
+        self,
+        error: BaseException,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> Any:
+        self._end_chain(run_id, failed=True)
+
+    def on_tool_start(
+        self,
+        serialized: Dict[str, Any],
+        input_str: str,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        tool_name = serialized.get("name", "tool")
+        self._runs[run_id] = ("tool", tool_name, time.perf_counter())
+
+    def _end_tool(self, run_id: UUID, failed: bool) -> None:
+        run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+        _, tool_name, started = run
+        tool_duration.labels(tool_name).observe(time.perf_counter() - started)
+        if failed:
+            tool_errors.labels(tool_name).inc()
+
+    def on_tool_end(
+        self,
+        output: Any,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> Any:
+        self._end_tool(run_id, failed=False)
+
+    def on_tool_error(
+        self,
+        error: BaseException,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> Any:
+        self._end_tool(run_id, failed=True)
+
+    def on_chat_model_start(
+        self,
+        serialized: Dict[str, Any],
+        messages: List[List[BaseMessage]],
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        node = (metadata or {}).get("langgraph_node", "unknown")
+        self._runs[run_id] = ("llm", node, time.perf_counter())
+
+    def _end_llm(self, run_id: UUID, failed: bool) -> None:
+        run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+        _, node, started = run
+        elapsed = time.perf_counter() - started
+        llm_duration.labels(self.scope, node).observe(elapsed)
+        upstream_duration.labels("openai").observe(elapsed)
+        upstream_requests.labels("openai", "error" if failed else "ok").inc()
+
+    def on_llm_end(
+        self,
+        response: LLMResult,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> Any:
+        self._end_llm(run_id, failed=False)
+
+    def on_llm_error(
+        self,
+        error: BaseException,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> Any:
+        self._end_llm(run_id, failed=True)
+
+
+class TracingCallback(BaseCallbackHandler):
+    """
+    Open tracing spans for graph runs, graph nodes, tools and LLM calls.
+    Spans are linked through LangChain's run tree; the root run attaches to the
+    current span (e.g. the MCP request) when there is one. Node spans are made
+    current so upstream HTTP spans opened inside a node nest under it.
+    """
+
+    run_inline = True
+
+    def __init__(self, scope: str):
+        self.scope = scope
+        self._spans: Dict[UUID, Span] = {}
+        # Every chain run's parent, to find the nearest ancestor with a span
+        self._parents: Dict[UUID, Optional[UUID]] = {}
+        self._previous: Dict[UUID, Optional[Span]] = {}
+
+    def _parent_span(self, parent_run_id: Optional[UUID]) -> Optional[Span]:
+        while parent_run_id is not None:
+            span = self._spans.get(parent_run_id)
+            if span is not None:
+                return span
+            parent_run_id = self._parents.get(parent_run_id)
+        return tracer.current_span()
+
+    def _start(
+        self,
+        run_id: UUID,
+        parent_run_id: Optional[UUID],
+        name: str,
+        activate: bool = False,
+        **attributes: Any,
+    ) -> None:
+        span = tracer.start_span(
+            name, parent=self._parent_span(parent_run_id), **attributes
+        )
+        if span is None:
+            return
+        self._spans[run_id] = span
+        if activate:
+            self._previous[run_id] = tracer.activate(span)
+
+    def _end(self, run_id: UUID, error: Optional[BaseException] = None) -> None:
+        self._parents.pop(run_id, None)
+        span = self._spans.pop(run_id, None)
+        if span is None:
+            return
+        if run_id in self._previous:
+            tracer.activate(self._previous.pop(run_id))
+        tracer.end_span(span, error)
+
+    def on_chain_start(
+        self,
+        serialized: Dict[str, Any],
+        inputs: Dict[str, Any],
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        if not tracer.enabled:
+            return
+        metadata = metadata or {}
+        node = metadata.get("langgraph_node")
+        self._parents[run_id] = parent_run_id
+
+        if parent_run_id is None:
+            self._start(
+                run_id,
+                None,
+                f"graph.{self.scope}",
+                activate=True,
+                thread_id=metadata.get("thread_id"),
+            )
+        elif node and kwargs.get("name") == node:
+            attributes: Dict[str, Any] = {}
+            if isinstance(inputs, dict):
+                retry = (inputs.get("retry_counts") or {}).get(node)
+                if retry:
+                    attributes["retry"] = retry
+                statistic = inputs.get("selected_statistic")
+                if statistic is not None:
+                    attributes["stat_code"] = getattr(statistic, "stat_code", None)
+            self._start(
+                run_id, parent_run_id, f"node.{node}", activate=True, **attributes
+            )
+
+    def on_chain_end(
+        self,
+        outputs: Dict[str, Any],
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> Any:
+        self._end(run_id)
+
+    def on_chain_error(
+        self,
+        error: BaseException,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> Any:
+        self._end(run_id, error)
+
+    def on_tool_start(
+        self,
+        serialized: Dict[str, Any],
+        input_str: str,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        if not tracer.enabled:
+            return
+        tool_name = serialized.get("name", "tool")
+        self._start(
+            run_id,
+            parent_run_id,
+            f"tool.{tool_name}",
+            activate=True,
+            input=input_str[:200],
+        )
+
+    def on_tool_end(
+        self,
+        output: Any,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> Any:
+        self._end(run_id)
+
+    def on_tool_error(
+        self,
+        error: BaseException,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> Any:
+        self._end(run_id, error)
+
+    def on_chat_model_start(
+        self,
+        serialized: Dict[str, Any],
+        messages: List[List[BaseMessage]],
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        if not tracer.enabled:
+            return
+        model = (metadata or {}).get("ls_model_name")
+        self._start(run_id, parent_run_id, "llm", model=model)
+
+    def on_llm_end(
+        self,
+        response: LLMResult,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> Any:
+        span = self._spans.get(run_id)
+        if span is not None:
+            for generations in response.generations:
+                for generation in generations:
+                    message = getattr(generation, "message", None)
+                    usage = getattr(message, "usage_metadata", None) or {}
+                    if usage:
+                        span.set("input_tokens", usage.get("input_tokens"))
+                        span.set("output_tokens", usage.get("output_tokens"))
+        self._end(run_id)
+
+    def on_llm_error(
+        self,
+        error: BaseException,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> Any:
+        self._end(run_id, error)
@@ -0,0 +1,315 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Sequence
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.memory import InMemorySaver
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class BoundedMemorySaver(InMemorySaver):
+    """
+    In-memory checkpointer with LRU eviction by thread count, total size and TTL.
+    Sizes are measured on the serialized checkpoint blobs and writes.
+    """
+
+    def __init__(
+        self,
+        max_threads: int = 1000,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl_seconds: float = 3600,
+        name: str = "checkpointer",
+    ):
+        super().__init__()
+        self.max_threads = max_threads
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.name = name
+
+        self._lock = threading.RLock()
+        # thread_id -> last access time (monotonic), oldest first
+        self._last_access: "OrderedDict[str, float]" = OrderedDict()
+        self._thread_bytes: Dict[str, int] = {}
+        self._total_bytes = 0
+        self._evictions = {"lru": 0, "ttl": 0, "size": 0, "manual": 0}
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id = config["configurable"]["thread_id"]
+        with self._lock:
+            if self._is_expired(thread_id, time.monotonic()):
+                self._evict(thread_id, "ttl")
+                return None
+            self._touch(thread_id)
+        return super().get_tuple(config)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        result = super().put(config, checkpoint, metadata, new_versions)
+
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        size = 0
+        for k, v in new_versions.items():
+            blob = self.blobs.get((thread_id, checkpoint_ns, k, v))
+            if blob:
+                size += len(blob[1])
+        saved = self.storage[thread_id][checkpoint_ns].get(checkpoint["id"])
+        if saved:
+            size += len(saved[0][1]) + len(saved[1][1])
+
+        with self._lock:
+            self._account(thread_id, size)
+            self._enforce_limits(keep=thread_id)
+        return result
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        outer_key = (
+            thread_id,
+            config["configurable"].get("checkpoint_ns", ""),
+            config["configurable"]["checkpoint_id"],
+        )
+        before = self._writes_size(outer_key)
+        super().put_writes(config, writes, task_id, task_path)
+        after = self._writes_size(outer_key)
+
+        with self._lock:
+            self._account(thread_id, after - before)
+            self._enforce_limits(keep=thread_id)
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            if thread_id in self._last_access:
+                self._evictions["manual"] += 1
+            self._forget(thread_id)
+            super().delete_thread(thread_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Memory usage and eviction counters."""
+        with self._lock:
+            return {
+                "name": self.name,
+                "threads": len(self._last_access),
+                "bytes": self._total_bytes,
+                "max_threads": self.max_threads,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "evictions": dict(self._evictions),
+            }
+
+    def _writes_size(self, outer_key: tuple) -> int:
+        stored = self.writes.get(outer_key)
+        if not stored:
+            return 0
+        return sum(len(w[2][1]) for w in stored.values())
+
+    def _touch(self, thread_id: str) -> None:
+        if thread_id in self._last_access:
+            self._last_access.move_to_end(thread_id)
+            self._last_access[thread_id] = time.monotonic()
+
+    def _account(self, thread_id: str, size: int) -> None:
+        self._last_access[thread_id] = time.monotonic()
+        self._last_access.move_to_end(thread_id)
+        self._thread_bytes[thread_id] = self._thread_bytes.get(thread_id, 0) + size
+        self._total_bytes += size
+
+    def _is_expired(self, thread_id: str, now: float) -> bool:
+        last = self._last_access.get(thread_id)
+        return (
+            last is not None and self.ttl_seconds > 0 and now - last > self.ttl_seconds
+        )
+
+    def _enforce_limits(self, keep: str) -> None:
+        now = time.monotonic()
+
+        # TTL: the oldest entries are at the front
+        while self._last_access:
+            oldest = next(iter(self._last_access))
+            if oldest == keep or not self._is_expired(oldest, now):
+                break
+            self._evict(oldest, "ttl")
+
+        while len(self._last_access) > self.max_threads:
+            oldest = next(iter(self._last_access))
+            if oldest == keep:
+                break
+            self._evict(oldest, "lru")
+
+        while self._total_bytes > self.max_bytes and len(self._last_access) > 1:
+            oldest = next(iter(self._last_access))
+            if oldest == keep:
+                break
+            self._evict(oldest, "size")
+
+    def _evict(self, thread_id: str, reason: str) -> None:
+        self._evictions[reason] += 1
+        self._forget(thread_id)
+        super().delete_thread(thread_id)
+        logger.debug(f"Evicted thread {thread_id} from {self.name} ({reason})")
+
+    def _forget(self, thread_id: str) -> None:
+        self._last_access.pop(thread_id, None)
+        self._total_bytes -= self._thread_bytes.pop(thread_id, 0)
+
+
+def _sqlite_unavailable() -> ImportError:
+    return ImportError(
+        "SQLite checkpointing requires 'langgraph-checkpoint-sqlite'. "
+        "Install it with: uv sync --extra sqlite"
+    )
+
+
+class LazySqliteSaver(BaseCheckpointSaver):
+    """
+    Durable checkpointer backed by SQLite.
+    AsyncSqliteSaver needs a running event loop, so it is opened on first use.
+    Sync calls (`invoke`, `get_state`) go through a separate SqliteSaver
+    connection to the same file, also opened on first use.
+    Requires the optional 'langgraph-checkpoint-sqlite' package.
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self._saver: Optional[BaseCheckpointSaver] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._sync_saver: Optional[BaseCheckpointSaver] = None
+        self._sync_lock = threading.Lock()
+
+    async def _get_saver(self) -> BaseCheckpointSaver:
+        if self._saver is not None:
+            return self._saver
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._saver is None:
+                try:
+                    import aiosqlite
+                    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+                except ImportError as e:
+                    raise _sqlite_unavailable() from e
+
+                saver = AsyncSqliteSaver(aiosqlite.connect(self.path))
+                await saver.setup()
+                logger.info(f"Opened SQLite checkpointer at {self.path}")
+                self._saver = saver
+        return self._saver
+
+    def _get_sync_saver(self) -> BaseCheckpointSaver:
+        with self._sync_lock:
+            if self._sync_saver is None:
+                try:
+                    from langgraph.checkpoint.sqlite import SqliteSaver
+                except ImportError as e:
+                    raise _sqlite_unavailable() from e
+
+                saver = SqliteSaver(sqlite3.connect(self.path, check_same_thread=False))
+                saver.setup()
+                self._sync_saver = saver
+        return self._sync_saver
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return self._get_sync_saver().get_tuple(config)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        yield from self._get_sync_saver().list(
+            config, filter=filter, before=before, limit=limit
+        )
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return self._get_sync_saver().put(config, checkpoint, metadata, new_versions)
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        self._get_sync_saver().put_writes(config, writes, task_id, task_path)
+
+    def delete_thread(self, thread_id: str) -> None:
+        self._get_sync_saver().delete_thread(thread_id)
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        saver = await self._get_saver()
+        return await saver.aget_tuple(config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        saver = await self._get_saver()
+        async for item in saver.alist(
+            config, filter=filter, before=before, limit=limit
+        ):
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        saver = await self._get_saver()
+        return await saver.aput(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        saver = await self._get_saver()
+        await saver.aput_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        saver = await self._get_saver()
+        await saver.adelete_thread(thread_id)
+
+    get_next_version = InMemorySaver.get_next_version
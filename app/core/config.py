@@ -16,6 +16,95 @@ class Settings(BaseSettings):
     EMBEDDING_MODEL: str = "text-embedding-3-small"
 
     DATA_DIR: str | None = None
+    # Statistics index: "mmap" (snapshot shared by all workers) or "memory"
+    VECTOR_INDEX_BACKEND: str = "mmap"
+
+    # "eager": build everything before serving; "lazy": serve /health and /ready
+    # immediately and build agents, MCP app and index in a background warmup
+    STARTUP_MODE: str = "eager"
+    # Download the NLTK sentence model at warmup when it is not installed
+    NLTK_DOWNLOAD: bool = True
+
+    # News HTTP clients (shared, keep-alive)
+    NEWS_HTTP2: bool = False
+    NEWS_API_TIMEOUT: float = 5.0
+    NEWS_ARTICLE_TIMEOUT: float = 2.0
+    NEWS_MAX_CONNECTIONS: int = 100
+    NEWS_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    NEWS_KEEPALIVE_EXPIRY: float = 30.0
+    # Characters of article text returned to the agent
+    NEWS_ARTICLE_TEXT_BUDGET: int = 1000
+    # Search results: near-duplicate clustering and a short per-query cache
+    NEWS_SEARCH_DEDUP: bool = True
+    NEWS_SEARCH_SIMHASH_DISTANCE: int = 12
+    NEWS_SEARCH_CACHE_TTL_SECONDS: int = 120
+    NEWS_SEARCH_CACHE_MAX_ENTRIES: int = 256
+    # Stream article pages and stop at the byte cap or after the main content
+    NEWS_ARTICLE_STREAMING: bool = True
+    NEWS_ARTICLE_MAX_BYTES: int = 512 * 1024
+
+    # Batch scraping: concurrency caps and a deadline for the whole batch
+    NEWS_SCRAPE_MAX_CONCURRENCY: int = 8
+    NEWS_SCRAPE_MAX_PER_DOMAIN: int = 2
+    NEWS_SCRAPE_BATCH_TIMEOUT: float = 6.0
+    NEWS_SCRAPE_MAX_URLS: int = 10
+    # Article parsing: "thread" or "process" (worker pool, avoids GIL contention)
+    NEWS_PARSER_BACKEND: str = "thread"
+    NEWS_PARSER_WORKERS: int | None = None
+
+    # Parsed article cache (SQLite), revalidated with conditional GETs when stale
+    NEWS_ARTICLE_CACHE_ENABLED: bool = True
+    NEWS_ARTICLE_CACHE_PATH: str | None = None
+    NEWS_ARTICLE_CACHE_FRESH_SECONDS: int = 600
+    NEWS_ARTICLE_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+    NEWS_ARTICLE_CACHE_MAX_ENTRIES: int = 5000
+
+    # Logging: "text" or "json" (one object per line, with `extra=` fields).
+    # Records are written by a background thread; known API keys are masked
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "text"
+
+    # Tracing: comma-separated exporters ("jsonl", "slow_log"); empty = off
+    TRACING_EXPORTERS: str = ""
+    TRACING_JSONL_PATH: str | None = None
+    TRACING_SLOW_SECONDS: float = 10.0
+
+    # Time budget of one agent request (MCP call or AG-UI run). HTTP and LLM
+    # timeouts are shortened to what is left; below the reserve the ECOS
+    # graph stops retrying and answers with the data it has
+    REQUEST_BUDGET_SECONDS: float = 90.0
+    DEADLINE_RESERVE_SECONDS: float = 20.0
+    LLM_TIMEOUT: float = 60.0
+    ECOS_TIMEOUT: float = 10.0
+
+    # MCP admission control: concurrent agent calls per tool, then a bounded
+    # wait queue; calls beyond it (or waiting too long) get a "busy" error
+    MCP_ECOS_MAX_CONCURRENCY: int = 8
+    MCP_NEWS_MAX_CONCURRENCY: int = 8
+    # get_ecos_series only calls ECOS (no LLM), so it can run many more at once
+    MCP_SERIES_MAX_CONCURRENCY: int = 32
+    MCP_QUEUE_SIZE: int = 16
+    MCP_QUEUE_TIMEOUT: float = 10.0
+
+    # Statistics looked up in parallel for a single ECOS query
+    ECOS_MAX_STATISTICS_PER_QUERY: int = 4
+    # Items shown to the LLM when selecting parameters (widened on no match)
+    ECOS_ITEM_TOP_K: int = 30
+    # Periods returned by get_ecos_series when no start_time is given
+    ECOS_SERIES_DEFAULT_PERIODS: int = 12
+    # Bulk export: series fetched at once per request, and series per request
+    EXPORT_CONCURRENCY: int = 8
+    EXPORT_MAX_SERIES: int = 500
+
+    # Checkpointer: "memory" (bounded, evicting) or "sqlite" (durable)
+    CHECKPOINTER_BACKEND: str = "memory"
+    CHECKPOINTER_MAX_THREADS: int = 1000
+    CHECKPOINTER_MAX_BYTES: int = 256 * 1024 * 1024
+    CHECKPOINTER_TTL_SECONDS: int = 3600
+    # Folder of the SQLite files (one per graph); default: DATA_DIR
+    CHECKPOINTER_SQLITE_DIR: str | None = None
+    # Keep checkpoints of calls made without a thread_id
+    CHECKPOINT_ONE_SHOT_CALLS: bool = False
 
     model_config = SettingsConfigDict(
         env_file=".env",
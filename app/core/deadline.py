@@ -0,0 +1,134 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Iterator, Optional, TypeVar
+
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Key in config["configurable"]: absolute deadline of the request (epoch seconds)
+DEADLINE_KEY = "deadline"
+
+# Smallest timeout handed out, so an almost spent budget fails fast but cleanly
+MIN_TIMEOUT = 1.0
+
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+class DeadlineExceeded(Exception):
+    """The request ran out of its time budget."""
+
+
+def new_deadline(budget: Optional[float] = None) -> float:
+    return time.time() + (budget or settings.REQUEST_BUDGET_SECONDS)
+
+
+@contextmanager
+def deadline_scope(deadline: float) -> Iterator[float]:
+    """Make `deadline` current for everything awaited inside the block."""
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def current_deadline() -> Optional[float]:
+    """Deadline of the current request: context first, then the graph config."""
+    deadline = _deadline.get()
+    if deadline is not None:
+        return deadline
+
+    from langgraph.config import get_config
+
+    try:
+        config = get_config()
+    except RuntimeError:
+        return None
+    return (config.get("configurable") or {}).get(DEADLINE_KEY)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left in the current request's budget, or None without one."""
+    deadline = current_deadline()
+    if deadline is None:
+        return None
+    return deadline - time.time()
+
+
+def timeout_for(default: float) -> float:
+    """`default`, shortened to what is left of the budget."""
+    left = remaining()
+    if left is None:
+        return default
+    return max(min(default, left), MIN_TIMEOUT)
+
+
+def budget_low() -> bool:
+    """True once only the reserve for the final answer is left."""
+    left = remaining()
+    return left is not None and left < settings.DEADLINE_RESERVE_SECONDS
+
+
+async def with_timeout(awaitable: Awaitable[T], default: float) -> T:
+    """Await with a timeout derived from the remaining budget."""
+    return await asyncio.wait_for(awaitable, timeout_for(default))
+
+
+class DeadlineMiddleware:
+    """
+    Pure ASGI middleware: gives each request to `paths` (the AG-UI endpoints,
+    whose graph config is built by the adapter) a fresh deadline, and stops it
+    there. A run cut off before it responded gets a 504; a stream that already
+    started is closed.
+    """
+
+    def __init__(
+        self, app, paths: tuple = ("/ecos", "/news"), budget: Optional[float] = None
+    ):
+        self.app = app
+        self.paths = paths
+        self.budget = budget
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.paths):
+            await self.app(scope, receive, send)
+            return
+
+        started = False
+
+        async def tracking_send(message) -> None:
+            nonlocal started
+            started = started or message["type"] == "http.response.start"
+            await send(message)
+
+        deadline = new_deadline(self.budget)
+        loop = asyncio.get_running_loop()
+        hard_stop = asyncio.timeout_at(loop.time() + deadline - time.time())
+        with deadline_scope(deadline):
+            try:
+                async with hard_stop:
+                    await self.app(scope, receive, tracking_send)
+            except TimeoutError:
+                if not hard_stop.expired():
+                    raise
+                logger.warning("⏱️ %s cut off at its deadline", scope["path"])
+                if not started:
+                    await send(
+                        {
+                            "type": "http.response.start",
+                            "status": 504,
+                            "headers": [(b"content-type", b"text/plain")],
+                        }
+                    )
+                    await send(
+                        {
+                            "type": "http.response.body",
+                            "body": b"The request exceeded its time budget.",
+                        }
+                    )
@@ -2,14 +2,18 @@ from langchain_openai.chat_models.base import ChatOpenAI
 import csv
 from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Union
 
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 from langchain_core.vectorstores import InMemoryVectorStore
 from langchain_openai import OpenAIEmbeddings
+from langgraph.checkpoint.base import BaseCheckpointSaver
 
+from app.core.checkpointer import BoundedMemorySaver, LazySqliteSaver
 from app.core.config import settings
+from app.core.tracing import Tracer, configure_tracing
+from app.core.vector_index import MmapVectorIndex
 from app.schema.statistics import Statistic
 
 
@@ -28,6 +32,30 @@ def get_index_path() -> Path:
     return get_data_folder() / "index.json"
 
 
+def get_checkpoint_path(name: str) -> Path:
+    if settings.CHECKPOINTER_SQLITE_DIR:
+        folder = Path(settings.CHECKPOINTER_SQLITE_DIR)
+    else:
+        folder = get_data_folder()
+    return folder / f"checkpoints_{name}.sqlite"
+
+
+def get_index_snapshot_path() -> Path:
+    return get_data_folder() / "index_snapshot"
+
+
+def get_traces_path() -> Path:
+    if settings.TRACING_JSONL_PATH:
+        return Path(settings.TRACING_JSONL_PATH)
+    return get_data_folder() / "traces.jsonl"
+
+
+def get_article_cache_path() -> Path:
+    if settings.NEWS_ARTICLE_CACHE_PATH:
+        return Path(settings.NEWS_ARTICLE_CACHE_PATH)
+    return get_data_folder() / "article_cache.sqlite"
+
+
 @lru_cache
 def get_embeddings() -> Embeddings:
     """Provides the embedding model instance."""
@@ -48,8 +76,7 @@ def get_stats_data() -> List[Statistic]:
         return [Statistic(**row) for row in reader]
 
 
-@lru_cache
-def get_vector_store() -> InMemoryVectorStore:
+def load_vector_store() -> InMemoryVectorStore:
     """Loads or builds the In-Memory vector store."""
     index_path = get_index_path()
     embeddings_model = get_embeddings()
@@ -75,10 +102,53 @@ def get_vector_store() -> InMemoryVectorStore:
     return store
 
 
+@lru_cache
+def get_vector_store() -> Union[InMemoryVectorStore, MmapVectorIndex]:
+    """
+    Provides the statistics vector index.
+    'mmap' (default) maps a shared snapshot built once from index.json, so
+    uvicorn workers do not each hold a parsed copy; 'memory' loads index.json.
+    """
+    if settings.VECTOR_INDEX_BACKEND == "memory":
+        return load_vector_store()
+
+    return MmapVectorIndex.open(
+        get_index_snapshot_path(),
+        source_path=get_index_path(),
+        embedding=get_embeddings(),
+        load_store=load_vector_store,
+    )
+
+
 @lru_cache
 def get_chat_model() -> ChatOpenAI:
     return ChatOpenAI(
         model=settings.CHAT_MODEL,
         api_key=settings.OPENAI_API_KEY,
         temperature=settings.CHAT_MODEL_TEMPERATURE,
+        timeout=settings.LLM_TIMEOUT,
+    )
+
+
+@lru_cache
+def get_tracer() -> Tracer:
+    """Configures the span exporters once per process."""
+    return configure_tracing(
+        settings.TRACING_EXPORTERS,
+        jsonl_path=get_traces_path(),
+        slow_seconds=settings.TRACING_SLOW_SECONDS,
+    )
+
+
+@lru_cache
+def get_checkpointer(name: str) -> BaseCheckpointSaver:
+    """Provides one checkpointer per graph, so thread_ids never collide."""
+    if settings.CHECKPOINTER_BACKEND == "sqlite":
+        return LazySqliteSaver(str(get_checkpoint_path(name)))
+
+    return BoundedMemorySaver(
+        max_threads=settings.CHECKPOINTER_MAX_THREADS,
+        max_bytes=settings.CHECKPOINTER_MAX_BYTES,
+        ttl_seconds=settings.CHECKPOINTER_TTL_SECONDS,
+        name=name,
     )
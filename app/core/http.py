@@ -0,0 +1,108 @@
+import re
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ConnectionStats:
+    """
+    Connection reuse counters for a long-lived httpx client, fed by the
+    httpcore 'trace' request extension.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.requests = 0
+        self.new_connections = 0
+        self.tls_handshakes = 0
+        self.http2_requests = 0
+
+    async def trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self.new_connections += 1
+        elif event_name == "connection.start_tls.complete":
+            self.tls_handshakes += 1
+        elif event_name == "http11.send_request_headers.started":
+            self.requests += 1
+        elif event_name == "http2.send_request_headers.started":
+            self.requests += 1
+            self.http2_requests += 1
+
+    @property
+    def extensions(self) -> Dict[str, Any]:
+        """Pass as `extensions=` on each request to record it."""
+        return {"trace": self.trace}
+
+    def snapshot(self) -> Dict[str, Any]:
+        reused = max(self.requests - self.new_connections, 0)
+        return {
+            "requests": self.requests,
+            "new_connections": self.new_connections,
+            "tls_handshakes": self.tls_handshakes,
+            "http2_requests": self.http2_requests,
+            "reused_connections": reused,
+            "reuse_ratio": round(reused / self.requests, 4) if self.requests else 0.0,
+        }
+
+
+def http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def create_async_client(
+    timeout: httpx.Timeout,
+    limits: httpx.Limits,
+    http2: bool = False,
+    **kwargs: Any,
+) -> httpx.AsyncClient:
+    """Long-lived client; HTTP/2 is used only when the optional 'h2' is installed."""
+    if http2 and not http2_available():
+        logger.warning("HTTP/2 requested but 'h2' is not installed. Using HTTP/1.1.")
+        http2 = False
+
+    return httpx.AsyncClient(timeout=timeout, limits=limits, http2=http2, **kwargs)
+
+
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+
+def is_html_response(response: httpx.Response) -> bool:
+    content_type = response.headers.get("Content-Type", "").split(";")[0].strip()
+    # Missing Content-Type: let the parser decide
+    return not content_type or content_type.lower() in HTML_CONTENT_TYPES
+
+
+async def read_capped(
+    response: httpx.Response,
+    max_bytes: int,
+    stop_pattern: Optional[re.Pattern] = None,
+) -> Tuple[bytes, bool]:
+    """
+    Read a streamed response body up to max_bytes, stopping early once
+    stop_pattern matches. Returns (body, truncated).
+    """
+    buffer = bytearray()
+    # Bytes already searched; the overlap catches a marker split across chunks
+    searched = 0
+    overlap = 64
+
+    async for chunk in response.aiter_bytes():
+        buffer.extend(chunk)
+        if len(buffer) >= max_bytes:
+            return bytes(buffer[:max_bytes]), True
+
+        if stop_pattern is not None and stop_pattern.search(
+            buffer, max(searched - overlap, 0)
+        ):
+            return bytes(buffer), True
+        searched = len(buffer)
+
+    return bytes(buffer), False
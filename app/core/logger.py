@@ -1,13 +1,121 @@
+import atexit
+import json
 import logging
+import queue
 import sys
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterable, List, Optional
+
+from app.core.config import settings
+
+TEXT_FORMAT = "[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+REDACTED = "***"
+
+# Attributes every LogRecord has; anything else came in through `extra=`
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {
+    "message",
+    "asctime",
+    "taskName",
+}
+
+
+class Redactor:
+    """Masks secret values (API keys) anywhere in a formatted log line."""
+
+    def __init__(self, secrets: Iterable[Optional[str]]):
+        # Very short values would mask unrelated text
+        self.secrets = sorted(
+            {s for s in secrets if s and len(s) >= 6}, key=len, reverse=True
+        )
+
+    def __call__(self, text: str) -> str:
+        for secret in self.secrets:
+            if secret in text:
+                text = text.replace(secret, REDACTED)
+        return text
+
+
+class TextFormatter(logging.Formatter):
+    def __init__(self, redact: Redactor):
+        super().__init__(TEXT_FORMAT, datefmt=DATE_FORMAT)
+        self.redact = redact
+
+    def format(self, record: logging.LogRecord) -> str:
+        return self.redact(super().format(record))
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, including the fields passed with `extra=`."""
+
+    def __init__(self, redact: Redactor):
+        super().__init__()
+        self.redact = redact
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return self.redact(json.dumps(entry, ensure_ascii=False, default=str))
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    Hands records to the listener thread as they are. The stock QueueHandler
+    formats the message on the calling thread (for pickling); the queue here
+    never leaves the process, so formatting, redaction and I/O all happen on
+    the listener thread and the event loop only pays for an enqueue.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _secrets() -> List[Optional[str]]:
+    return [
+        settings.ECOS_API_KEY,
+        settings.OPENAI_API_KEY,
+        settings.NAVER_CLIENT_ID,
+        settings.NAVER_CLIENT_SECRET,
+    ]
+
+
+def configure_logging() -> QueueListener:
+    """Route the root logger through a queue to a stdout writer thread."""
+    redact = Redactor(_secrets())
+    formatter = (
+        JsonFormatter(redact)
+        if settings.LOG_FORMAT == "json"
+        else TextFormatter(redact)
+    )
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.handlers = [LazyQueueHandler(log_queue)]
+    root.setLevel(settings.LOG_LEVEL.upper())
+
+    listener = QueueListener(log_queue, output, respect_handler_level=True)
+    listener.start()
+    # Flush what is still queued on shutdown
+    atexit.register(listener.stop)
+    return listener
+
 
 # Configure Root Logger for the Application
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-    stream=sys.stdout,
-)
+listener = configure_logging()
 
 
 def get_logger(name: str) -> logging.Logger:
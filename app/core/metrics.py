@@ -0,0 +1,249 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from app.core.tracing import Span, tracer
+
+# Seconds; LLM calls and whole graph runs can take minutes
+DEFAULT_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+LabelValues = Tuple[str, ...]
+
+
+class _Sharded:
+    """
+    Per-thread cells: each thread only ever writes its own cell, so recording
+    needs no lock. Readers sum all cells (a scrape may miss an in-progress
+    update, never corrupt one).
+    """
+
+    def __init__(self, size: int):
+        self._size = size
+        self._cells: Dict[int, List[float]] = {}
+
+    def cell(self) -> List[float]:
+        ident = threading.get_ident()
+        cell = self._cells.get(ident)
+        if cell is None:
+            cell = self._cells[ident] = [0.0] * self._size
+        return cell
+
+    def total(self) -> List[float]:
+        totals = [0.0] * self._size
+        for cell in list(self._cells.values()):
+            for i, value in enumerate(cell):
+                totals[i] += value
+        return totals
+
+
+class Counter:
+    def __init__(self):
+        self._value = _Sharded(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._value.cell()[0] += amount
+
+    def value(self) -> float:
+        return self._value.total()[0]
+
+
+class Gauge(Counter):
+    """Up/down counter (e.g. in-flight requests)."""
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        # One cell per bucket, then +Inf, sum
+        self._values = _Sharded(len(self.buckets) + 2)
+
+    def observe(self, value: float) -> None:
+        cell = self._values.cell()
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                cell[i] += 1
+                break
+        else:
+            cell[len(self.buckets)] += 1
+        cell[-1] += value
+
+    def snapshot(self) -> Tuple[List[float], float, float]:
+        """(cumulative bucket counts incl. +Inf, sum, count)"""
+        totals = self._values.total()
+        cumulative = []
+        running = 0.0
+        for count in totals[:-1]:
+            running += count
+            cumulative.append(running)
+        return cumulative, totals[-1], running
+
+
+class MetricFamily:
+    def __init__(
+        self,
+        kind: str,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        factory: Callable[[], object],
+    ):
+        self.kind = kind
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._factory = factory
+        self._children: Dict[LabelValues, object] = {}
+
+    def labels(self, *values: str):
+        child = self._children.get(values)
+        if child is None:
+            # setdefault: two threads racing here end up sharing one child
+            child = self._children.setdefault(values, self._factory())
+        return child
+
+    def children(self) -> List[Tuple[LabelValues, object]]:
+        return list(self._children.items())
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+class MetricsRegistry:
+    """Minimal Prometheus text-format registry (no client library needed)."""
+
+    def __init__(self, prefix: str = ""):
+        self.prefix = prefix
+        self._families: Dict[str, MetricFamily] = {}
+        # Extra lines computed at scrape time from other trackers
+        self._collectors: List[Callable[[], Iterator[str]]] = []
+
+    def _family(self, kind, name, documentation, labelnames, factory) -> MetricFamily:
+        name = self.prefix + name
+        family = self._families.get(name)
+        if family is None:
+            family = self._families.setdefault(
+                name, MetricFamily(kind, name, documentation, labelnames, factory)
+            )
+        return family
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> MetricFamily:
+        return self._family("counter", name, documentation, labelnames, Counter)
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> MetricFamily:
+        return self._family("gauge", name, documentation, labelnames, Gauge)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames=(),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> MetricFamily:
+        return self._family(
+            "histogram", name, documentation, labelnames, lambda: Histogram(buckets)
+        )
+
+    def register_collector(self, collector: Callable[[], Iterator[str]]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for family in list(self._families.values()):
+            lines.append(f"# HELP {family.name} {family.documentation}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            for values, child in family.children():
+                if isinstance(child, Histogram):
+                    cumulative, total, count = child.snapshot()
+                    bounds = [*map(_format_value, child.buckets), "+Inf"]
+                    for bound, bucket_count in zip(bounds, cumulative):
+                        labels = _format_labels(
+                            family.labelnames, values, f'le="{bound}"'
+                        )
+                        value = _format_value(bucket_count)
+                        lines.append(f"{family.name}_bucket{labels} {value}")
+                    labels = _format_labels(family.labelnames, values)
+                    lines.append(f"{family.name}_sum{labels} {_format_value(total)}")
+                    lines.append(f"{family.name}_count{labels} {_format_value(count)}")
+                else:
+                    labels = _format_labels(family.labelnames, values)
+                    lines.append(
+                        f"{family.name}{labels} {_format_value(child.value())}"
+                    )
+
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry(prefix="kea_")
+
+node_duration = metrics.histogram(
+    "graph_node_duration_seconds", "Duration of LangGraph node runs.", ["graph", "node"]
+)
+node_errors = metrics.counter(
+    "graph_node_errors_total", "LangGraph node runs that raised.", ["graph", "node"]
+)
+graph_runs_in_flight = metrics.gauge(
+    "graph_runs_in_flight", "Graph/agent sessions currently running.", ["graph"]
+)
+graph_run_duration = metrics.histogram(
+    "graph_run_duration_seconds", "Duration of whole graph/agent runs.", ["graph"]
+)
+tool_duration = metrics.histogram(
+    "tool_duration_seconds", "Duration of agent tool calls.", ["tool"]
+)
+tool_errors = metrics.counter("tool_errors_total", "Tool calls that raised.", ["tool"])
+llm_duration = metrics.histogram(
+    "llm_request_duration_seconds", "Duration of chat model calls.", ["graph", "node"]
+)
+upstream_requests = metrics.counter(
+    "upstream_requests_total",
+    "Calls to external services by outcome.",
+    ["service", "status"],
+)
+upstream_duration = metrics.histogram(
+    "upstream_request_duration_seconds",
+    "Latency of calls to external services.",
+    ["service"],
+)
+
+
+@contextmanager
+def observe_upstream(service: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """
+    Count and time one call to an external service (ecos, naver, openai, ...),
+    inside a tracing span carrying `attributes` (None when tracing is off).
+    """
+    started = time.perf_counter()
+    status = "error"
+    try:
+        with tracer.span(f"upstream.{service}", **attributes) as span:
+            yield span
+        status = "ok"
+    finally:
+        upstream_duration.labels(service).observe(time.perf_counter() - started)
+        upstream_requests.labels(service, status).inc()
+
+
+def metric_line(
+    name: str, labelnames: Sequence[str], values: Sequence[str], value: float
+) -> str:
+    """One sample line, for collectors that export values tracked elsewhere."""
+    labels = _format_labels(labelnames, values)
+    return f"{metrics.prefix}{name}{labels} {_format_value(value)}"
@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import Optional
+
+
+def date_context(now: Optional[datetime] = None) -> str:
+    """Per-request date section, shared by the ECOS graph and the agents."""
+    today = (now or datetime.now()).strftime("%Y%m%d")
+    return f"""Current Date: {today} (Today is {today[:4]}-{today[4:6]}-{today[6:]})
+- "This year" = {today[:4]}
+- "Last year" = {int(today[:4]) - 1}
+- Always calculate dates relative to Today."""
+
+
+def build_prompt(static_instructions: str, *dynamic_sections: Optional[str]) -> str:
+    """
+    Assemble a prompt with the static instructions first and per-request content last.
+    Providers cache prompts by prefix, so nothing variable may come before the
+    static part.
+    """
+    sections = [static_instructions.strip()]
+    sections.extend(section.strip() for section in dynamic_sections if section)
+    return "\n\n".join(sections)
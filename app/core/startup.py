@@ -0,0 +1,85 @@
+import json
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Served while warming up; everything else answers 503 until ready
+ALWAYS_AVAILABLE_PATHS = ("/health", "/ready", "/metrics")
+
+
+class StartupState:
+    """Readiness flag and per-step timings of the application warmup."""
+
+    def __init__(self):
+        self.ready = False
+        self.error: Optional[str] = None
+        self.steps: Dict[str, float] = {}
+        self._started = time.perf_counter()
+        self.warm_seconds: Optional[float] = None
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps[name] = round(time.perf_counter() - started, 3)
+            logger.info(f"🚀 Startup step '{name}': {self.steps[name]:.3f}s")
+
+    def mark_ready(self) -> None:
+        self.ready = True
+        self.warm_seconds = round(time.perf_counter() - self._started, 3)
+        logger.info(f"🚀 Ready in {self.warm_seconds:.3f}s (steps: {self.steps})")
+
+    def mark_failed(self, error: BaseException) -> None:
+        self.error = f"{type(error).__name__}: {error}"
+        logger.error(f"🚀 Warmup failed: {self.error}")
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "error": self.error,
+            "warm_seconds": self.warm_seconds,
+            "steps": self.steps,
+        }
+
+
+startup_state = StartupState()
+
+
+class ReadinessMiddleware:
+    """
+    Pure ASGI middleware (does not buffer streaming responses): answers 503 with
+    Retry-After for everything but health/readiness until the app is warm.
+    """
+
+    def __init__(self, app, state: StartupState = startup_state):
+        self.app = app
+        self.state = state
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or self.state.ready
+            or scope["path"] in ALWAYS_AVAILABLE_PATHS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        body = json.dumps({"detail": "Warming up", **self.state.snapshot()}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", b"1"),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
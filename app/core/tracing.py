@@ -0,0 +1,243 @@
+import json
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Protocol
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class Span:
+    """One timed operation; spans of one request share a trace_id."""
+
+    __slots__ = (
+        "trace_id",
+        "span_id",
+        "parent",
+        "name",
+        "start",
+        "end",
+        "attributes",
+        "error",
+        "_trace",
+    )
+
+    def __init__(self, name: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.name = name
+        self.parent = parent
+        self.span_id = uuid.uuid4().hex[:16]
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex
+        self.start = time.time()
+        self.end: Optional[float] = None
+        self.attributes = attributes
+        self.error: Optional[str] = None
+        # All spans of the trace, exported together when the root ends
+        self._trace: List["Span"] = parent._trace if parent else []
+        self._trace.append(self)
+
+    @property
+    def duration(self) -> float:
+        return (self.end or time.time()) - self.start
+
+    def set(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent.span_id if self.parent else None,
+            "name": self.name,
+            "start": self.start,
+            "duration": round(self.duration, 6),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class SpanExporter(Protocol):
+    def export(self, spans: List[Span]) -> None: ...
+
+
+class JsonlSpanExporter:
+    """Appends every span as one JSON line (works offline, easy to grep/jq)."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span]) -> None:
+        lines = "".join(
+            json.dumps(span.to_dict(), ensure_ascii=False, default=str) + "\n"
+            for span in spans
+        )
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+
+class SlowTraceLogger:
+    """Logs a waterfall of every trace slower than `threshold` seconds."""
+
+    def __init__(self, threshold: float):
+        self.threshold = threshold
+
+    def export(self, spans: List[Span]) -> None:
+        root = spans[0]
+        if root.duration >= self.threshold:
+            logger.warning(f"🐢 Slow request\n{render_waterfall(spans)}")
+
+
+def render_waterfall(spans: List[Span], width: int = 40) -> str:
+    """Text waterfall: offset, duration and a bar per span, indented by depth."""
+    root = spans[0]
+    total = max(root.duration, 1e-9)
+    depth: Dict[str, int] = {}
+    lines = [
+        f"trace {root.trace_id} thread_id={root.attributes.get('thread_id')} "
+        f"{root.duration:.3f}s"
+    ]
+    for span in sorted(spans, key=lambda s: s.start):
+        level = depth[span.span_id] = (
+            depth.get(span.parent.span_id, -1) + 1 if span.parent else 0
+        )
+        offset = span.start - root.start
+        begin = int(offset / total * width)
+        length = max(int(span.duration / total * width), 1)
+        bar = " " * begin + "█" * min(length, width - begin)
+        attributes = " ".join(
+            f"{k}={v}" for k, v in span.attributes.items() if k != "thread_id"
+        )
+        status = " ERROR" if span.error else ""
+        lines.append(
+            f"{offset:8.3f}s {span.duration:8.3f}s |{bar:<{width}}| "
+            f"{'  ' * level}{span.name} {attributes}{status}".rstrip()
+        )
+    return "\n".join(lines)
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    def __init__(self):
+        self.exporters: List[SpanExporter] = []
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.exporters)
+
+    def add_exporter(self, exporter: SpanExporter) -> None:
+        self.exporters.append(exporter)
+
+    def current_span(self) -> Optional[Span]:
+        return _current_span.get()
+
+    def activate(self, span: Optional[Span]) -> Optional[Span]:
+        """
+        Make `span` current in this context and return the previous one.
+        For callback-driven spans, where a context manager cannot wrap the work.
+        """
+        previous = _current_span.get()
+        _current_span.set(span)
+        return previous
+
+    def start_span(
+        self, name: str, parent: Optional[Span] = None, **attributes: Any
+    ) -> Optional[Span]:
+        """Open a span (child of `parent` or of the current span); None if disabled."""
+        if not self.enabled:
+            return None
+        return Span(name, parent or _current_span.get(), attributes)
+
+    def end_span(self, span: Optional[Span], error: Optional[BaseException] = None):
+        if span is None or span.end is not None:
+            return
+        span.end = time.time()
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+        if span.parent is None:
+            self._export(span._trace)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+        """Span around a block; it becomes the parent of spans opened inside."""
+        span = self.start_span(name, **attributes)
+        if span is None:
+            yield None
+            return
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            self.end_span(span, e)
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Annotate the current span, if any."""
+        span = _current_span.get()
+        if span is not None:
+            span.set(key, value)
+
+    def _export(self, spans: List[Span]) -> None:
+        for exporter in self.exporters:
+            try:
+                exporter.export(spans)
+            except Exception as e:
+                logger.warning(f"Span exporter {type(exporter).__name__} failed: {e}")
+
+
+tracer = Tracer()
+
+
+def configure_tracing(exporters: str, jsonl_path: Path, slow_seconds: float) -> Tracer:
+    """Enable exporters from a comma-separated list: 'jsonl', 'slow_log'."""
+    for name in filter(None, (part.strip() for part in exporters.split(","))):
+        if name == "jsonl":
+            jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+            tracer.add_exporter(JsonlSpanExporter(jsonl_path))
+        elif name == "slow_log":
+            tracer.add_exporter(SlowTraceLogger(slow_seconds))
+        else:
+            logger.warning(f"Unknown trace exporter: {name}")
+    return tracer
+
+
+def load_traces(path: Path) -> List[List[Span]]:
+    """Read a JSONL export back into traces (root span first)."""
+    rows_by_trace: Dict[str, List[Dict[str, Any]]] = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            row = json.loads(line)
+            rows_by_trace.setdefault(row["trace_id"], []).append(row)
+
+    traces = []
+    for rows in rows_by_trace.values():
+        spans: Dict[str, Span] = {}
+        # Parents always start before their children
+        for row in sorted(rows, key=lambda r: r["start"]):
+            span = Span(row["name"], spans.get(row["parent_id"]), row["attributes"])
+            span.trace_id, span.span_id = row["trace_id"], row["span_id"]
+            span.start, span.end = row["start"], row["start"] + row["duration"]
+            span.error = row["error"]
+            spans[span.span_id] = span
+        traces.append(next(iter(spans.values()))._trace)
+    return traces
+
+
+if __name__ == "__main__":
+    # Offline waterfalls from a JSONL export:
+    #   python -m app.core.tracing data/traces.jsonl [trace_id]
+    import sys
+
+    wanted = sys.argv[2] if len(sys.argv) > 2 else None
+    for spans in load_traces(Path(sys.argv[1])):
+        if wanted is None or spans[0].trace_id == wanted:
+            print(render_waterfall(spans) + "\n")
@@ -1,3 +1,7 @@
+from datetime import date, timedelta
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
 def format_date(date_str: str, cycle: str) -> str:
     """
     Format date string to match ECOS API requirements based on cycle.
@@ -20,3 +24,62 @@ def format_date(date_str: str, cycle: str) -> str:
         return cleaned[:8]  # YYYYMMDD
 
     return cleaned
+
+
+def shift_period(period: str, cycle: str, offset: int) -> str:
+    """
+    Move an ECOS period string (e.g. 2024, 2024S1, 2024Q1, 202401, 202401S1,
+    20240131) by `offset` periods of its cycle.
+    """
+    if cycle == "A":
+        return str(int(period[:4]) + offset)
+    if cycle == "D":
+        day = date(int(period[:4]), int(period[4:6]), int(period[6:8]))
+        return (day + timedelta(days=offset)).strftime("%Y%m%d")
+
+    # Count periods from year 0, shift, and format back
+    per_year = {"S": 2, "Q": 4, "M": 12, "SM": 24}[cycle]
+    year = int(period[:4])
+    if cycle == "SM":
+        index = (int(period[4:6]) - 1) * 2 + int(period[7]) - 1
+    elif cycle == "M":
+        index = int(period[4:6]) - 1
+    else:
+        index = int(period[5]) - 1
+
+    year, index = divmod(year * per_year + index + offset, per_year)
+    if cycle == "S":
+        return f"{year}S{index + 1}"
+    if cycle == "Q":
+        return f"{year}Q{index + 1}"
+    if cycle == "M":
+        return f"{year}{index + 1:02d}"
+    return f"{year}{index // 2 + 1:02d}S{index % 2 + 1}"
+
+
+# Query parameters that only track the referrer and never change the content
+TRACKING_PARAMS = {"fbclid", "gclid", "igshid", "mc_cid", "mc_eid", "ref", "ref_src"}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Canonical form of a URL for caching and deduplication.
+    Lowercases scheme/host, drops fragments, default ports and tracking parameters,
+    and sorts the remaining query parameters.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and not (
+        (scheme == "http" and parts.port == 80)
+        or (scheme == "https" and parts.port == 443)
+    ):
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
@@ -0,0 +1,133 @@
+import fcntl
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import InMemoryVectorStore
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+VECTORS_FILE = "vectors.npy"
+META_FILE = "meta.json"
+LOCK_FILE = ".lock"
+
+
+def source_fingerprint(path: Path) -> Dict[str, int]:
+    stat = path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+@contextmanager
+def _exclusive_lock(folder: Path) -> Iterator[None]:
+    """Across worker processes: only one builds the snapshot, the others wait."""
+    with open(folder / LOCK_FILE, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def write_snapshot(
+    store: InMemoryVectorStore, folder: Path, source: Optional[Dict[str, Any]]
+) -> None:
+    """Dump a vector store as a float32 matrix of unit vectors plus metadata."""
+    records = list(store.store.values())
+    vectors = np.asarray([record["vector"] for record in records], dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors /= np.where(norms == 0, 1, norms)
+
+    meta = {
+        "source": source,
+        "documents": [
+            {"text": record["text"], "metadata": record["metadata"]}
+            for record in records
+        ],
+    }
+
+    # Write then rename, so readers never map a half-written file
+    tmp_vectors = folder / f"{VECTORS_FILE}.{os.getpid()}.tmp"
+    tmp_meta = folder / f"{META_FILE}.{os.getpid()}.tmp"
+    with open(tmp_vectors, "wb") as f:
+        np.save(f, vectors)
+    tmp_meta.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_vectors, folder / VECTORS_FILE)
+    os.replace(tmp_meta, folder / META_FILE)
+
+
+class MmapVectorIndex:
+    """
+    Read-only vector index backed by a memory-mapped .npy snapshot.
+    Every worker process maps the same file, so the vectors live once in the
+    page cache instead of once per worker. Implements the `similarity_search`
+    subset of the VectorStore interface used by StatisticsRepository.
+    """
+
+    def __init__(self, folder: Path, embedding: Embeddings):
+        self.embedding = embedding
+        self.vectors = np.load(folder / VECTORS_FILE, mmap_mode="r")
+        meta = json.loads((folder / META_FILE).read_text(encoding="utf-8"))
+        self.documents = [
+            Document(page_content=d["text"], metadata=d["metadata"])
+            for d in meta["documents"]
+        ]
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def similarity_search(self, query: str, k: int = 4) -> List[Document]:
+        return self.similarity_search_by_vector(self.embedding.embed_query(query), k)
+
+    def similarity_search_by_vector(
+        self, embedding: List[float], k: int = 4
+    ) -> List[Document]:
+        if not self.documents:
+            return []
+        query = np.asarray(embedding, dtype=np.float32)
+        query /= np.linalg.norm(query) or 1.0
+
+        # Cosine similarity: rows are unit vectors
+        scores = self.vectors @ query
+        k = min(k, len(scores))
+        # Ties keep catalog order
+        top = np.sort(np.argpartition(-scores, k - 1)[:k])
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [self.documents[i] for i in top]
+
+    @classmethod
+    def open(
+        cls,
+        folder: Path,
+        source_path: Path,
+        embedding: Embeddings,
+        load_store: Callable[[], InMemoryVectorStore],
+    ) -> "MmapVectorIndex":
+        """
+        Map the snapshot in `folder`, building it first from `load_store()`
+        when it is missing or older than `source_path`.
+        """
+        folder.mkdir(parents=True, exist_ok=True)
+        with _exclusive_lock(folder):
+            source = source_fingerprint(source_path) if source_path.exists() else None
+            meta_path = folder / META_FILE
+            current = None
+            if meta_path.exists() and (folder / VECTORS_FILE).exists():
+                current = json.loads(meta_path.read_text(encoding="utf-8"))["source"]
+
+            if current is None or current != source:
+                logger.info(f"Building vector index snapshot in {folder}")
+                store = load_store()
+                # Fingerprint after loading: the loader may (re)build the source
+                source = (
+                    source_fingerprint(source_path) if source_path.exists() else None
+                )
+                write_snapshot(store, folder, source)
+
+        return cls(folder, embedding)
@@ -1,28 +1,85 @@
+import asyncio
 from contextlib import asynccontextmanager
+from importlib import import_module
+from typing import AsyncIterator
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
 
-from app.agent.ecos_agent import ecos_agent
-from app.agent.news_agent import news_agent
 from app.core.config import settings
-from app.mcp_server import create_mcp_app
-from app.repository.statistics import get_statistics_repository
+from app.core.deadline import DeadlineMiddleware
+from app.core.metrics import metrics
+from app.core.startup import ReadinessMiddleware, startup_state
+from app.schema.statistics import ExportRequest
 
-from ag_ui_langgraph import add_langgraph_fastapi_endpoint
-from copilotkit import LangGraphAGUIAgent
-
-mcp_app = create_mcp_app()
+# Agents, graphs and the MCP server are imported in warm_up(), not here, so that
+# importing this module (and starting the server) stays cheap.
+HEAVY_MODULES = ("app.routes", "app.mcp_server")
 
 
 @asynccontextmanager
-async def lifespan(app: FastAPI):
+async def warm_up(app: FastAPI) -> AsyncIterator[None]:
+    """Build components, register their routes and keep them running."""
+    # Blocking work runs in threads so /health and /ready keep answering
+    with startup_state.step("import"):
+        for module in HEAVY_MODULES:
+            await asyncio.to_thread(import_module, module)
+
+    from app.mcp_server import create_mcp_app
+    from app.repository.statistics import get_statistics_repository
+    from app.routes import register_routes
+    from app.services.news_service import news_service
+    from app.services.passage_ranker import ensure_sentence_model
+
+    with startup_state.step("routes"):
+        mcp_app = create_mcp_app()
+        register_routes(app, mcp_app)
+
     # Initialize repository
-    get_statistics_repository()
+    with startup_state.step("statistics_index"):
+        await asyncio.to_thread(get_statistics_repository)
+
+    with startup_state.step("sentence_model"):
+        await asyncio.to_thread(ensure_sentence_model)
+
+    # Start article parser workers (process backend only)
+    with startup_state.step("article_parser"):
+        await news_service.parser.warmup()
 
     # Initialize MCP app (starts session manager for Streamable HTTP)
     async with mcp_app.router.lifespan_context(mcp_app):
+        startup_state.mark_ready()
+        try:
+            yield
+        finally:
+            # Close shared HTTP connection pools and parser workers
+            await news_service.aclose()
+
+
+async def _warm_up_in_background(app: FastAPI, stop: asyncio.Event) -> None:
+    try:
+        async with warm_up(app):
+            await stop.wait()
+    except Exception as e:
+        startup_state.mark_failed(e)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.STARTUP_MODE != "lazy":
+        async with warm_up(app):
+            yield
+        return
+
+    # Lazy: accept connections now, answer 503 until the warmup has finished
+    stop = asyncio.Event()
+    task = asyncio.create_task(_warm_up_in_background(app, stop))
+    try:
         yield
+    finally:
+        stop.set()
+        await task
 
 
 def create_app() -> FastAPI:
@@ -32,6 +89,8 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
+    app.add_middleware(DeadlineMiddleware)
+    app.add_middleware(ReadinessMiddleware)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -40,18 +99,50 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
-    ecos = LangGraphAGUIAgent(
-        name="ecos_agent",
-        graph=ecos_agent,
-    )
-    news = LangGraphAGUIAgent(
-        name="news_agent",
-        graph=news_agent,
-    )
-    add_langgraph_fastapi_endpoint(app=app, agent=ecos, path="/ecos")
-    add_langgraph_fastapi_endpoint(app=app, agent=news, path="/news")
+    @app.get("/health")
+    def health() -> dict:
+        return {"status": "ok"}
+
+    @app.get("/ready")
+    def ready(response: Response) -> dict:
+        if not startup_state.ready:
+            response.status_code = 503
+        return startup_state.snapshot()
+
+    # Prometheus text format; available during warmup too
+    @app.get("/metrics", response_class=PlainTextResponse)
+    def prometheus_metrics() -> str:
+        return metrics.render()
+
+    @app.post("/export/series")
+    async def export_series(request: ExportRequest) -> StreamingResponse:
+        """
+        Stream many ECOS series as NDJSON, CSV or Arrow IPC, each one as soon as
+        it is fetched (completion order; every record carries its `index`).
+        """
+        # Pulls in the statistics repository, like the agent routes
+        from app.services.export_service import (
+            MEDIA_TYPES,
+            arrow_available,
+            stream_export,
+        )
+
+        if len(request.series) > settings.EXPORT_MAX_SERIES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"At most {settings.EXPORT_MAX_SERIES} series per request.",
+            )
+        if request.format == "arrow" and not arrow_available():
+            raise HTTPException(
+                status_code=501,
+                detail="Arrow output requires 'pyarrow'. "
+                "Install it with: uv sync --extra arrow",
+            )
 
-    app.mount("", mcp_app)
+        return StreamingResponse(
+            stream_export(request.series, request.format),
+            media_type=MEDIA_TYPES[request.format],
+        )
 
     return app
 
@@ -1,6 +1,8 @@
+import asyncio
 import uuid
 from typing import Optional
 
+from langgraph.graph.state import CompiledStateGraph
 from mcp.server.fastmcp import FastMCP
 from starlette.applications import Starlette
 
@@ -8,14 +10,68 @@ from app.workflow.ecos.graph import ecos_graph
 from app.agent.news_agent import news_agent
 from app.core.config import settings
 from app.core.logger import get_logger
+from app.core.admission import AdmissionController, admitted
 from app.core.callbacks import AgentLoggingCallback
+from app.core.deadline import (
+    DEADLINE_KEY,
+    DeadlineExceeded,
+    deadline_scope,
+    new_deadline,
+    with_timeout,
+)
+from app.core.dependencies import get_tracer
+from app.core.tracing import tracer
+from app.schema.statistics import StatisticSeries
+from app.services.series_service import series_service
 
 logger = get_logger(__name__)
 
 mcp = FastMCP(settings.PROJECT_NAME, host="0.0.0.0")
 
+news_admission = AdmissionController(
+    "ask_news_agent",
+    max_concurrency=settings.MCP_NEWS_MAX_CONCURRENCY,
+    max_queue=settings.MCP_QUEUE_SIZE,
+    queue_timeout=settings.MCP_QUEUE_TIMEOUT,
+)
+ecos_admission = AdmissionController(
+    "ask_ecos_agent",
+    max_concurrency=settings.MCP_ECOS_MAX_CONCURRENCY,
+    max_queue=settings.MCP_QUEUE_SIZE,
+    queue_timeout=settings.MCP_QUEUE_TIMEOUT,
+)
+series_admission = AdmissionController(
+    "get_ecos_series",
+    max_concurrency=settings.MCP_SERIES_MAX_CONCURRENCY,
+    max_queue=settings.MCP_QUEUE_SIZE,
+    queue_timeout=settings.MCP_QUEUE_TIMEOUT,
+)
+
+
+async def _discard_thread(graph: CompiledStateGraph, thread_id: str) -> None:
+    """Drop checkpoints of a one-shot call (no thread_id given by the client)."""
+    if graph.checkpointer:
+        await graph.checkpointer.adelete_thread(thread_id)
+
+
+async def _invoke_with_deadline(
+    graph: CompiledStateGraph, inputs: dict, config: dict, deadline: float
+) -> dict:
+    """Run the graph within the request's time budget (hard stop at the deadline)."""
+    with deadline_scope(deadline):
+        try:
+            return await with_timeout(
+                graph.ainvoke(inputs, config=config), settings.REQUEST_BUDGET_SECONDS
+            )
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded(
+                f"The request exceeded its {settings.REQUEST_BUDGET_SECONDS:g}s "
+                "time budget. Try a narrower question."
+            ) from None
+
 
 @mcp.tool()
+@admitted(news_admission)
 async def ask_news_agent(query: str, thread_id: Optional[str] = None) -> str:
     """
     Ask the News Agent to search and analyze latest economic news.
@@ -24,16 +80,26 @@ async def ask_news_agent(query: str, thread_id: Optional[str] = None) -> str:
     """
     logger.info(f"🗣️ User Query (News): {query}")
 
-    if not thread_id:
+    one_shot = not thread_id
+    if one_shot:
         thread_id = str(uuid.uuid4())
 
     # Inject logging callback for the news agent
     news_logger = get_logger("app.agent.news_agent")
     callback = AgentLoggingCallback(news_logger)
 
-    config = {"configurable": {"thread_id": thread_id}, "callbacks": [callback]}
+    deadline = new_deadline()
+    config = {
+        "configurable": {"thread_id": thread_id, DEADLINE_KEY: deadline},
+        "callbacks": [callback],
+    }
     inputs = {"messages": [("user", query)]}
-    result = await news_agent.ainvoke(inputs, config=config)
+    try:
+        with tracer.span("mcp.ask_news_agent", thread_id=thread_id):
+            result = await _invoke_with_deadline(news_agent, inputs, config, deadline)
+    finally:
+        if one_shot and not settings.CHECKPOINT_ONE_SHOT_CALLS:
+            await _discard_thread(news_agent, thread_id)
 
     messages = result.get("messages", [])
     if messages:
@@ -46,6 +112,7 @@ async def ask_news_agent(query: str, thread_id: Optional[str] = None) -> str:
 
 
 @mcp.tool()
+@admitted(ecos_admission)
 async def ask_ecos_agent(query: str, thread_id: Optional[str] = None) -> str:
     """
     Ask the ECOS Agent to search and analyze economic statistics.
@@ -54,16 +121,26 @@ async def ask_ecos_agent(query: str, thread_id: Optional[str] = None) -> str:
     """
     logger.info(f"🗣️ User Query (ECOS): {query}")
 
-    if not thread_id:
+    one_shot = not thread_id
+    if one_shot:
         thread_id = str(uuid.uuid4())
 
     # Inject logging callback for the ecos agent
     ecos_logger = get_logger("app.agent.ecos_agent")
     callback = AgentLoggingCallback(ecos_logger)
 
-    config = {"configurable": {"thread_id": thread_id}, "callbacks": [callback]}
-    inputs = {"query": query, "messages": [], "retry_count": 0}
-    result = await ecos_graph.ainvoke(inputs, config=config)
+    deadline = new_deadline()
+    config = {
+        "configurable": {"thread_id": thread_id, DEADLINE_KEY: deadline},
+        "callbacks": [callback],
+    }
+    inputs = {"query": query, "messages": [], "retry_counts": {}}
+    try:
+        with tracer.span("mcp.ask_ecos_agent", thread_id=thread_id):
+            result = await _invoke_with_deadline(ecos_graph, inputs, config, deadline)
+    finally:
+        if one_shot and not settings.CHECKPOINT_ONE_SHOT_CALLS:
+            await _discard_thread(ecos_graph, thread_id)
 
     messages = result.get("messages", [])
     if messages:
@@ -75,9 +152,45 @@ async def ask_ecos_agent(query: str, thread_id: Optional[str] = None) -> str:
     return "No response generated."
 
 
+@mcp.tool()
+@admitted(series_admission)
+async def get_ecos_series(
+    stat_code: Optional[str] = None,
+    query: Optional[str] = None,
+    item_code: Optional[str] = None,
+    cycle: Optional[str] = None,
+    start_time: Optional[str] = None,
+    end_time: Optional[str] = None,
+) -> StatisticSeries:
+    """
+    Fetch one Bank of Korea (ECOS) statistic series as structured data, without
+    analysis. Give stat_code and item_code when known; otherwise a query
+    (e.g. "소비자물가지수") is used to find the statistic and item. cycle is one
+    of A|S|Q|M|SM|D; start_time and end_time use its format (2024, 2024Q1,
+    202401, 20240131). Missing values default to the item's cycle and its
+    latest periods.
+    """
+    logger.info(
+        f"🗣️ Series Request: stat_code={stat_code} item_code={item_code} "
+        f"cycle={cycle} range={start_time}~{end_time} query={query}"
+    )
+    with tracer.span("mcp.get_ecos_series", stat_code=stat_code, query=query):
+        with deadline_scope(new_deadline()):
+            return await series_service.get_series(
+                stat_code=stat_code,
+                query=query,
+                item_code=item_code,
+                cycle=cycle,
+                start_time=start_time,
+                end_time=end_time,
+            )
+
+
 def create_mcp_app() -> Starlette:
+    get_tracer()
     return mcp.streamable_http_app()
 
 
 if __name__ == "__main__":
+    get_tracer()
     mcp.run()
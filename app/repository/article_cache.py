@@ -0,0 +1,184 @@
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+
+from app.core.config import settings
+from app.core.dependencies import get_article_cache_path
+from app.core.logger import get_logger
+from app.schema.news import NewsItem
+
+logger = get_logger(__name__)
+
+
+class CachedArticle(NamedTuple):
+    item: NewsItem
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+class ArticleCacheRepository:
+    """
+    Persistent cache of parsed articles keyed by canonical URL (SQLite).
+    Entries expire after `ttl_seconds`; beyond `max_entries` the least recently
+    used entries are evicted.
+    """
+
+    def __init__(self, path: Path, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS articles (
+                url TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                text TEXT NOT NULL,
+                publish_date TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_articles_accessed ON articles (accessed_at)"
+        )
+        self._conn.commit()
+        self.evictions = 0
+        # url -> last access not yet written to accessed_at
+        self._accessed: Dict[str, float] = {}
+
+    def get(self, url: str) -> Optional[CachedArticle]:
+        """
+        Read-only lookup. The access time is only noted in memory and written
+        with the next put/touch, so a cache hit costs a single SELECT.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT title, text, publish_date, etag, last_modified, fetched_at "
+                "FROM articles WHERE url = ?",
+                (url,),
+            ).fetchone()
+            # Expired rows are deleted by the next put (_evict)
+            if row is None or now - row[5] > self.ttl_seconds:
+                return None
+            self._accessed[url] = now
+
+        title, text, publish_date, etag, last_modified, fetched_at = row
+        return CachedArticle(
+            item=NewsItem(title=title, text=text, publish_date=publish_date),
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=fetched_at,
+        )
+
+    def put(
+        self,
+        url: str,
+        item: NewsItem,
+        etag: Optional[str],
+        last_modified: Optional[str],
+    ) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO articles "
+                "(url, title, text, publish_date, etag, last_modified, "
+                "fetched_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    item.title,
+                    item.text,
+                    item.publish_date,
+                    etag,
+                    last_modified,
+                    now,
+                    now,
+                ),
+            )
+            self._accessed.pop(url, None)
+            self._flush_accessed()
+            self._evict(now)
+            self._conn.commit()
+
+    def touch(self, url: str) -> None:
+        """Mark an entry as revalidated (the origin answered 304)."""
+        now = time.time()
+        with self._lock:
+            self._accessed.pop(url, None)
+            self._flush_accessed()
+            self._conn.execute(
+                "UPDATE articles SET fetched_at = ?, accessed_at = ? WHERE url = ?",
+                (now, now, url),
+            )
+            self._conn.commit()
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def _flush_accessed(self) -> None:
+        """Write the access times noted by get() (caller holds the lock)."""
+        if not self._accessed:
+            return
+        self._conn.executemany(
+            "UPDATE articles SET accessed_at = ? WHERE url = ?",
+            [(accessed_at, url) for url, accessed_at in self._accessed.items()],
+        )
+        self._accessed.clear()
+
+    def _evict(self, now: float) -> None:
+        expired = self._conn.execute(
+            "DELETE FROM articles WHERE fetched_at < ?", (now - self.ttl_seconds,)
+        ).rowcount
+        overflow = self._conn.execute(
+            "DELETE FROM articles WHERE url IN ("
+            "SELECT url FROM articles ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        ).rowcount
+        self.evictions += expired + overflow
+
+
+class ArticleCacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def snapshot(self, entries: int, evictions: int) -> Dict[str, float]:
+        lookups = self.hits + self.revalidated + self.misses
+        return {
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.revalidated) / lookups, 4)
+            if lookups
+            else 0.0,
+            "entries": entries,
+            "evictions": evictions,
+        }
+
+
+@lru_cache
+def get_article_cache() -> Optional[ArticleCacheRepository]:
+    if not settings.NEWS_ARTICLE_CACHE_ENABLED:
+        return None
+
+    path = get_article_cache_path()
+    try:
+        return ArticleCacheRepository(
+            path,
+            ttl_seconds=settings.NEWS_ARTICLE_CACHE_TTL_SECONDS,
+            max_entries=settings.NEWS_ARTICLE_CACHE_MAX_ENTRIES,
+        )
+    except sqlite3.Error as e:
+        logger.warning(f"Article cache disabled, cannot open {path}: {e}")
+        return None
@@ -1,14 +1,20 @@
 from functools import lru_cache
-from typing import List
+from typing import List, Union
 
 from langchain_core.vectorstores import InMemoryVectorStore
 
 from app.core.dependencies import get_stats_data, get_vector_store
+from app.core.metrics import observe_upstream
+from app.core.vector_index import MmapVectorIndex
 from app.schema.statistics import Statistic
 
 
 class StatisticsRepository:
-    def __init__(self, data: List[Statistic], vector_store: InMemoryVectorStore):
+    def __init__(
+        self,
+        data: List[Statistic],
+        vector_store: Union[InMemoryVectorStore, MmapVectorIndex],
+    ):
         self._data = data
         self.stats_by_code = {s.stat_code: s for s in data}
         self._vector_store = vector_store
@@ -17,7 +23,9 @@ class StatisticsRepository:
         return self._data
 
     def search(self, query: str, k: int = 10) -> List[Statistic]:
-        docs = self._vector_store.similarity_search(query, k=k)
+        # Embedding the query is a call to OpenAI
+        with observe_upstream("openai_embeddings"):
+            docs = self._vector_store.similarity_search(query, k=k)
 
         results = []
 
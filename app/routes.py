@@ -0,0 +1,61 @@
+from ag_ui_langgraph import add_langgraph_fastapi_endpoint
+from copilotkit import LangGraphAGUIAgent
+from fastapi import FastAPI
+from starlette.applications import Starlette
+
+from app.agent.ecos_agent import ecos_agent
+from app.agent.news_agent import news_agent
+from app.core.callbacks import token_usage
+from app.core.checkpointer import BoundedMemorySaver
+from app.core.config import settings
+from app.core.dependencies import get_checkpointer
+from app.services.news_service import news_service
+from app.workflow.ecos.retry import retry_metrics
+
+
+def register_routes(app: FastAPI, mcp_app: Starlette) -> None:
+    """
+    Agent, stats and MCP routes. Importing this module builds the agents and
+    graphs, so main.py imports it only when warming up.
+    """
+    ecos = LangGraphAGUIAgent(
+        name="ecos_agent",
+        graph=ecos_agent,
+    )
+    news = LangGraphAGUIAgent(
+        name="news_agent",
+        graph=news_agent,
+    )
+    add_langgraph_fastapi_endpoint(app=app, agent=ecos, path="/ecos")
+    add_langgraph_fastapi_endpoint(app=app, agent=news, path="/news")
+
+    @app.get("/checkpointer/stats")
+    def checkpointer_stats() -> dict:
+        stats = {}
+        for name in ("ecos_graph", "ecos_agent", "news_agent"):
+            checkpointer = get_checkpointer(name)
+            if isinstance(checkpointer, BoundedMemorySaver):
+                stats[name] = checkpointer.stats()
+            else:
+                # Durable backends are not bounded; nothing to report
+                stats[name] = {"backend": settings.CHECKPOINTER_BACKEND}
+        return stats
+
+    @app.get("/workflow/retry/stats")
+    def retry_stats() -> dict:
+        return retry_metrics.snapshot()
+
+    @app.get("/token-usage/stats")
+    def token_usage_stats() -> dict:
+        return token_usage.snapshot()
+
+    @app.get("/http/connections/stats")
+    def http_connection_stats() -> dict:
+        return {"news": news_service.connection_stats()}
+
+    @app.get("/cache/articles/stats")
+    def article_cache_stats() -> dict:
+        return news_service.article_cache_snapshot()
+
+    # Catch-all mount: must be registered last
+    app.mount("", mcp_app)
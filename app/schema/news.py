@@ -9,6 +9,9 @@ class News(BaseModel):
     )
     description: str = Field(description="Description or summary of the article")
     pub_date: str = Field(alias="pubDate", description="Publication date string")
+    cluster_size: int = Field(
+        default=1, description="Number of near-identical results this one represents"
+    )
 
     class Config:
         populate_by_name = True
@@ -18,3 +21,9 @@ class NewsItem(BaseModel):
     title: str
     text: str
     publish_date: Optional[str]
+
+
+class ScrapedArticle(BaseModel):
+    url: str
+    article: Optional[NewsItem] = None
+    error: Optional[str] = None
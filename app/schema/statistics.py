@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Dict, List, Literal
 from typing import Optional
 from enum import Enum
 
@@ -30,6 +30,7 @@ class StatisticItem(BaseModel):
     start_time: str = Field(alias="START_TIME")
     end_time: str = Field(alias="END_TIME")
     cycle: Optional[Cycle] = Field(alias="CYCLE", default=None)
+    parent_code: Optional[str] = Field(alias="P_ITEM_CODE", default=None)
 
     __str__ = (
         lambda self: f"Name: {self.name}, Code: {self.code}, Range: {self.start_time}~{self.end_time}, Cycle: {self.cycle.value}"
@@ -46,6 +47,22 @@ class StatisticData(BaseModel):
     )
 
 
+class StatisticSeries(BaseModel):
+    """Data of one statistic item, with the parameters it was fetched with"""
+
+    stat_code: str
+    stat_name: Optional[str] = None
+    item_code: str
+    item_name: str
+    cycle: Cycle
+    start_time: str
+    end_time: str
+    unit: str
+    data: Dict[str, Dict[str, str]] = Field(
+        description="Dictionary of {ItemName: {Time: Value}}"
+    )
+
+
 class StatisticQueryParameters(BaseModel):
     cycle: Cycle = Field(description="The selected cycle (Y|S|Q|M|SM|D)")
     item_code: str = Field(description="The selected item code")
@@ -58,13 +75,58 @@ class StatisticQueryParametersList(BaseModel):
     """Multiple query parameters for fetching multiple items at once"""
 
     queries: List[StatisticQueryParameters] = Field(
-        description="List of query parameters. Use multiple entries if user asks for multiple items (e.g., 'GDP and unemployment rate'). Use single entry for single item requests.",
+        description=(
+            "List of query parameters. Use multiple entries if user asks for "
+            "multiple items (e.g., 'GDP and unemployment rate'). "
+            "Use single entry for single item requests."
+        ),
         min_length=1,
     )
+    no_match: bool = Field(
+        default=False,
+        description=(
+            "True if none of the Available Items matches what the user asks for"
+        ),
+    )
 
 
 class SelectedStatistic(BaseModel):
     stat_code: Optional[str] = Field(
         description="The selected statistic code, or null if none match"
     )
+    sub_query: Optional[str] = Field(
+        default=None,
+        description=(
+            "The part of the user query this statistic answers (e.g., '실업률')"
+        ),
+    )
     reason: str = Field(description="Reason for selection or failure")
+
+
+class SelectedStatisticList(BaseModel):
+    """One statistic per indicator the user asks about"""
+
+    selections: List[SelectedStatistic] = Field(
+        description=(
+            "Selected statistics. Use multiple entries only if the user asks about "
+            "indicators from different statistics "
+            "(e.g., 'GDP growth, unemployment rate and CPI'). "
+            "Use a single entry otherwise."
+        ),
+        min_length=1,
+    )
+
+
+class SeriesSpec(BaseModel):
+    """One series of a bulk export, with all parameters given explicitly"""
+
+    stat_code: str
+    item_code: Optional[str] = None
+    cycle: Cycle
+    start_time: str
+    end_time: str
+
+
+class ExportRequest(BaseModel):
+    series: List[SeriesSpec] = Field(min_length=1)
+    format: Literal["ndjson", "csv", "arrow"] = "ndjson"
@@ -0,0 +1,95 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple
+
+from newspaper import Article
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+ParsedFields = Tuple[str, str, Optional[str]]
+
+# Full text is kept (and cached) so passages can be picked per query later
+MAX_TEXT_LENGTH = 20000
+
+
+def parse_article_html(
+    url: str, html: bytes, encoding: Optional[str] = None
+) -> ParsedFields:
+    """
+    Parse raw article HTML into (title, text, publish_date).
+    Module-level and primitive in/out so it can run in a worker process.
+    """
+    article = Article(url, fetch_images=False)
+    article.download(input_html=html.decode(encoding or "utf-8", errors="replace"))
+    article.parse()
+
+    return (
+        article.title,
+        article.text[:MAX_TEXT_LENGTH],
+        str(article.publish_date) if article.publish_date else None,
+    )
+
+
+def _init_worker() -> None:
+    """Import the parsing stack once per worker, before the first request."""
+    import lxml.html  # noqa: F401
+    import nltk  # noqa: F401
+
+    parse_article_html("https://example.com/warmup", b"<html><body></body></html>")
+
+
+class ArticleParser:
+    """
+    Runs article parsing off the event loop.
+    'thread': asyncio.to_thread (cheap, but parses contend on the GIL).
+    'process': a pool of pre-initialized worker processes; only the HTML bytes
+    and the parsed fields cross the process boundary.
+    """
+
+    def __init__(self, backend: str = "thread", workers: Optional[int] = None):
+        if backend not in ("thread", "process"):
+            raise ValueError(f"Unknown parser backend: {backend}")
+        self.backend = backend
+        self.workers = workers or os.cpu_count() or 1
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            logger.info(f"🧵 Starting article parser pool ({self.workers} workers)")
+            # spawn: forking a process with a running event loop and threads is unsafe
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        return self._pool
+
+    async def parse(
+        self, url: str, html: bytes, encoding: Optional[str] = None
+    ) -> ParsedFields:
+        if self.backend == "thread":
+            return await asyncio.to_thread(parse_article_html, url, html, encoding)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_pool(), parse_article_html, url, html, encoding
+        )
+
+    async def warmup(self) -> None:
+        """Start all workers now instead of on the first scrape."""
+        if self.backend != "process":
+            return
+        pool = self._get_pool()
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(loop.run_in_executor(pool, os.getpid) for _ in range(self.workers))
+        )
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -1,23 +1,116 @@
-from typing import List, Optional
+import json
+from typing import Dict, List, Optional, Tuple
 import httpx
+from pydantic import TypeAdapter, ValidationError
+from typing_extensions import TypedDict
 from app.core.logger import get_logger
 from app.core.config import settings
+from app.core.deadline import timeout_for
+from app.core.metrics import observe_upstream
 from app.schema.statistics import Statistic, StatisticItem, StatisticData
 from app.repository.statistics import get_statistics_repository
 
 logger = get_logger(__name__)
 
 
+class EcosApiError(Exception):
+    """Error result returned by the ECOS API (e.g. INFO-200, ERROR-101)."""
+
+    def __init__(self, message: str, code: str):
+        super().__init__(f"{message} (Code: {code})")
+        self.code = code
+
+
+# ECOS response bodies, validated straight from the raw bytes in one call.
+# Search rows stay TypedDicts (plain dicts, only the fields we read): a model
+# instance per row would cost more than the grouping it feeds.
+class EcosResult(TypedDict):
+    CODE: str
+    MESSAGE: str
+
+
+class StatisticSearchRow(TypedDict, total=False):
+    ITEM_NAME1: Optional[str]
+    ITEM_NAME2: Optional[str]
+    ITEM_NAME3: Optional[str]
+    ITEM_NAME4: Optional[str]
+    UNIT_NAME: str
+    TIME: str
+    DATA_VALUE: str
+
+
+class StatisticSearchTable(TypedDict):
+    row: List[StatisticSearchRow]
+
+
+class StatisticItemTable(TypedDict):
+    row: List[StatisticItem]
+
+
+class StatisticSearchResponse(TypedDict, total=False):
+    StatisticSearch: StatisticSearchTable
+    RESULT: EcosResult
+
+
+class StatisticItemListResponse(TypedDict, total=False):
+    StatisticItemList: StatisticItemTable
+    RESULT: EcosResult
+
+
+search_response_adapter = TypeAdapter(StatisticSearchResponse)
+item_list_response_adapter = TypeAdapter(StatisticItemListResponse)
+
+
+def parse_response(adapter: TypeAdapter, content: bytes):
+    """Validate a response body; a malformed body raises JSONDecodeError as before."""
+    try:
+        return adapter.validate_json(content)
+    except ValidationError as e:
+        error = e.errors()[0]
+        if error["type"] == "json_invalid":
+            raise json.JSONDecodeError(
+                error["msg"], content.decode(errors="replace"), 0
+            ) from None
+        raise
+
+
+def build_statistic_data(raw_rows: List[dict]) -> StatisticData:
+    """Group StatisticSearch rows into {item label: {time: value}} in one pass."""
+    formatted_data: Dict[str, Dict[str, str]] = {}
+    # Rows repeat the same few item combinations: join each label only once
+    labels: Dict[Tuple, Dict[str, str]] = {}
+
+    for row in raw_rows:
+        names = (
+            row.get("ITEM_NAME1"),
+            row.get("ITEM_NAME2"),
+            row.get("ITEM_NAME3"),
+            row.get("ITEM_NAME4"),
+        )
+        series = labels.get(names)
+        if series is None:
+            item_label = " > ".join([i for i in names if i]) or "Total"
+            series = formatted_data.setdefault(item_label, {})
+            labels[names] = series
+
+        series[row.get("TIME")] = row.get("DATA_VALUE")
+
+    unit_name = raw_rows[0].get("UNIT_NAME", "")
+    return StatisticData(unit=unit_name, data=formatted_data)
+
+
 class EcosService:
     def __init__(self):
         self.api_key = settings.ECOS_API_KEY
         self.base_url = "http://ecos.bok.or.kr/api"
+        # Set to an httpx.MockTransport to run against a local stand-in
+        self.transport: Optional[httpx.AsyncBaseTransport] = None
 
     def search_statistics(self, query: str, limit: int = 5) -> List[Statistic]:
         """
         Search for available economic statistics by a keyword.
         """
-        logger.info(f"🔍 Searching Statistics: {query}")
+        logger.info("🔍 Searching Statistics: %s", query)
         repo = get_statistics_repository()
         return repo.search(query, limit)
 
@@ -27,24 +120,22 @@ class EcosService:
         """
         # ECOS API Format: /StatisticItemList/{KEY}/json/kr/1/1000/{STAT_CODE}
         url = f"{self.base_url}/StatisticItemList/{self.api_key}/json/kr/1/1000/{stat_code}"
-        logger.info(f"📡 Fetching Statistics Item List: {stat_code}")
+        logger.info("📡 Fetching Statistics Item List: %s", stat_code)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            data = response.json()
+        async with httpx.AsyncClient(
+            transport=self.transport, timeout=timeout_for(settings.ECOS_TIMEOUT)
+        ) as client:
+            with observe_upstream("ecos", stat_code=stat_code):
+                response = await client.get(url)
+                response.raise_for_status()
+                data = parse_response(item_list_response_adapter, response.content)
 
             if "StatisticItemList" in data:
-                items = []
-                for row in data["StatisticItemList"]["row"]:
-                    items.append(StatisticItem(**row))
-                return items
+                return data["StatisticItemList"]["row"]
 
             elif "RESULT" in data:
-                logger.error(f"ECOS API Error (Items): {data['RESULT']['MESSAGE']}")
-                raise Exception(
-                    f"{data['RESULT']['MESSAGE']} (Code: {data['RESULT']['CODE']})"
-                )
+                logger.error("ECOS API Error (Items): %s", data["RESULT"]["MESSAGE"])
+                raise EcosApiError(data["RESULT"]["MESSAGE"], data["RESULT"]["CODE"])
 
             return []
 
@@ -72,38 +163,22 @@ class EcosService:
             parts.append(item_code)
 
         url = base_search_url + "/".join(parts)
-        logger.info(f"📡 Fetching Statistics Data: {url}")
+        # The URL carries the API key; log only the parameters
+        logger.info("📡 Fetching Statistics Data: %s", "/".join(parts))
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            data = response.json()
+        async with httpx.AsyncClient(
+            transport=self.transport, timeout=timeout_for(settings.ECOS_TIMEOUT)
+        ) as client:
+            with observe_upstream("ecos", stat_code=stat_code, cycle=cycle) as span:
+                response = await client.get(url)
+                response.raise_for_status()
+                data = parse_response(search_response_adapter, response.content)
 
             if "StatisticSearch" in data:
                 raw_rows = data["StatisticSearch"]["row"]
-                formatted_data = {}
-                unit_name = raw_rows[0].get("UNIT_NAME", "")
-
-                for row in raw_rows:
-                    items = [
-                        row.get("ITEM_NAME1"),
-                        row.get("ITEM_NAME2"),
-                        row.get("ITEM_NAME3"),
-                        row.get("ITEM_NAME4"),
-                    ]
-                    item_label = " > ".join([i for i in items if i])
-                    if not item_label:
-                        item_label = "Total"
-
-                    time = row.get("TIME")
-                    value = row.get("DATA_VALUE")
-
-                    if item_label not in formatted_data:
-                        formatted_data[item_label] = {}
-
-                    formatted_data[item_label][time] = value
-
-                return StatisticData(unit=unit_name, data=formatted_data)
+                if span is not None:
+                    span.set("rows", len(raw_rows))
+                return build_statistic_data(raw_rows)
 
             elif "RESULT" in data:
                 error_code = data["RESULT"]["CODE"]
@@ -112,11 +187,16 @@ class EcosService:
                 # Add hints for LLM to recover gracefully
                 if error_code == "INFO-200":
                     message += " (Hint: Check the date. DO NOT RETRY with the exact same parameters.)"
+                if error_code == "ERROR-400":
+                    message += (
+                        " (Hint: Narrow the date range. "
+                        "DO NOT RETRY with the exact same parameters.)"
+                    )
                 if error_code == "ERROR-101":
                     message += " (Hint: Check the cycle. DO NOT RETRY with the exact same parameters.)"
 
-                logger.error(f"ECOS API Error (Data): {message}")
-                raise Exception(f"{message} (Code: {error_code})")
+                logger.error("ECOS API Error (Data): %s", message)
+                raise EcosApiError(message, error_code)
 
             logger.error("Unknown ECOS response format")
             raise Exception("Unknown response format")
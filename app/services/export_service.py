@@ -0,0 +1,200 @@
+import asyncio
+import csv
+import io
+import json
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.core.utils import format_date
+from app.schema.statistics import SeriesSpec, StatisticData
+from app.services.ecos_service import ecos_service
+
+logger = get_logger(__name__)
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+# Long format: one row per (series, item, time); errors get a single row
+CSV_COLUMNS = [
+    "index",
+    "stat_code",
+    "item_code",
+    "cycle",
+    "item",
+    "time",
+    "value",
+    "unit",
+    "error",
+]
+
+
+@dataclass
+class SeriesResult:
+    index: int
+    spec: SeriesSpec
+    data: Optional[StatisticData] = None
+    error: Optional[str] = None
+
+    def rows(self) -> Iterable[Tuple]:
+        spec = self.spec
+        head = (self.index, spec.stat_code, spec.item_code or "", spec.cycle.value)
+        if self.data is None:
+            yield head + ("", "", "", "", self.error)
+            return
+        for item, values in self.data.data.items():
+            for time, value in values.items():
+                yield head + (item, time, value, self.data.unit, "")
+
+
+def arrow_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+async def _fetch(index: int, spec: SeriesSpec) -> SeriesResult:
+    cycle = spec.cycle.value
+    try:
+        data = await ecos_service.get_statistic_data(
+            stat_code=spec.stat_code,
+            cycle=cycle,
+            start_time=format_date(spec.start_time, cycle),
+            end_time=format_date(spec.end_time, cycle),
+            item_code=spec.item_code,
+        )
+    except Exception as e:
+        # One failing series must not abort a stream that has already started
+        logger.warning(f"Export of {spec.stat_code}/{spec.item_code} failed: {e}")
+        return SeriesResult(index, spec, error=str(e) or type(e).__name__)
+    return SeriesResult(index, spec, data=data)
+
+
+async def fetch_series(
+    specs: List[SeriesSpec], concurrency: Optional[int] = None
+) -> AsyncIterator[SeriesResult]:
+    """
+    Fetch `specs` with at most `concurrency` requests in flight and yield each
+    result as soon as it completes (not in request order). The hand-off queue
+    is bounded too, so a slow client holds back the fetching instead of
+    letting results pile up in memory.
+    """
+    concurrency = min(concurrency or settings.EXPORT_CONCURRENCY, len(specs))
+    pending = iter(enumerate(specs))
+    results: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+
+    async def worker() -> None:
+        for index, spec in pending:
+            await results.put(await _fetch(index, spec))
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    try:
+        for _ in specs:
+            yield await results.get()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+def encode_ndjson(result: SeriesResult) -> bytes:
+    record = {"index": result.index, **result.spec.model_dump(mode="json")}
+    if result.data is None:
+        record["error"] = result.error
+    else:
+        record["unit"] = result.data.unit
+        record["data"] = result.data.data
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode()
+
+
+class CsvEncoder:
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def _take(self) -> bytes:
+        chunk = self._buffer.getvalue().encode()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return chunk
+
+    def header(self) -> bytes:
+        self._writer.writerow(CSV_COLUMNS)
+        return self._take()
+
+    def encode(self, result: SeriesResult) -> bytes:
+        self._writer.writerows(result.rows())
+        return self._take()
+
+    def close(self) -> bytes:
+        return b""
+
+
+class ArrowEncoder:
+    """Arrow IPC stream: the schema first, then one record batch per series."""
+
+    def __init__(self):
+        import pyarrow as pa
+
+        self._pa = pa
+        self._schema = pa.schema(
+            [
+                ("index", pa.int32()),
+                ("stat_code", pa.string()),
+                ("item_code", pa.string()),
+                ("cycle", pa.string()),
+                ("item", pa.string()),
+                ("time", pa.string()),
+                ("value", pa.string()),
+                ("unit", pa.string()),
+                ("error", pa.string()),
+            ]
+        )
+        self._sink = io.BytesIO()
+        self._writer = pa.ipc.new_stream(self._sink, self._schema)
+
+    def _take(self) -> bytes:
+        chunk = self._sink.getvalue()
+        self._sink.seek(0)
+        self._sink.truncate()
+        return chunk
+
+    def header(self) -> bytes:
+        # Whatever the writer has emitted up front (the schema message)
+        return self._take()
+
+    def encode(self, result: SeriesResult) -> bytes:
+        columns = list(zip(*result.rows()))
+        if not columns:
+            return b""
+        self._writer.write_batch(
+            self._pa.record_batch(
+                [self._pa.array(column) for column in columns], schema=self._schema
+            )
+        )
+        return self._take()
+
+    def close(self) -> bytes:
+        self._writer.close()
+        return self._take()
+
+
+async def stream_export(specs: List[SeriesSpec], format: str) -> AsyncIterator[bytes]:
+    """Encoded chunks of the export, one (or a header) per completed series."""
+    logger.info(f"📦 Exporting {len(specs)} series as {format}")
+    if format == "ndjson":
+        async for result in fetch_series(specs):
+            yield encode_ndjson(result)
+        return
+
+    encoder = CsvEncoder() if format == "csv" else ArrowEncoder()
+    yield encoder.header()
+    async for result in fetch_series(specs):
+        yield encoder.encode(result)
+    yield encoder.close()
@@ -0,0 +1,82 @@
+import hashlib
+import html
+import re
+from typing import List
+
+from app.core.utils import canonicalize_url
+from app.schema.news import News
+
+TAG_PATTERN = re.compile(r"<[^>]+>")
+NORMALIZE_PATTERN = re.compile(r"[\s\W_]+")
+
+SIMHASH_BITS = 64
+SHINGLE_SIZE = 3
+
+
+def _normalize(text: str) -> str:
+    # Naver highlights query terms with <b> and escapes entities
+    text = html.unescape(TAG_PATTERN.sub("", text))
+    return NORMALIZE_PATTERN.sub("", text.lower())
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash over character shingles (works for Korean without a tokenizer)."""
+    normalized = _normalize(text)
+    if len(normalized) < SHINGLE_SIZE:
+        shingles = [normalized] if normalized else []
+    else:
+        shingles = [
+            normalized[i : i + SHINGLE_SIZE]
+            for i in range(len(normalized) - SHINGLE_SIZE + 1)
+        ]
+
+    weights = [0] * SIMHASH_BITS
+    for shingle in shingles:
+        digest = hashlib.blake2b(shingle.encode(), digest_size=8).digest()
+        value = int.from_bytes(digest, "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def cluster_news(items: List[News], max_distance: int) -> List[News]:
+    """
+    Collapse duplicate and syndicated results.
+    Results with the same canonical link, or whose title+description SimHash is
+    within max_distance bits, form a cluster. The first (highest ranked) result
+    of each cluster is kept, with cluster_size set to the number of results it
+    stands for.
+    """
+    representatives: List[News] = []
+    fingerprints: List[int] = []
+    links = {}
+
+    for item in items:
+        link = canonicalize_url(item.original_link) if item.original_link else None
+        fingerprint = simhash(f"{item.title} {item.description}")
+
+        index = links.get(link) if link else None
+        if index is None:
+            index = next(
+                (
+                    i
+                    for i, other in enumerate(fingerprints)
+                    if hamming_distance(fingerprint, other) <= max_distance
+                ),
+                None,
+            )
+
+        if index is None:
+            if link:
+                links[link] = len(representatives)
+            representatives.append(item.model_copy(update={"cluster_size": 1}))
+            fingerprints.append(fingerprint)
+        else:
+            representatives[index].cluster_size += 1
+
+    return representatives
@@ -1,16 +1,39 @@
 import asyncio
-from typing import List
+import re
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 import httpx
-import nltk
-from newspaper import Article
 
 from app.core.config import settings
-from app.schema.news import News, NewsItem
+from app.core.deadline import timeout_for
+from app.core.http import (
+    ConnectionStats,
+    create_async_client,
+    is_html_response,
+    read_capped,
+)
+from app.services.article_parser import ArticleParser
+from app.services.news_dedup import cluster_news
+from app.services.passage_ranker import select_passages
+from app.core.utils import canonicalize_url
+from app.repository.article_cache import ArticleCacheStats, get_article_cache
+from app.schema.news import News, NewsItem, ScrapedArticle
 from app.core.logger import get_logger
+from app.core.metrics import observe_upstream
+from app.core.tracing import tracer
 
 logger = get_logger(__name__)
 
-nltk.download("punkt_tab", quiet=True)
+# End of the main content region; nothing after it is needed for parsing.
+# Not </article>: pages often render "most read"/related <article> cards
+# before the story, and stopping there would drop the body.
+MAIN_CONTENT_END = re.compile(rb"</main>|</body>", re.I)
+
+# Naver Search API maximum for 'display'
+MAX_SEARCH_DISPLAY = 100
 
 
 class NewsService:
@@ -23,61 +46,315 @@ class NewsService:
             "X-Naver-Client-Secret": self.client_secret,
         }
 
+        self.api_stats = ConnectionStats("naver_api")
+        self.article_stats = ConnectionStats("article")
+        self._api_client: Optional[httpx.AsyncClient] = None
+        self._article_client: Optional[httpx.AsyncClient] = None
+        # Set to an httpx.MockTransport to run against a local stand-in
+        self.transport: Optional[httpx.AsyncBaseTransport] = None
+        self.article_cache_stats = ArticleCacheStats()
+        # (query, sort) -> (fetched_at, requested display, clustered results)
+        self._search_cache: OrderedDict[
+            Tuple[str, str], Tuple[float, int, List[News]]
+        ] = OrderedDict()
+        self.parser = ArticleParser(
+            backend=settings.NEWS_PARSER_BACKEND, workers=settings.NEWS_PARSER_WORKERS
+        )
+        # Batch scraping caps, shared by all batches (semaphores bind to a loop)
+        self._scrape_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._scrape_limit: Optional[asyncio.Semaphore] = None
+        # domain -> (limit, batches using it); dropped when no longer used
+        self._domain_limits: Dict[str, List] = {}
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=settings.NEWS_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.NEWS_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.NEWS_KEEPALIVE_EXPIRY,
+        )
+
+    @property
+    def api_client(self) -> httpx.AsyncClient:
+        """Shared client for the Naver Search API."""
+        if self._api_client is None or self._api_client.is_closed:
+            self._api_client = create_async_client(
+                timeout=httpx.Timeout(settings.NEWS_API_TIMEOUT),
+                limits=self._limits(),
+                http2=settings.NEWS_HTTP2,
+                headers=self.headers,
+                transport=self.transport,
+            )
+        return self._api_client
+
+    @property
+    def article_client(self) -> httpx.AsyncClient:
+        """Shared client for news article hosts (short timeouts, redirects)."""
+        if self._article_client is None or self._article_client.is_closed:
+            self._article_client = create_async_client(
+                timeout=httpx.Timeout(settings.NEWS_ARTICLE_TIMEOUT),
+                limits=self._limits(),
+                http2=settings.NEWS_HTTP2,
+                follow_redirects=True,
+                transport=self.transport,
+            )
+        return self._article_client
+
+    @asynccontextmanager
+    async def _scrape_slot(self, url: str) -> AsyncIterator[None]:
+        """
+        Hold a batch scrape slot for `url`: at most NEWS_SCRAPE_MAX_CONCURRENCY
+        scrapes in total and NEWS_SCRAPE_MAX_PER_DOMAIN per host, across all
+        concurrent batches.
+        """
+        loop = asyncio.get_running_loop()
+        if self._scrape_loop is not loop:
+            self._scrape_loop = loop
+            self._scrape_limit = asyncio.Semaphore(settings.NEWS_SCRAPE_MAX_CONCURRENCY)
+            self._domain_limits = {}
+
+        domain = (urlsplit(url).hostname or "").lower()
+        entry = self._domain_limits.get(domain)
+        if entry is None:
+            entry = [asyncio.Semaphore(settings.NEWS_SCRAPE_MAX_PER_DOMAIN), 0]
+            self._domain_limits[domain] = entry
+        entry[1] += 1
+        try:
+            async with entry[0], self._scrape_limit:
+                yield
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._domain_limits[domain]
+
+    async def aclose(self) -> None:
+        """Close the shared clients and the parser pool (app lifespan)."""
+        for client in (self._api_client, self._article_client):
+            if client is not None:
+                await client.aclose()
+        self._api_client = None
+        self._article_client = None
+        self.parser.shutdown()
+
+    def connection_stats(self) -> dict:
+        return {
+            "naver_api": self.api_stats.snapshot(),
+            "article": self.article_stats.snapshot(),
+        }
+
+    def article_cache_snapshot(self) -> dict:
+        cache = get_article_cache()
+        if cache is None:
+            return {"enabled": False}
+        return {
+            "enabled": True,
+            **self.article_cache_stats.snapshot(cache.count(), cache.evictions),
+        }
+
     async def search_news(
         self, query: str, display: int = 5, sort: str = "sim"
     ) -> List[News]:
         """
         Search Naver News for the given query.
+        Syndicated copies of the same story are collapsed into one result
+        (see cluster_size), and results are cached briefly per (query, sort).
         """
-        params = {"query": query, "display": display, "sort": sort}
-        logger.info(f"📰 Searching News: {query}")
+        cache_key = (query.strip(), sort)
+        cached = self._search_cache.get(cache_key)
+        if cached:
+            fetched_at, cached_display, cached_items = cached
+            if (
+                time.time() - fetched_at < settings.NEWS_SEARCH_CACHE_TTL_SECONDS
+                and cached_display >= display
+            ):
+                self._search_cache.move_to_end(cache_key)
+                logger.info("📰 Search cache hit: %s", query)
+                return cached_items[:display]
+
+        # Over-fetch so that 'display' distinct stories remain after clustering
+        fetch_count = display * 3 if settings.NEWS_SEARCH_DEDUP else display
+        params = {
+            "query": query,
+            "display": min(fetch_count, MAX_SEARCH_DISPLAY),
+            "sort": sort,
+        }
+        logger.info("📰 Searching News: %s", query)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                self.api_url, headers=self.headers, params=params
+        with observe_upstream("naver", query=query):
+            response = await self.api_client.get(
+                self.api_url,
+                params=params,
+                timeout=timeout_for(settings.NEWS_API_TIMEOUT),
+                extensions=self.api_stats.extensions,
             )
             response.raise_for_status()
-            data = response.json()
-            items = data.get("items", [])
+        data = response.json()
+        items = data.get("items", [])
 
-            news_items = []
-            for item in items:
-                news_items.append(News(**item))
+        news_items = []
+        for item in items:
+            news_items.append(News(**item))
 
-            logger.info(f"📰 Found {len(news_items)} articles.")
-            return news_items
+        if settings.NEWS_SEARCH_DEDUP:
+            news_items = cluster_news(news_items, settings.NEWS_SEARCH_SIMHASH_DISTANCE)
 
-    async def scrape_article(self, url: str) -> NewsItem:
+        self._search_cache[cache_key] = (time.time(), display, news_items)
+        self._search_cache.move_to_end(cache_key)
+        while len(self._search_cache) > settings.NEWS_SEARCH_CACHE_MAX_ENTRIES:
+            self._search_cache.popitem(last=False)
+
+        logger.info(
+            "📰 Found %d distinct articles (%d results).", len(news_items), len(items)
+        )
+        return news_items[:display]
+
+    async def scrape_article(self, url: str, query: Optional[str] = None) -> NewsItem:
+        """
+        Scrape article content, trimmed to NEWS_ARTICLE_TEXT_BUDGET characters.
+        With a query, the sentences most relevant to it are kept (BM25) instead
+        of the lead of the article.
+        """
+        item = await self._load_article(url)
+        budget = settings.NEWS_ARTICLE_TEXT_BUDGET
+        if query:
+            text = select_passages(item.text, query, budget)
+        else:
+            text = item.text[:budget]
+        return item.model_copy(update={"text": text})
+
+    async def _load_article(self, url: str) -> NewsItem:
         """
-        Scrape article content using httpx (async) + newspaper4k (parsing).
+        Fetch article content using httpx (async) + newspaper4k (parsing).
+        Parsed articles are cached by canonical URL; stale entries are
+        revalidated with a conditional GET, so unchanged pages skip the parse.
+        The body is streamed and cut at NEWS_ARTICLE_MAX_BYTES or at the end of
+        the main content region, whichever comes first.
         """
-        logger.info(f"🧹 Scraping Article: {url}")
+        cache = get_article_cache()
+        cache_key = canonicalize_url(url)
+        cached = await asyncio.to_thread(cache.get, cache_key) if cache else None
+
+        if (
+            cached
+            and time.time() - cached.fetched_at
+            < settings.NEWS_ARTICLE_CACHE_FRESH_SECONDS
+        ):
+            self.article_cache_stats.hits += 1
+            tracer.set_attribute("cache", "hit")
+            logger.info("🧹 Article cache hit: %s", url)
+            return cached.item
+
+        headers: Dict[str, str] = {}
+        if cached and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        logger.info("🧹 Scraping Article: %s", url)
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, timeout=2.0, follow_redirects=True)
-                response.raise_for_status()
-                html = response.text
+            with observe_upstream("article", url=url) as span:
+                async with self.article_client.stream(
+                    "GET",
+                    url,
+                    headers=headers,
+                    timeout=timeout_for(settings.NEWS_ARTICLE_TIMEOUT),
+                    extensions=self.article_stats.extensions,
+                ) as response:
+                    if response.status_code == 304 and cached:
+                        self.article_cache_stats.revalidated += 1
+                        tracer.set_attribute("cache", "revalidated")
+                        await asyncio.to_thread(cache.touch, cache_key)
+                        return cached.item
+                    response.raise_for_status()
+                    if not is_html_response(response):
+                        raise ValueError(
+                            f"Not an HTML page ({response.headers.get('Content-Type')})"
+                        )
+
+                    if settings.NEWS_ARTICLE_STREAMING:
+                        html, truncated = await read_capped(
+                            response, settings.NEWS_ARTICLE_MAX_BYTES, MAIN_CONTENT_END
+                        )
+                        if truncated:
+                            logger.info("🧹 Read %d bytes (stopped early)", len(html))
+                    else:
+                        html = await response.aread()
+                    if span is not None:
+                        span.set("bytes", len(html))
         except Exception as e:
-            logger.error(f"Error scraping {url}: {e}")
+            logger.error("Error scraping %s: %s", url, e)
             raise e
 
-        # Run parsing in thread to avoid blocking the loop
-        return await asyncio.to_thread(self._scrape_article_sync, url, html)
+        self.article_cache_stats.misses += 1
 
-    def _scrape_article_sync(self, url: str, html: str) -> NewsItem:
+        # Parse off the event loop (thread or process pool, see NEWS_PARSER_BACKEND)
+        title, text, publish_date = await self.parser.parse(
+            url, html, response.encoding
+        )
+        item = NewsItem(title=title, text=text, publish_date=publish_date)
+
+        if cache:
+            await asyncio.to_thread(
+                cache.put,
+                cache_key,
+                item,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+        return item
+
+    async def scrape_articles(
+        self,
+        urls: List[str],
+        query: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> List[ScrapedArticle]:
         """
-        Internal synchronous method for parsing.
+        Scrape several articles concurrently, capped globally and per domain.
+        Whatever has not finished when the batch deadline passes is cancelled and
+        reported as an error; completed articles are always returned.
         """
-        article = Article(url, fetch_images=False)
-        article.download(input_html=html)
-        article.parse()
-
-        return NewsItem(
-            title=article.title,
-            text=article.text[:1000],
-            publish_date=str(article.publish_date) if article.publish_date else None,
+        if timeout is None:
+            timeout = timeout_for(settings.NEWS_SCRAPE_BATCH_TIMEOUT)
+
+        # Same article linked twice (tracking params, fragments) is fetched once
+        unique_urls = list({canonicalize_url(url): url for url in urls}.values())
+        skipped = unique_urls[settings.NEWS_SCRAPE_MAX_URLS :]
+        unique_urls = unique_urls[: settings.NEWS_SCRAPE_MAX_URLS]
+        logger.info("🧹 Scraping %d articles (batch)", len(unique_urls))
+
+        async def scrape_one(url: str) -> NewsItem:
+            async with self._scrape_slot(url):
+                return await self.scrape_article(url, query)
+
+        tasks = {url: asyncio.create_task(scrape_one(url)) for url in unique_urls}
+        if tasks:
+            _, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        results = []
+        for url, task in tasks.items():
+            if task.cancelled():
+                results.append(
+                    ScrapedArticle(url=url, error=f"Timed out after {timeout:.1f}s")
+                )
+            elif task.exception() is not None:
+                results.append(ScrapedArticle(url=url, error=str(task.exception())))
+            else:
+                results.append(ScrapedArticle(url=url, article=task.result()))
+
+        # Over the batch limit: reported, not silently dropped
+        limit = settings.NEWS_SCRAPE_MAX_URLS
+        results.extend(
+            ScrapedArticle(url=url, error=f"skipped: batch limit of {limit} URLs")
+            for url in skipped
         )
 
+        succeeded = sum(1 for result in results if result.article)
+        logger.info("🧹 Scraped %d/%d articles (batch)", succeeded, len(results))
+        return results
+
 
 news_service = NewsService()
@@ -0,0 +1,125 @@
+import math
+import re
+from collections import Counter
+from typing import List
+
+import nltk
+
+from app.core.config import settings
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+TOKEN_PATTERN = re.compile(r"[0-9]+(?:[.,][0-9]+)*%?|[^\W\d_]+")
+HANGUL_PATTERN = re.compile(r"[가-힣]")
+# Fallback when the punkt model is unavailable (offline): split after ., ?, !
+SENTENCE_PATTERN = re.compile(r"(?<=[.?!])\s+|\n+")
+
+BM25_K1 = 1.5
+BM25_B = 0.75
+PASSAGE_SEPARATOR = " … "
+
+
+def ensure_sentence_model() -> None:
+    """Download the punkt model if missing (startup warmup, never at import)."""
+    try:
+        nltk.data.find("tokenizers/punkt_tab")
+    except LookupError:
+        if settings.NLTK_DOWNLOAD:
+            nltk.download("punkt_tab", quiet=True)
+
+
+def split_sentences(text: str) -> List[str]:
+    try:
+        sentences = nltk.sent_tokenize(text)
+    except LookupError:
+        sentences = SENTENCE_PATTERN.split(text)
+    # punkt keeps newlines inside sentences for Korean text
+    return [
+        part.strip()
+        for sentence in sentences
+        for part in sentence.split("\n")
+        if part.strip()
+    ]
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercased words and numbers. Korean words also yield character bigrams,
+    so '기준금리를' still matches '기준금리' without a morphological analyzer.
+    """
+    tokens = []
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        tokens.append(token)
+        if HANGUL_PATTERN.match(token) and len(token) > 2:
+            tokens.extend(token[i : i + 2] for i in range(len(token) - 1))
+    return tokens
+
+
+def bm25_scores(query_tokens: List[str], documents: List[List[str]]) -> List[float]:
+    if not documents:
+        return []
+    avg_length = sum(len(doc) for doc in documents) / len(documents) or 1.0
+    document_frequency = Counter(token for doc in documents for token in set(doc))
+
+    scores = []
+    for doc in documents:
+        counts = Counter(doc)
+        score = 0.0
+        for token in set(query_tokens):
+            frequency = counts.get(token)
+            if not frequency:
+                continue
+            df = document_frequency[token]
+            idf = math.log(1 + (len(documents) - df + 0.5) / (df + 0.5))
+            score += (
+                idf
+                * frequency
+                * (BM25_K1 + 1)
+                / (frequency + BM25_K1 * (1 - BM25_B + BM25_B * len(doc) / avg_length))
+            )
+        scores.append(score)
+    return scores
+
+
+def select_passages(text: str, query: str, budget: int) -> str:
+    """
+    Pick the sentences most relevant to the query (BM25) that fit in `budget`
+    characters, returned in their original order. Falls back to the lead of
+    the article when nothing in it matches the query.
+    """
+    if len(text) <= budget:
+        return text
+
+    sentences = split_sentences(text)
+    scores = bm25_scores(tokenize(query), [tokenize(s) for s in sentences])
+    if not any(scores):
+        return text[:budget]
+
+    # Highest score first; earlier sentences win ties
+    ranked = sorted(range(len(sentences)), key=lambda i: (-scores[i], i))
+    chosen = []
+    used = 0
+    for i in ranked:
+        if scores[i] <= 0:
+            break
+        cost = len(sentences[i]) + len(PASSAGE_SEPARATOR)
+        if used + cost > budget:
+            continue
+        chosen.append(i)
+        used += cost
+
+    if not chosen:
+        return text[:budget]
+
+    # Keep adjacent sentences together, mark gaps between passages
+    chosen.sort()
+    passages = [sentences[chosen[0]]]
+    for previous, current in zip(chosen, chosen[1:]):
+        if current == previous + 1:
+            passages[-1] += " " + sentences[current]
+        else:
+            passages.append(sentences[current])
+
+    logger.debug(f"Selected {len(chosen)}/{len(sentences)} sentences for the query")
+    return PASSAGE_SEPARATOR.join(passages)
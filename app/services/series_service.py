@@ -0,0 +1,117 @@
+import asyncio
+from typing import List, Optional
+
+from app.core.config import settings
+from app.core.logger import get_logger
+from app.core.utils import format_date, shift_period
+from app.repository.statistics import get_statistics_repository
+from app.schema.statistics import (
+    Cycle,
+    Statistic,
+    StatisticItem,
+    StatisticSeries,
+)
+from app.services.ecos_service import ecos_service
+from app.workflow.ecos.item_ranker import best_item
+
+logger = get_logger(__name__)
+
+
+class SeriesService:
+    """
+    Fetches one statistic series from partially specified parameters.
+    Missing pieces are resolved from the local catalog, the vector search and
+    the ECOS item list only, so no LLM is involved.
+    """
+
+    async def resolve_statistic(
+        self, stat_code: Optional[str], query: Optional[str]
+    ) -> Optional[Statistic]:
+        """Catalog entry of `stat_code`, or the best search hit for `query`."""
+        repo = get_statistics_repository()
+        if stat_code:
+            # Codes missing from the catalog can still be fetched from ECOS
+            return repo.stats_by_code.get(stat_code)
+        if not query:
+            raise ValueError("Give a stat_code or a query to search for one.")
+
+        # Embedding the query is a blocking HTTP call
+        found = await asyncio.to_thread(repo.search, query, 1)
+        if not found:
+            raise ValueError(f"No statistic found for '{query}'.")
+        return found[0]
+
+    def resolve_item(
+        self,
+        items: List[StatisticItem],
+        item_code: Optional[str],
+        cycle: Optional[str],
+        query: Optional[str],
+    ) -> StatisticItem:
+        """The requested item (or the best match for the query) in `cycle`."""
+        # The item list has one row per item and cycle
+        if cycle:
+            items = [item for item in items if item.cycle and item.cycle.value == cycle]
+        if item_code:
+            items = [item for item in items if item.code == item_code]
+
+        if not items:
+            raise ValueError(
+                f"No item '{item_code or '*'}' with cycle '{cycle or '*'}' "
+                "in this statistic."
+            )
+        return best_item(query or "", items)
+
+    async def get_series(
+        self,
+        stat_code: Optional[str] = None,
+        query: Optional[str] = None,
+        item_code: Optional[str] = None,
+        cycle: Optional[str] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+    ) -> StatisticSeries:
+        stat = await self.resolve_statistic(stat_code, query)
+        stat_code = stat_code or stat.stat_code
+
+        items = await ecos_service.get_statistic_item_list(stat_code)
+        item = self.resolve_item(items, item_code, cycle, query)
+        if not cycle:
+            cycle = (item.cycle or (stat.cycle if stat else Cycle.MONTH)).value
+
+        # Default range: the latest periods the item has data for
+        end_time = format_date(end_time or item.end_time, cycle)
+        if start_time:
+            start_time = format_date(start_time, cycle)
+        else:
+            start_time = shift_period(
+                end_time, cycle, 1 - settings.ECOS_SERIES_DEFAULT_PERIODS
+            )
+            if item.start_time and start_time < item.start_time:
+                start_time = item.start_time
+
+        logger.info(
+            f"📈 Series: {stat_code}/{item.code} ({item.name}) "
+            f"{cycle} {start_time}~{end_time}"
+        )
+        data = await ecos_service.get_statistic_data(
+            stat_code=stat_code,
+            cycle=cycle,
+            start_time=start_time,
+            end_time=end_time,
+            item_code=item.code,
+        )
+        return StatisticSeries(
+            stat_code=stat_code,
+            stat_name=stat.stat_name if stat else None,
+            item_code=item.code,
+            item_name=item.name,
+            cycle=cycle,
+            start_time=start_time,
+            end_time=end_time,
+            unit=data.unit,
+            data=data.data,
+        )
+
+
+series_service = SeriesService()
@@ -1,6 +1,16 @@
+from typing import List, Union
+
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, START, END
-from langgraph.checkpoint.memory import MemorySaver
-from app.workflow.ecos.state import EcosState
+from langgraph.types import Send
+from app.core.callbacks import (
+    MetricsCallback,
+    TokenUsageCallback,
+    TracingCallback,
+)
+from app.core.dependencies import get_checkpointer
+from app.workflow.ecos.retry import FailureKind, route_on_failure
+from app.workflow.ecos.state import EcosState, StatisticBranchState
 from app.workflow.ecos.nodes import (
     fetch_statistics_node,
     select_statistic_node,
@@ -12,67 +22,151 @@ from app.workflow.ecos.nodes import (
 
 
 def route_after_fetch_statistics(state: EcosState) -> str:
-    if state.get("error_message") or not state.get("found_statistics"):
-        retry_count = state.get("retry_count", 0)
-        if retry_count < 3:
-            state["retry_count"] += 1
-            return "fetch_statistics"
-        return END
-
-    return "select_statistic"
-
-
-def route_after_select_statistic(state: EcosState) -> str:
-    if state.get("error_message") or not state.get("selected_statistic"):
-        retry_count = state.get("retry_count", 0)
-        if retry_count < 3:
-            state["retry_count"] += 1
-            return "select_statistic"
-        return END
-
-    return "fetch_items"
-
-
-def route_after_fetch_items(state: EcosState) -> str:
-    if state.get("error_message") or not state.get("found_items"):
-        retry_count = state.get("retry_count", 0)
-        if retry_count < 3:
-            state["retry_count"] += 1
-            return "fetch_items"
-        return END
-
-    return "select_parameters"
+    return route_on_failure(
+        state,
+        "fetch_statistics",
+        on_success="select_statistic",
+        retry_targets={FailureKind.TRANSIENT: "fetch_statistics"},
+        on_give_up=END,
+        on_deadline="generate",
+    )
+
+
+def route_after_select_statistic(state: EcosState) -> Union[str, List[Send]]:
+    next_step = route_on_failure(
+        state,
+        "select_statistic",
+        on_success="statistic_branch",
+        retry_targets={
+            FailureKind.TRANSIENT: "select_statistic",
+            FailureKind.BAD_PARAMETERS: "select_statistic",
+        },
+        on_give_up=END,
+        on_deadline="generate",
+    )
+    if next_step != "statistic_branch":
+        return next_step
+
+    # Fan out: one parallel branch per selected statistic
+    return [
+        Send(
+            "statistic_branch",
+            {
+                "query": state["query"],
+                "sub_query": lookup["sub_query"],
+                "selected_statistic": lookup["statistic"],
+                "retry_counts": {},
+                "failed_requests": [],
+                "error_message": None,
+                "error_kind": None,
+            },
+        )
+        for lookup in state["selected_statistics"]
+    ]
+
+
+def route_after_fetch_items(state: StatisticBranchState) -> str:
+    return route_on_failure(
+        state,
+        "fetch_items",
+        on_success="select_parameters",
+        retry_targets={FailureKind.TRANSIENT: "fetch_items"},
+        on_give_up=END,
+    )
+
+
+def route_after_select_parameters(state: StatisticBranchState) -> str:
+    return route_on_failure(
+        state,
+        "select_parameters",
+        on_success="fetch_data",
+        retry_targets={
+            FailureKind.TRANSIENT: "select_parameters",
+            FailureKind.BAD_PARAMETERS: "select_parameters",
+        },
+        on_give_up=END,
+    )
+
+
+def route_after_fetch_data(state: StatisticBranchState) -> str:
+    return route_on_failure(
+        state,
+        "fetch_data",
+        on_success=END,
+        retry_targets={
+            FailureKind.TRANSIENT: "fetch_data",
+            # The parameters must change: let the LLM pick again with the error
+            FailureKind.BAD_PARAMETERS: "select_parameters",
+            FailureKind.NO_DATA: "select_parameters",
+        },
+        on_give_up=END,
+    )
+
+
+# Branch: items -> parameters -> data for a single statistic
+branch_builder = StateGraph(StatisticBranchState)
+
+branch_builder.add_node("fetch_items", fetch_items_node)
+branch_builder.add_node("select_parameters", select_parameters_node)
+branch_builder.add_node("fetch_data", fetch_data_node)
+
+branch_builder.add_edge(START, "fetch_items")
+
+branch_builder.add_conditional_edges(
+    "fetch_items",
+    route_after_fetch_items,
+    {
+        "select_parameters": "select_parameters",
+        "fetch_items": "fetch_items",
+        END: END,
+    },
+)
 
+branch_builder.add_conditional_edges(
+    "select_parameters",
+    route_after_select_parameters,
+    {"fetch_data": "fetch_data", "select_parameters": "select_parameters", END: END},
+)
 
-def route_after_select_parameters(state: EcosState) -> str:
-    if state.get("error_message") or not state.get("selected_parameters"):
-        retry_count = state.get("retry_count", 0)
-        if retry_count < 3:
-            state["retry_count"] += 1
-            return "select_parameters"
-        return END
+branch_builder.add_conditional_edges(
+    "fetch_data",
+    route_after_fetch_data,
+    {
+        "fetch_data": "fetch_data",
+        "select_parameters": "select_parameters",
+        END: END,
+    },
+)
 
-    return "fetch_data"
+statistic_branch = branch_builder.compile()
 
 
-def route_after_fetch_data(state: EcosState) -> str:
-    if state.get("error_message") or not state.get("fetched_items"):
-        retry_count = state.get("retry_count", 0)
-        if retry_count < 3:
-            state["retry_count"] += 1
-            return "select_parameters"
-        return "generate"
+async def statistic_branch_node(
+    state: StatisticBranchState, config: RunnableConfig
+) -> dict:
+    """Run one statistic lookup and hand its result to the parent graph"""
+    result = await statistic_branch.ainvoke(state, config=config)
+    fetched_items = result.get("fetched_items") or []
 
-    return "generate"
+    return {
+        "statistic_results": [
+            {
+                "statistic": state["selected_statistic"],
+                "sub_query": state.get("sub_query"),
+                "fetched_items": fetched_items,
+                "error_message": None
+                if fetched_items
+                else result.get("error_message") or "No data fetched.",
+            }
+        ]
+    }
 
 
 builder = StateGraph(EcosState)
 
 builder.add_node("fetch_statistics", fetch_statistics_node)
 builder.add_node("select_statistic", select_statistic_node)
-builder.add_node("fetch_items", fetch_items_node)
-builder.add_node("select_parameters", select_parameters_node)
-builder.add_node("fetch_data", fetch_data_node)
+builder.add_node("statistic_branch", statistic_branch_node)
 builder.add_node("generate", generate_node)
 
 builder.add_edge(START, "fetch_statistics")
@@ -83,6 +177,7 @@ builder.add_conditional_edges(
     {
         "select_statistic": "select_statistic",
         "fetch_statistics": "fetch_statistics",
+        "generate": "generate",
         END: END,
     },
 )
@@ -90,39 +185,17 @@ builder.add_conditional_edges(
 builder.add_conditional_edges(
     "select_statistic",
     route_after_select_statistic,
-    {
-        "fetch_items": "fetch_items",
-        "select_statistic": "select_statistic",
-        END: END,
-    },
-)
-
-builder.add_conditional_edges(
-    "fetch_items",
-    route_after_fetch_items,
-    {
-        "select_parameters": "select_parameters",
-        "fetch_items": "fetch_items",
-        END: END,
-    },
-)
-
-builder.add_conditional_edges(
-    "select_parameters",
-    route_after_select_parameters,
-    {"fetch_data": "fetch_data", "select_parameters": "select_parameters", END: END},
-)
-
-builder.add_conditional_edges(
-    "fetch_data",
-    route_after_fetch_data,
-    {
-        "select_parameters": "select_parameters",
-        "generate": "generate",
-        END: END,
-    },
+    ["statistic_branch", "select_statistic", "generate", END],
 )
 
+# Runs once all branches of the fan-out have finished
+builder.add_edge("statistic_branch", "generate")
 builder.add_edge("generate", END)
 
-ecos_graph = builder.compile(checkpointer=MemorySaver())
+ecos_graph = builder.compile(checkpointer=get_checkpointer("ecos_graph")).with_config(
+    callbacks=[
+        TokenUsageCallback("ecos_graph"),
+        MetricsCallback("ecos_graph"),
+        TracingCallback("ecos_graph"),
+    ]
+)
@@ -0,0 +1,91 @@
+import re
+from typing import Dict, List, Optional, Set
+
+from app.schema.statistics import StatisticItem
+
+# Items that aggregate their siblings; always shown so the LLM can pick a total
+TOTAL_NAME_PATTERN = re.compile(r"(총계|합계|총지수|전체|전산업|^계$|total)", re.I)
+NORMALIZE_PATTERN = re.compile(r"[\s\W_]+")
+
+
+def _grams(text: str) -> Set[str]:
+    """Character bigrams (plus unigrams), which work for Korean without a tokenizer."""
+    normalized = NORMALIZE_PATTERN.sub("", text.lower())
+    grams = set(normalized)
+    grams.update(normalized[i : i + 2] for i in range(len(normalized) - 1))
+    return grams
+
+
+def score_item(query: str, query_grams: Set[str], item: StatisticItem) -> float:
+    """Lexical relevance of an item name to the query (0 ~ 2)."""
+    name = item.name
+    item_grams = _grams(name)
+    if not item_grams or not query_grams:
+        return 0.0
+
+    # Dice coefficient over character n-grams
+    score = 2 * len(query_grams & item_grams) / (len(query_grams) + len(item_grams))
+
+    # Exact mention of the whole item name is the strongest signal
+    if NORMALIZE_PATTERN.sub("", name.lower()) in NORMALIZE_PATTERN.sub(
+        "", query.lower()
+    ):
+        score += 1.0
+    return score
+
+
+def rank_items(
+    query: str, items: List[StatisticItem], top_k: int
+) -> List[StatisticItem]:
+    """
+    Keep the top_k items most relevant to the query, plus their hierarchy parents
+    and total items. The original order is preserved.
+    """
+    codes = list(dict.fromkeys(item.code for item in items))
+    if len(codes) <= top_k:
+        return items
+
+    query_grams = _grams(query)
+    best_scores: Dict[str, float] = {}
+    for item in items:
+        score = score_item(query, query_grams, item)
+        if score > best_scores.get(item.code, -1.0):
+            best_scores[item.code] = score
+
+    ranked = sorted(codes, key=lambda code: best_scores[code], reverse=True)
+    keep = set(ranked[:top_k])
+
+    # Walk up the hierarchy so selected sub-items keep their context
+    parents = {item.code: item.parent_code for item in items if item.parent_code}
+    for code in list(keep):
+        parent = parents.get(code)
+        while parent and parent not in keep:
+            keep.add(parent)
+            parent = parents.get(parent)
+
+    # Top-level items of a hierarchical table are its totals; flat tables have none
+    roots = {item.code for item in items if not item.parent_code}
+    if parents and len(roots) <= top_k:
+        keep.update(roots)
+    keep.update(item.code for item in items if TOTAL_NAME_PATTERN.search(item.name))
+
+    return [item for item in items if item.code in keep]
+
+
+def best_item(query: str, items: List[StatisticItem]) -> Optional[StatisticItem]:
+    """
+    The single item most relevant to the query; without any overlap, the first
+    top-level (total) item.
+    """
+    if not items:
+        return None
+
+    query_grams = _grams(query)
+    best, best_score = None, 0.0
+    for item in items:
+        score = score_item(query, query_grams, item)
+        if score > best_score:
+            best, best_score = item, score
+    if best is not None:
+        return best
+    return next((item for item in items if not item.parent_code), items[0])
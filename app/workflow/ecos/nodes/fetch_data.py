@@ -1,5 +1,15 @@
+import logging
+
 from app.services.ecos_service import ecos_service
-from app.workflow.ecos.state import EcosState
+from app.workflow.ecos.retry import (
+    FailureKind,
+    classify_error,
+    request_fingerprint,
+    retry_metrics,
+    stage_failure,
+    stage_success,
+)
+from app.workflow.ecos.state import StatisticBranchState
 from app.core.utils import format_date
 from app.core.logger import get_logger
 from app.schema.statistics import Statistic, StatisticItem, StatisticQueryParametersList
@@ -8,17 +18,27 @@ from typing import List
 logger = get_logger(__name__)
 
 
-async def fetch_data_node(state: EcosState) -> dict:
+async def fetch_data_node(state: StatisticBranchState) -> dict:
     """Fetch data for all selected parameters"""
     stat: Statistic = state.get("selected_statistic")
     items: List[StatisticItem] = state.get("found_items")
     selected_params: StatisticQueryParametersList = state.get("selected_parameters")
+    failed_requests: List[str] = list(state.get("failed_requests") or [])
 
     fetched_items = []
+    errors = []
+    error_kind = FailureKind.NO_DATA
 
     for params in selected_params:
         start_fmt = format_date(params.start_time, params.cycle.value)
         end_fmt = format_date(params.end_time, params.cycle.value)
+        fingerprint = request_fingerprint(
+            stat.stat_code, params.cycle.value, start_fmt, end_fmt, params.item_code
+        )
+
+        if fingerprint in failed_requests:
+            retry_metrics.record_skipped_duplicate("fetch_data")
+            continue
 
         try:
             data = await ecos_service.get_statistic_data(
@@ -29,21 +49,42 @@ async def fetch_data_node(state: EcosState) -> dict:
                 item_code=params.item_code,
             )
         except Exception as e:
-            return {
-                "error_message": f"Failed to fetch data for {params.item_name or params.item_code}: {e}",
-                "fetched_items": None,
-            }
+            error_kind = classify_error(e)
+            if error_kind != FailureKind.TRANSIENT:
+                failed_requests.append(fingerprint)
+            errors.append(
+                f"Failed to fetch data for {params.item_name or params.item_code}: {e}"
+            )
+            continue
 
-        logger.debug(
-            f"Fetched Data for {params.item_name or params.item_code}: {str(data)[:500]}..."
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Fetched Data for %s: %.500s...",
+                params.item_name or params.item_code,
+                data,
+            )
 
         selected_item = next((i for i in items if i.code == params.item_code), None)
 
         if data and data.data and selected_item:
             fetched_items.append({"item": selected_item, "data": data})
+        else:
+            failed_requests.append(fingerprint)
+            if not selected_item:
+                error_kind = FailureKind.BAD_PARAMETERS
+                errors.append(f"Unknown item code: {params.item_code}")
+
+    # Partial results are kept; only retry when nothing usable was fetched
+    if not fetched_items:
+        message = "\n".join(errors) or "No data returned for the selected parameters."
+        return {
+            **stage_failure(state, "fetch_data", message, error_kind),
+            "fetched_items": None,
+            "failed_requests": failed_requests,
+        }
 
     return {
         "fetched_items": fetched_items,
-        "error_message": None,
+        "failed_requests": failed_requests,
+        **stage_success(),
     }
@@ -1,21 +1,38 @@
+import logging
+
 from app.services.ecos_service import ecos_service
-from app.workflow.ecos.state import EcosState
+from app.workflow.ecos.retry import (
+    FailureKind,
+    classify_error,
+    stage_failure,
+    stage_success,
+)
+from app.workflow.ecos.state import StatisticBranchState
 from app.core.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-async def fetch_items_node(state: EcosState) -> dict:
+async def fetch_items_node(state: StatisticBranchState) -> dict:
     """Fetch item list for the selected statistic"""
     selected_stat = state.get("selected_statistic")
 
     try:
         items = await ecos_service.get_statistic_item_list(selected_stat.stat_code)
-        logger.debug(f"Items: {','.join(item.name for item in items)}")
-
-        return {
-            "found_items": items if isinstance(items, list) else [],
-            "error_message": None,
-        }
     except Exception as e:
-        return {"error_message": f"Failed to fetch items: {str(e)}"}
+        return stage_failure(
+            state, "fetch_items", f"Failed to fetch items: {str(e)}", classify_error(e)
+        )
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Items: %s", ",".join(item.name for item in items))
+
+    if not items:
+        return stage_failure(
+            state,
+            "fetch_items",
+            f"No items found for statistic: {selected_stat.stat_code}",
+            FailureKind.NO_DATA,
+        )
+
+    return {"found_items": items, **stage_success()}
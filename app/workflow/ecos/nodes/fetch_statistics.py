@@ -1,19 +1,98 @@
+import asyncio
+import re
+from itertools import zip_longest
+from typing import List
+
+from app.core.config import settings
 from app.core.dependencies import get_chat_model
+from app.schema.statistics import Statistic
 from app.services.statistics_service import statistics_service
+from app.workflow.ecos.retry import (
+    FailureKind,
+    classify_error,
+    stage_failure,
+    stage_success,
+)
 from app.workflow.ecos.state import EcosState
 from app.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Explicit separators between indicators, e.g. "GDP 성장률, 실업률 및 소비자물가".
+# Particles (과/와) and a bare "/" also occur inside words ("효과", "원/달러").
+QUERY_SPLIT_PATTERN = re.compile(
+    r"\s*(?:,|·|\s/\s|\s및\s|\s그리고\s|\s(?:and|vs)\s)\s*", re.I
+)
+# Shorter fragments are not worth an embedding call
+MIN_FRAGMENT_CHARS = 2
+MAX_CANDIDATES = 20
+
+
+def split_query(query: str) -> List[str]:
+    """Split a query into the indicators it mentions (best effort, lexical)."""
+    parts = [p.strip() for p in QUERY_SPLIT_PATTERN.split(query)]
+    parts = [p for p in parts if len(p) >= MIN_FRAGMENT_CHARS and p != query]
+    return list(dict.fromkeys(parts))[: settings.ECOS_MAX_STATISTICS_PER_QUERY]
+
+
+def merge_candidates(results: List[List[Statistic]], limit: int) -> List[Statistic]:
+    """
+    Interleave the result lists rank by rank, so every searched indicator keeps
+    its best candidates when the total is trimmed to `limit`.
+    """
+    merged: List[Statistic] = []
+    seen = set()
+    for rank in zip_longest(*results):
+        for stat in rank:
+            if stat is not None and stat.stat_code not in seen:
+                seen.add(stat.stat_code)
+                merged.append(stat)
+    return merged[:limit]
+
 
 async def fetch_statistics_node(state: EcosState) -> dict:
     query = state["query"]
 
-    found_statistics = statistics_service.search(query, 10)
+    # Search each mentioned indicator too, so multi-statistic queries
+    # have candidates for every indicator. Each search embeds its keyword
+    # (a blocking HTTP call): run them concurrently, off the event loop.
+    # Start of a new run: drop results of the previous query on this thread,
+    # whichever way this run continues (the answer may be generated early)
+    reset = {"statistic_results": None}
+
+    searches = [(query, 10)] + [(part, 5) for part in split_query(query)]
+    try:
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(statistics_service.search, keyword, k)
+                for keyword, k in searches
+            )
+        )
+    except Exception as e:
+        return {
+            **reset,
+            **stage_failure(
+                state,
+                "fetch_statistics",
+                f"Failed to search statistics: {e}",
+                classify_error(e),
+            ),
+        }
+    found_statistics = merge_candidates(results, MAX_CANDIDATES)
+
+    if not found_statistics:
+        return {
+            **reset,
+            **stage_failure(
+                state,
+                "fetch_statistics",
+                f"No statistics found for keyword: {query}",
+                FailureKind.NO_DATA,
+            ),
+        }
 
     return {
+        **reset,
         "found_statistics": found_statistics,
-        "error_message": None
-        if found_statistics
-        else f"No statistics found for keyword: {query}",
+        **stage_success(),
     }
@@ -1,54 +1,66 @@
+from app.core.config import settings
+from app.core.deadline import with_timeout
 from app.core.dependencies import get_chat_model
+from app.core.prompts import build_prompt, date_context
 from app.workflow.ecos.state import EcosState
 from app.core.logger import get_logger
 from langchain_core.messages import SystemMessage, HumanMessage
 
-from datetime import datetime
-
 logger = get_logger(__name__)
 
-
-async def generate_node(state: EcosState) -> dict:
-    llm = get_chat_model()
-
-    fetched_items = state.get("fetched_items", [])
-    stat = state["selected_statistic"]
-    today = datetime.now().strftime("%Y%m%d")
-
-    items_info = []
-    for fetched in fetched_items:
-        item = fetched["item"]
-        data = fetched["data"]
-        items_info.append(f"Item: {item.name} Unit: {data.unit} Values: {data.data}")
-
-    all_items_text = "\n---\n".join(items_info)
-
-    messages = [
-        SystemMessage(
-            content=f"""You are a Korean Economic Statistics Expert.
+GENERATE_INSTRUCTIONS = """You are a Korean Economic Statistics Expert.
 You should answer user's query by analyzing the provided statistics.
-Current Date: {today} (Today is {today[:4]}-{today[4:6]}-{today[6:]})
-- "This year" = {today[:4]}
-- "Last year" = {int(today[:4]) - 1}
-- Always calculate dates relative to Today.
 
 Key guidelines:
 1. DATE AWARENESS:
-   - Always analyze data relative to the Current Date.
+   - Always analyze data relative to the Current Date given with the data.
 
 2. ANALYSIS RULES:
    - Convert large units to Korean readable format (조, 억).
-   - If multiple items are provided, compare and analyze them together.
+   - If multiple items or statistics are provided, compare and analyze them together.
    - PARTIAL DATA HANDLING: If data is available for only PART of the requested period , Present the available data first.
 """
-        ),
+
+
+def _build_messages(state: EcosState) -> list:
+    results = state.get("statistic_results") or []
+
+    statistics_info = []
+    for result in results:
+        items_info = []
+        for fetched in result["fetched_items"]:
+            item = fetched["item"]
+            data = fetched["data"]
+            items_info.append(
+                f"Item: {item.name} Unit: {data.unit} Values: {data.data}"
+            )
+
+        items_text = "\n---\n".join(items_info)
+        if not items_info:
+            items_text = f"No data available. Last error: {result['error_message']}"
+
+        statistics_info.append(
+            f"Statistic: {result['statistic'].full_path}\n{items_text}"
+        )
+
+    all_statistics_text = "\n===\n".join(statistics_info)
+
+    return [
+        SystemMessage(content=GENERATE_INSTRUCTIONS),
         HumanMessage(
-            content=f"""User Query: {state["query"]}
-Statistic: {stat.full_path}
-{all_items_text}
-Analyze this data and answer the user's question."""
+            content=build_prompt(
+                date_context(),
+                f"""User Query: {state["query"]}
+{all_statistics_text}
+Analyze this data and answer the user's question.""",
+            )
         ),
     ]
 
-    response = await llm.ainvoke(messages)
+
+async def generate_node(state: EcosState) -> dict:
+    llm = get_chat_model()
+    messages = _build_messages(state)
+
+    response = await with_timeout(llm.ainvoke(messages), settings.LLM_TIMEOUT)
     return {"messages": [response], "error_message": None}
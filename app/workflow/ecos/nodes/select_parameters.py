@@ -1,41 +1,64 @@
-from datetime import datetime
+import time
+from typing import List, Optional
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from app.core.config import settings
+from app.core.deadline import budget_low, with_timeout
 from app.core.dependencies import get_chat_model
-from app.workflow.ecos.state import EcosState
 from app.core.logger import get_logger
-from app.schema.statistics import StatisticQueryParametersList, StatisticItem, Statistic
-from typing import List
-from langchain_core.messages import SystemMessage, HumanMessage
+from app.core.prompts import build_prompt, date_context
+from app.core.utils import format_date
+from app.schema.statistics import Statistic, StatisticItem, StatisticQueryParametersList
+from app.workflow.ecos.item_ranker import rank_items
+from app.workflow.ecos.retry import (
+    FailureKind,
+    classify_error,
+    format_failed_requests,
+    request_fingerprint,
+    retry_metrics,
+    stage_failure,
+    stage_success,
+)
+from app.workflow.ecos.state import StatisticBranchState
 
 logger = get_logger(__name__)
 
+# Top-K multipliers tried when the LLM finds no matching item (None = all items)
+WIDENING_STEPS = [1, 4, None]
 
-async def select_parameters_node(state: EcosState) -> dict:
-    """Select query parameters (items, dates) using LLM"""
+
+SELECT_PARAMETERS_INSTRUCTIONS = (
+    "You are a korean expert at selecting appropriate economic data parameters.\n"
+    "Always calculate dates relative to the Current Date given with the request.\n"
+    "\n"
+    "Key rules:\n"
+    "- If country isn't specified, assume it's Korea.\n"
+    "- Format dates correctly: A(YYYY), Q(YYYYQn), M(YYYYMM), D(YYYYMMDD).\n"
+    "- CRITICAL: Check the 'Range' provided for each item (e.g., 200312~202411). Your "
+    "selected start_time and end_time MUST fall strictly within this valid range. Do "
+    "not request dates outside the provided Range.\n"
+    "- Select only items that answer the Focus. If it asks for multiple items (e.g., "
+    '"GDP and unemployment"), select multiple. Otherwise select one.\n'
+    "- If there was a previous error, adjust your parameters (different date format, "
+    "item, or shorter range).\n"
+    "- NEVER repeat a request listed under FAILED REQUESTS.\n"
+    "- Available Items may be limited to the most relevant ones. If none of them "
+    "matches, set no_match to true."
+)
+
+
+def _build_messages(state: StatisticBranchState, options: str) -> list:
     stat: Statistic = state.get("selected_statistic")
-    items: List[StatisticItem] = state.get("found_items", [])
+    failed_requests: List[str] = state.get("failed_requests") or []
 
-    llm = get_chat_model()
-    today = datetime.now().strftime("%Y%m%d")
-
-    options = "\n".join([str(item) for item in items])
-
-    messages = [
-        SystemMessage(
-            content=f"""You are a korean expert at selecting appropriate economic data parameters.
-Current Date: {today} (Today is {today[:4]}-{today[4:6]}-{today[6:]})
-- "This year" = {today[:4]}
-- "Last year" = {int(today[:4]) - 1}
-- Always calculate dates relative to Today.
-
-Key rules:
-- If country isn't specified, assume it's Korea.
-- Format dates correctly: A(YYYY), Q(YYYYQn), M(YYYYMM), D(YYYYMMDD).
-- CRITICAL: Check the 'Range' provided for each item (e.g., 200312~202411). Your selected start_time and end_time MUST fall strictly within this valid range. Do not request dates outside the provided Range.
-- If user asks for multiple items (e.g., "GDP and unemployment"), select multiple. Otherwise select one.
-- If there was a previous error, adjust your parameters (different date format, item, or shorter range)."""
-        ),
+    return [
+        SystemMessage(content=SELECT_PARAMETERS_INSTRUCTIONS),
         HumanMessage(
-            content=f"""User Query: {state["query"]}
+            content=build_prompt(
+                date_context(),
+                f"""User Query: {state["query"]}
+Focus: {state.get("sub_query") or state["query"]}
 
 Selected Statistic: {stat.stat_code} ({stat.stat_name})
 Cycle: {stat.cycle.value} (A=Annual, Q=Quarter, M=Month, D=Day)
@@ -43,16 +66,98 @@ Cycle: {stat.cycle.value} (A=Annual, Q=Quarter, M=Month, D=Day)
 Available Items:
 {options}
 
-PREVIOUS ERROR (if any): {state.get("error_message", "None")}
-"""
+PREVIOUS ERROR (if any): {state.get("error_message") or "None"}
+
+FAILED REQUESTS (STAT_CODE/CYCLE/START/END/ITEM_CODE):
+{format_failed_requests(failed_requests)}
+""",
+            )
         ),
     ]
 
-    structured_llm = llm.with_structured_output(StatisticQueryParametersList)
-    result: StatisticQueryParametersList = await structured_llm.ainvoke(messages)
-    logger.info(f"Selected Params: {result.queries}")
 
-    return {
-        "selected_parameters": result.queries,
-        "error_message": None,
-    }
+async def select_parameters_node(state: StatisticBranchState) -> dict:
+    """Select query parameters (items, dates) using LLM"""
+    stat: Statistic = state.get("selected_statistic")
+    items: List[StatisticItem] = state.get("found_items", [])
+    failed_requests: List[str] = state.get("failed_requests") or []
+    focus = state.get("sub_query") or state["query"]
+
+    llm = get_chat_model()
+    structured_llm = llm.with_structured_output(
+        StatisticQueryParametersList, include_raw=True
+    )
+    all_options_chars = sum(len(str(item)) + 1 for item in items)
+
+    for step in WIDENING_STEPS:
+        top_k: Optional[int] = settings.ECOS_ITEM_TOP_K * step if step else None
+        shown = rank_items(focus, items, top_k) if top_k else items
+        options = "\n".join([str(item) for item in shown])
+
+        started = time.perf_counter()
+        try:
+            response = await with_timeout(
+                structured_llm.ainvoke(_build_messages(state, options)),
+                settings.LLM_TIMEOUT,
+            )
+            if response["parsing_error"]:
+                raise response["parsing_error"]
+        except Exception as e:
+            return stage_failure(
+                state,
+                "select_parameters",
+                f"Failed to select parameters: {e}",
+                classify_error(e),
+            )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        usage = getattr(response["raw"], "usage_metadata", None) or {}
+        logger.info(
+            "Item prompt: %d/%d items, %d/%d option chars, "
+            "input_tokens=%s, latency=%.0fms",
+            len(shown),
+            len(items),
+            len(options),
+            all_options_chars,
+            usage.get("input_tokens", "?"),
+            elapsed_ms,
+        )
+
+        result: StatisticQueryParametersList = response["parsed"]
+        if not result.no_match or len(shown) == len(items) or budget_low():
+            break
+        logger.info("No matching item in top %d items, widening", len(shown))
+
+    if result.no_match:
+        return stage_failure(
+            state,
+            "select_parameters",
+            f"No item of {stat.stat_code} matches: {focus}",
+            FailureKind.NO_DATA,
+        )
+
+    logger.info("Selected Params: %s", result.queries)
+
+    new_queries = [
+        params
+        for params in result.queries
+        if request_fingerprint(
+            stat.stat_code,
+            params.cycle.value,
+            format_date(params.start_time, params.cycle.value),
+            format_date(params.end_time, params.cycle.value),
+            params.item_code,
+        )
+        not in failed_requests
+    ]
+    if not new_queries:
+        retry_metrics.record_skipped_duplicate("select_parameters")
+        return stage_failure(
+            state,
+            "select_parameters",
+            "Selected parameters repeat a request that already failed. "
+            "Choose a different date range, cycle, or item.",
+            FailureKind.BAD_PARAMETERS,
+        )
+
+    return {"selected_parameters": new_queries, **stage_success()}
@@ -1,6 +1,14 @@
+from app.core.deadline import with_timeout
 from app.core.dependencies import get_chat_model
 from app.workflow.ecos.state import EcosState
-from app.schema.statistics import SelectedStatistic
+from app.core.config import settings
+from app.schema.statistics import SelectedStatisticList
+from app.workflow.ecos.retry import (
+    FailureKind,
+    classify_error,
+    stage_failure,
+    stage_success,
+)
 from app.core.logger import get_logger
 from langchain_core.messages import SystemMessage, HumanMessage
 
@@ -8,7 +16,7 @@ logger = get_logger(__name__)
 
 
 async def select_statistic_node(state: EcosState) -> dict:
-    """Select the best statistic from found_statistics using LLM"""
+    """Select the best statistic for each indicator in the query using LLM"""
     stats = state.get("found_statistics", [])
 
     llm = get_chat_model()
@@ -19,11 +27,15 @@ async def select_statistic_node(state: EcosState) -> dict:
             for stat in stats
         ]
     )
-    logger.debug(f"Available Statistics:\n{options}")
+    logger.debug("Available Statistics:\n%s", options)
 
+    max_statistics = settings.ECOS_MAX_STATISTICS_PER_QUERY
     messages = [
         SystemMessage(
-            content="""You are a korean expert at selecting the most relevant economic statistic based on user queries."""
+            content=(
+                "You are a korean expert at selecting the most relevant economic "
+                "statistic based on user queries."
+            )
         ),
         HumanMessage(
             content=f"""User Query: {state["query"]}
@@ -31,20 +43,62 @@ async def select_statistic_node(state: EcosState) -> dict:
 Available Statistics:
 {options}
 
-Select the SINGLE best statistic that matches the user's intent."""
+Select the best statistic that matches the user's intent.
+If the user asks about several indicators that live in DIFFERENT statistics
+(e.g., "GDP 성장률과 실업률, 소비자물가 비교"), select one statistic per indicator
+(at most {max_statistics}) and set sub_query to the indicator it answers.
+
+PREVIOUS ERROR (if any): {state.get("error_message") or "None"}"""
         ),
     ]
 
-    structured_llm = llm.with_structured_output(SelectedStatistic)
-    selection: SelectedStatistic = await structured_llm.ainvoke(messages)
+    structured_llm = llm.with_structured_output(SelectedStatisticList)
+    try:
+        result: SelectedStatisticList = await with_timeout(
+            structured_llm.ainvoke(messages), settings.LLM_TIMEOUT
+        )
+    except Exception as e:
+        return stage_failure(
+            state,
+            "select_statistic",
+            f"Failed to select statistic: {e}",
+            classify_error(e),
+        )
+
+    stats_by_code = {stat.stat_code: stat for stat in stats}
+    selections = [s for s in result.selections if s.stat_code]
+    if not selections:
+        return stage_failure(
+            state,
+            "select_statistic",
+            f"No matching statistic: {result.selections[0].reason}",
+            FailureKind.NO_DATA,
+        )
+
+    unknown = [s.stat_code for s in selections if s.stat_code not in stats_by_code]
+    if unknown:
+        return stage_failure(
+            state,
+            "select_statistic",
+            f"Selected statistic codes {unknown} not found in options.",
+            FailureKind.BAD_PARAMETERS,
+        )
 
-    selected_stat = next(
-        (stat for stat in stats if stat.stat_code == selection.stat_code), None
+    lookups = []
+    seen = set()
+    for selection in selections[: settings.ECOS_MAX_STATISTICS_PER_QUERY]:
+        if selection.stat_code in seen:
+            continue
+        seen.add(selection.stat_code)
+        lookups.append(
+            {
+                "statistic": stats_by_code[selection.stat_code],
+                "sub_query": selection.sub_query,
+            }
+        )
+    logger.info(
+        "Selected Statistics: %s",
+        [lookup["statistic"].stat_code for lookup in lookups],
     )
 
-    return {
-        "selected_statistic": selected_stat,
-        "error_message": None
-        if selected_stat
-        else "Selected statistic code not found in options.",
-    }
+    return {"selected_statistics": lookups, **stage_success()}
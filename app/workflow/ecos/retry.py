@@ -0,0 +1,203 @@
+import asyncio
+import json
+from collections import Counter
+from enum import Enum
+from typing import Dict, List, Mapping, Optional
+
+import httpx
+import openai
+from langchain_core.exceptions import OutputParserException
+from langgraph.graph import END
+from pydantic import ValidationError
+
+from app.core.deadline import budget_low
+from app.core.logger import get_logger
+from app.services.ecos_service import EcosApiError
+
+logger = get_logger(__name__)
+
+
+class FailureKind(str, Enum):
+    TRANSIENT = "transient"  # network, rate limit, upstream 5xx: same request may work
+    BAD_PARAMETERS = "bad_parameters"  # request must change before retrying
+    NO_DATA = "no_data"  # request was valid, but nothing matches
+    FATAL = "fatal"  # configuration/programming error: retrying cannot help
+
+
+# Number of retries allowed per stage, by failure kind.
+# Kinds that are not listed are never retried for that stage.
+STAGE_RETRY_BUDGETS: Dict[str, Dict[FailureKind, int]] = {
+    # The vector search embeds the query through OpenAI (rate limits, network);
+    # for the same query it finds the same statistics, so only those are retried
+    "fetch_statistics": {FailureKind.TRANSIENT: 2},
+    "select_statistic": {FailureKind.TRANSIENT: 2, FailureKind.BAD_PARAMETERS: 1},
+    "fetch_items": {FailureKind.TRANSIENT: 2},
+    "select_parameters": {FailureKind.TRANSIENT: 2, FailureKind.BAD_PARAMETERS: 2},
+    "fetch_data": {
+        FailureKind.TRANSIENT: 2,
+        FailureKind.BAD_PARAMETERS: 2,
+        FailureKind.NO_DATA: 1,
+    },
+}
+
+# ECOS result codes that are worth retrying unchanged
+# ERROR-500: server error, ERROR-600: DB connection error, ERROR-602: throttled
+ECOS_TRANSIENT_CODES = {"ERROR-500", "ERROR-600", "ERROR-602"}
+# Caused by the request itself; any other non-fatal code is treated the same way
+# ERROR-400: range too large to finish within 60s, ERROR-601: SQL error
+ECOS_BAD_PARAMETER_CODES = {"ERROR-400", "ERROR-601"}
+ECOS_NO_DATA_CODES = {"INFO-200"}
+ECOS_FATAL_CODES = {"INFO-100"}  # invalid API key
+
+
+def classify_error(error: BaseException) -> FailureKind:
+    """Classify an exception raised by a node into a FailureKind."""
+    if isinstance(error, EcosApiError):
+        if error.code in ECOS_NO_DATA_CODES:
+            return FailureKind.NO_DATA
+        if error.code in ECOS_BAD_PARAMETER_CODES:
+            return FailureKind.BAD_PARAMETERS
+        if error.code in ECOS_TRANSIENT_CODES:
+            return FailureKind.TRANSIENT
+        if error.code in ECOS_FATAL_CODES:
+            return FailureKind.FATAL
+        return FailureKind.BAD_PARAMETERS
+
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        if status == 429 or status >= 500:
+            return FailureKind.TRANSIENT
+        return FailureKind.FATAL
+
+    if isinstance(
+        error,
+        (
+            httpx.TransportError,
+            asyncio.TimeoutError,
+            json.JSONDecodeError,
+            openai.APIConnectionError,
+            openai.RateLimitError,
+            openai.InternalServerError,
+        ),
+    ):
+        return FailureKind.TRANSIENT
+
+    # Malformed structured output: asking again with the error as feedback can help
+    if isinstance(error, (OutputParserException, ValidationError)):
+        return FailureKind.BAD_PARAMETERS
+
+    return FailureKind.FATAL
+
+
+class RetryMetrics:
+    """Per-stage counters of failures, retries, give-ups and avoided requests."""
+
+    def __init__(self):
+        self.failures: Counter = Counter()
+        self.retries: Counter = Counter()
+        self.give_ups: Counter = Counter()
+        self.skipped_duplicates: Counter = Counter()
+
+    def record_failure(self, stage: str, kind: FailureKind) -> None:
+        # Every failure is an upstream or LLM call that produced nothing usable
+        self.failures[(stage, kind.value)] += 1
+
+    def record_retry(self, stage: str, kind: FailureKind) -> None:
+        self.retries[(stage, kind.value)] += 1
+
+    def record_give_up(self, stage: str, kind: FailureKind) -> None:
+        self.give_ups[(stage, kind.value)] += 1
+
+    def record_deadline(self, stage: str) -> None:
+        self.give_ups[(stage, "deadline")] += 1
+
+    def record_skipped_duplicate(self, stage: str) -> None:
+        self.skipped_duplicates[stage] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        stages: Dict[str, Dict[str, Dict[str, int]]] = {}
+
+        def add(metric: str, counter: Counter) -> None:
+            for (stage, kind), count in counter.items():
+                stages.setdefault(stage, {}).setdefault(metric, {})[kind] = count
+
+        add("wasted_calls", self.failures)
+        add("retries", self.retries)
+        add("give_ups", self.give_ups)
+        for stage, count in self.skipped_duplicates.items():
+            stages.setdefault(stage, {})["skipped_duplicates"] = {"total": count}
+        return stages
+
+
+retry_metrics = RetryMetrics()
+
+
+def stage_failure(state: Mapping, stage: str, message: str, kind: FailureKind) -> dict:
+    """State update for a failed stage; counts the failure against its budget."""
+    retry_metrics.record_failure(stage, kind)
+    logger.warning("[%s] %s: %s", stage, kind.value, message)
+
+    retry_counts = dict(state.get("retry_counts") or {})
+    retry_counts[stage] = retry_counts.get(stage, 0) + 1
+    return {
+        "error_message": message,
+        "error_kind": kind.value,
+        "retry_counts": retry_counts,
+    }
+
+
+def stage_success() -> dict:
+    return {"error_message": None, "error_kind": None}
+
+
+def route_on_failure(
+    state: Mapping,
+    stage: str,
+    on_success: str,
+    retry_targets: Dict[FailureKind, str],
+    on_give_up: str,
+    on_deadline: Optional[str] = None,
+) -> str:
+    """
+    Pick the next node after `stage`.
+    A failure is retried only if its kind has a target and budget left for this stage.
+    When the request's time budget runs low, go to `on_deadline` (default:
+    `on_give_up`) instead of starting another stage or retry.
+    """
+    failed = bool(state.get("error_message"))
+    if (failed or on_success != END) and budget_low():
+        retry_metrics.record_deadline(stage)
+        logger.warning("[%s] time budget low, skipping to the answer", stage)
+        return on_deadline or on_give_up
+
+    if not failed:
+        return on_success
+
+    kind = FailureKind(state.get("error_kind") or FailureKind.FATAL)
+    failures = (state.get("retry_counts") or {}).get(stage, 0)
+    budget = STAGE_RETRY_BUDGETS.get(stage, {}).get(kind, 0)
+
+    target = retry_targets.get(kind)
+    if target and failures <= budget:
+        retry_metrics.record_retry(stage, kind)
+        return target
+
+    retry_metrics.record_give_up(stage, kind)
+    return on_give_up
+
+
+def request_fingerprint(
+    stat_code: str,
+    cycle: str,
+    start_time: str,
+    end_time: str,
+    item_code: Optional[str],
+) -> str:
+    """Identity of an ECOS data request, used to avoid repeating a failed one."""
+    return "/".join([stat_code, cycle, start_time, end_time, item_code or ""])
+
+
+def format_failed_requests(failed_requests: Optional[List[str]]) -> str:
+    if not failed_requests:
+        return "None"
+    return "\n".join(f"- {fp}" for fp in failed_requests)
@@ -9,12 +9,48 @@ class FetchedItemData(TypedDict):
     data: StatisticData
 
 
+class StatisticLookup(TypedDict):
+    statistic: Statistic
+    sub_query: Optional[str]
+
+
+class StatisticResult(TypedDict):
+    statistic: Statistic
+    sub_query: Optional[str]
+    fetched_items: List[FetchedItemData]
+    error_message: Optional[str]
+
+
+def merge_statistic_results(
+    left: Optional[List[StatisticResult]], right: Optional[List[StatisticResult]]
+) -> List[StatisticResult]:
+    """Collect results of parallel branches. Writing None resets the list."""
+    if right is None:
+        return []
+    return (left or []) + right
+
+
 class EcosState(TypedDict):
     messages: Annotated[List[AnyMessage], add_messages]
     query: str
 
     found_statistics: Optional[List[Statistic]]
-    selected_statistic: Optional[Statistic]
+    # One lookup per statistic, each handled by its own parallel branch
+    selected_statistics: Optional[List[StatisticLookup]]
+    statistic_results: Annotated[List[StatisticResult], merge_statistic_results]
+
+    # Failures per stage (see app.workflow.ecos.retry)
+    retry_counts: Dict[str, int]
+    error_message: Optional[str]
+    error_kind: Optional[str]  # FailureKind value
+
+
+class StatisticBranchState(TypedDict):
+    """State of a single statistic lookup (items -> parameters -> data)"""
+
+    query: str
+    sub_query: Optional[str]
+    selected_statistic: Statistic
     found_items: Optional[List[StatisticItem]]
 
     # LLM-selected query parameters
@@ -23,5 +59,8 @@ class EcosState(TypedDict):
     # Changed to support multiple items
     fetched_items: Optional[List[FetchedItemData]]
 
-    retry_count: int = 0
+    retry_counts: Dict[str, int]
+    # Data requests that failed and must not be repeated
+    failed_requests: List[str]
     error_message: Optional[str]
+    error_kind: Optional[str]  # FailureKind value
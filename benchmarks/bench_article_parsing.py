@@ -0,0 +1,114 @@
+"""
+Article parsing benchmark: thread vs process backend.
+
+Parses the same article HTML at several concurrency levels and reports
+throughput and event-loop lag (how late a 10ms ticker wakes up while parses
+are running). No network access is needed.
+
+Usage:
+    uv run python benchmarks/bench_article_parsing.py
+    uv run python benchmarks/bench_article_parsing.py --concurrency 1 8 32
+    uv run python benchmarks/bench_article_parsing.py --html page.html
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from app.services.article_parser import ArticleParser  # noqa: E402
+
+TICK_SECONDS = 0.01
+
+
+def sample_html(paragraphs: int = 80) -> bytes:
+    body = "".join(
+        f"<p>The Bank of Korea held its base rate steady for the {i}th time, "
+        "citing household debt, the won-dollar exchange rate and slowing exports. "
+        "Economists expect inflation to stay near the 2% target next year.</p>"
+        for i in range(paragraphs)
+    )
+    return (
+        "<html><head><title>BOK holds base rate steady</title>"
+        '<meta property="article:published_time" content="2026-10-01T09:00:00+09:00">'
+        "</head><body><nav><a href='/'>Home</a></nav>"
+        f"<article><h1>BOK holds base rate steady</h1>{body}</article>"
+        "<footer>Copyright</footer></body></html>"
+    ).encode()
+
+
+async def measure_lag(stop: asyncio.Event, lags: list) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append(time.perf_counter() - started - TICK_SECONDS)
+
+
+async def run(parser: ArticleParser, html: bytes, concurrency: int, total: int) -> dict:
+    limit = asyncio.Semaphore(concurrency)
+
+    async def parse_one(i: int) -> None:
+        async with limit:
+            await parser.parse(f"https://news.example.com/{i}", html, "utf-8")
+
+    stop = asyncio.Event()
+    lags: list = []
+    ticker = asyncio.create_task(measure_lag(stop, lags))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(parse_one(i) for i in range(total)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await ticker
+    lags.sort()
+    return {
+        "elapsed": elapsed,
+        "throughput": total / elapsed,
+        "lag_p50_ms": statistics.median(lags) * 1000 if lags else 0.0,
+        "lag_max_ms": lags[-1] * 1000 if lags else 0.0,
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    html = Path(args.html).read_bytes() if args.html else sample_html()
+    print(f"HTML size: {len(html) / 1024:.1f} KiB, workers: {args.workers}")
+    print(
+        f"{'backend':<8} {'conc':>5} {'docs':>5} {'secs':>7} "
+        f"{'docs/s':>8} {'lag p50':>9} {'lag max':>9}"
+    )
+
+    for backend in args.backends:
+        parser = ArticleParser(backend=backend, workers=args.workers)
+        await parser.warmup()
+        try:
+            for concurrency in args.concurrency:
+                total = concurrency * args.docs_per_slot
+                result = await run(parser, html, concurrency, total)
+                print(
+                    f"{backend:<8} {concurrency:>5} {total:>5} "
+                    f"{result['elapsed']:>7.2f} {result['throughput']:>8.1f} "
+                    f"{result['lag_p50_ms']:>7.1f}ms {result['lag_max_ms']:>7.1f}ms"
+                )
+        finally:
+            parser.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--html", help="Article HTML file (default: synthetic page)")
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=["thread", "process"],
+        choices=["thread", "process"],
+    )
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 4, 16])
+    parser.add_argument("--docs-per-slot", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,469 @@
+"""
+End-to-end benchmark of ecos_graph, ecos_agent and news_agent.
+
+Runs the real graphs and agents against local stand-ins, so no API key or
+network access is needed:
+- ECOS and Naver (and article hosts) answer through an httpx.MockTransport
+  with a configurable latency,
+- the chat model is a scripted fake that walks each agent through its usual
+  tool calls (search -> items -> data, search -> scrape) with a configurable
+  latency per call,
+- statistics search uses deterministic fake embeddings over the real catalog,
+  indexed in a temporary DATA_DIR.
+
+Reports end-to-end latency (mean/p50/p95/max), throughput for N sessions at a
+given concurrency, and the mean time per graph node and tool (from the
+app's own metrics). Results are saved as JSON; pass --compare with an earlier
+result file to print the change per scenario.
+
+Usage:
+    uv run python benchmarks/bench_e2e.py
+    uv run python benchmarks/bench_e2e.py --sessions 50 --concurrency 10
+    uv run python benchmarks/bench_e2e.py --compare benchmarks/results/e2e-<commit>.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+SCENARIOS = ("ecos_graph", "ecos_agent", "news_agent")
+QUERIES = {
+    "ecos_graph": "GDP 성장률과 실업률",
+    "ecos_agent": "최근 소비자물가 상승률",
+    "news_agent": "한국은행 기준금리 전망",
+}
+
+ARTICLE_HTML = """<html><head><title>Rates outlook {n}</title></head><body>
+<article><h1>Rates outlook {n}</h1>
+{paragraphs}
+</article></body></html>"""
+ARTICLE_PARAGRAPH = (
+    "<p>The Bank of Korea kept its base rate unchanged at 2.50 percent on "
+    "Thursday, citing household debt and the exchange rate. Economists expect "
+    "one more cut this year as growth slows and inflation stays near target.</p>"
+)
+
+
+# --- Local stand-ins -------------------------------------------------------
+
+
+def ecos_handler(latency: float) -> Callable:
+    """ECOS OpenAPI stand-in: StatisticItemList and StatisticSearch."""
+    import httpx
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency)
+        parts = request.url.path.split("/")
+        service = parts[2]
+        stat_code = parts[8]
+        if service == "StatisticItemList":
+            rows = [
+                {
+                    "STAT_CODE": stat_code,
+                    "ITEM_CODE": code,
+                    "ITEM_NAME": name,
+                    "START_TIME": "2000Q1",
+                    "END_TIME": "2025Q2",
+                    "CYCLE": "Q",
+                }
+                for code, name in (
+                    ("1400", "총지수"),
+                    ("1000", "농업"),
+                    ("2000", "제조업"),
+                )
+            ]
+            body = {"StatisticItemList": {"list_total_count": len(rows), "row": rows}}
+        else:
+            rows = [
+                {
+                    "STAT_CODE": stat_code,
+                    "ITEM_NAME1": "총지수",
+                    "UNIT_NAME": "%",
+                    "TIME": f"{year}Q{quarter}",
+                    "DATA_VALUE": f"{1 + quarter / 10:.1f}",
+                }
+                for year in (2024, 2025)
+                for quarter in (1, 2, 3, 4)
+            ]
+            body = {"StatisticSearch": {"list_total_count": len(rows), "row": rows}}
+        return httpx.Response(200, json=body)
+
+    return handle
+
+
+def naver_handler(latency: float) -> Callable:
+    """Naver news search and article hosts stand-in."""
+    import httpx
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency)
+        if request.url.host == "openapi.naver.com":
+            display = int(request.url.params.get("display", 5))
+            items = [
+                {
+                    "title": f"기준금리 전망 기사 {n}",
+                    "originallink": f"https://news{n % 3}.example.com/article/{n}",
+                    "link": f"https://n.news.naver.com/article/{n}",
+                    "description": f"한국은행 기준금리 동결 배경과 전망 {n}",
+                    "pubDate": "Thu, 16 Oct 2025 10:00:00 +0900",
+                }
+                for n in range(display)
+            ]
+            return httpx.Response(200, json={"items": items})
+
+        n = request.url.path.rsplit("/", 1)[-1]
+        html = ARTICLE_HTML.format(n=n, paragraphs=ARTICLE_PARAGRAPH * 20)
+        return httpx.Response(
+            200, content=html.encode(), headers={"Content-Type": "text/html"}
+        )
+
+    return handle
+
+
+def scripted_chat_model(latency: float):
+    """
+    Chat model that answers like a well-behaved LLM would: structured outputs
+    pick the first option offered, agents call their tools in the usual order
+    and then answer.
+    """
+    from langchain_core.language_models.chat_models import BaseChatModel
+    from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+    from langchain_core.outputs import ChatGeneration, ChatResult
+    from langchain_core.utils.function_calling import convert_to_openai_tool
+
+    def tool_call(name: str, args: Dict[str, Any]) -> AIMessage:
+        return AIMessage(
+            content="",
+            tool_calls=[{"name": name, "args": args, "id": f"call_{uuid.uuid4().hex}"}],
+        )
+
+    def structured(name: str, prompt: str) -> AIMessage:
+        if name == "SelectedStatisticList":
+            codes = re.findall(r"^- (\w+): ", prompt, re.M)
+            selection = {"stat_code": codes[0], "reason": "benchmark"}
+            return tool_call(name, {"selections": [selection]})
+        if name == "StatisticQueryParametersList":
+            item = re.search(r"Name: (.+?), Code: (\w+), .*Cycle: (\w+)", prompt)
+            params = {
+                "cycle": item.group(3),
+                "item_code": item.group(2),
+                "item_name": item.group(1),
+                "start_time": "2024Q1",
+                "end_time": "2025Q2",
+            }
+            return tool_call(name, {"queries": [params]})
+        raise ValueError(f"No scripted answer for {name}")
+
+    def agent_step(tool_names: List[str], messages: List) -> AIMessage:
+        query = next(m.content for m in messages if isinstance(m, HumanMessage))
+        results = [m for m in messages if isinstance(m, ToolMessage)]
+        last = str(results[-1].content) if results else ""
+
+        if "search_statistics" in tool_names:
+            if not results:
+                return tool_call("search_statistics", {"query": query})
+            if len(results) == 1:
+                stat_code = re.search(r"\d{3}Y\d{3}", last).group(0)
+                return tool_call("get_statistic_item_list", {"stat_code": stat_code})
+            if len(results) == 2:
+                stat_code = re.search(r"\d{3}Y\d{3}", str(results[0].content)).group(0)
+                args = {
+                    "stat_code": stat_code,
+                    "cycle": "Q",
+                    "start_time": "2024Q1",
+                    "end_time": "2025Q2",
+                    "item_code": "1400",
+                }
+                return tool_call("get_statistic_data", args)
+        elif "search_naver_news" in tool_names:
+            if not results:
+                return tool_call("search_naver_news", {"query": query})
+            if len(results) == 1:
+                urls = re.findall(r"https://news\d\.example\.com/article/\d+", last)
+                args = {"urls": urls[:3], "query": query}
+                return tool_call("scrape_news_articles", args)
+        return AIMessage(content="벤치마크 답변입니다. " * 20)
+
+    class ScriptedChatModel(BaseChatModel):
+        latency: float = 0.0
+
+        @property
+        def _llm_type(self) -> str:
+            return "scripted"
+
+        def bind_tools(self, tools, *, tool_choice=None, **kwargs):
+            formatted = [convert_to_openai_tool(t) for t in tools]
+            return self.bind(tools=formatted, tool_choice=tool_choice, **kwargs)
+
+        def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+            raise NotImplementedError("The scripted model is async only")
+
+        async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+            await asyncio.sleep(self.latency)
+            tools = [t["function"]["name"] for t in kwargs.get("tools") or []]
+            prompt = "\n".join(str(m.content) for m in messages)
+            if kwargs.get("tool_choice") and len(tools) == 1:
+                message = structured(tools[0], prompt)
+            else:
+                message = agent_step(tools, messages)
+            input_tokens = len(prompt) // 3
+            output_tokens = len(str(message.content)) // 3 + 20
+            message.usage_metadata = {
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+            }
+            return ChatResult(generations=[ChatGeneration(message=message)])
+
+    return ScriptedChatModel(latency=latency)
+
+
+def install_stand_ins(
+    data_dir: Path, llm_latency: float, upstream_latency: float
+) -> None:
+    """Point settings and dependencies at the stand-ins, before app imports."""
+    shutil.copy(ROOT / "data" / "ecos_statistics.csv", data_dir)
+    os.environ.update(
+        {
+            "DATA_DIR": str(data_dir),
+            "OPENAI_API_KEY": "bench",
+            "ECOS_API_KEY": "bench",
+            "NAVER_CLIENT_ID": "bench",
+            "NAVER_CLIENT_SECRET": "bench",
+            # Every session should reach the (fake) upstreams
+            "NEWS_ARTICLE_CACHE_ENABLED": "false",
+            "NEWS_SEARCH_CACHE_TTL_SECONDS": "0",
+            "CHECKPOINT_ONE_SHOT_CALLS": "false",
+            # Offline: the regex sentence splitter is used without the model
+            "NLTK_DOWNLOAD": "false",
+        }
+    )
+
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+
+    import app.core.dependencies as dependencies
+
+    model = scripted_chat_model(llm_latency)
+    embeddings = DeterministicFakeEmbedding(size=256)
+    dependencies.get_chat_model = lambda: model
+    dependencies.get_embeddings = lambda: embeddings
+
+    import httpx
+
+    from app.services.ecos_service import ecos_service
+    from app.services.news_service import news_service
+
+    ecos_service.transport = httpx.MockTransport(ecos_handler(upstream_latency))
+    news_service.transport = httpx.MockTransport(naver_handler(upstream_latency))
+
+
+# --- Scenarios -------------------------------------------------------------
+
+
+def build_scenarios() -> Dict[str, Callable[[str], Any]]:
+    from langchain_core.messages import HumanMessage
+
+    from app.agent.ecos_agent import ecos_agent
+    from app.agent.news_agent import news_agent
+    from app.workflow.ecos.graph import ecos_graph
+
+    def config() -> dict:
+        return {"configurable": {"thread_id": str(uuid.uuid4())}}
+
+    return {
+        "ecos_graph": lambda query: ecos_graph.ainvoke(
+            {"query": query, "messages": [], "retry_counts": {}}, config=config()
+        ),
+        "ecos_agent": lambda query: ecos_agent.ainvoke(
+            {"messages": [HumanMessage(content=query)]}, config=config()
+        ),
+        "news_agent": lambda query: news_agent.ainvoke(
+            {"messages": [HumanMessage(content=query)]}, config=config()
+        ),
+    }
+
+
+def step_totals() -> Dict[str, List[float]]:
+    """Cumulative [sum, count] per node and tool, from the app metrics."""
+    from app.core.metrics import node_duration, tool_duration
+
+    totals = {}
+    for (graph, node), histogram in node_duration.children():
+        _, total, count = histogram.snapshot()
+        totals[f"node.{graph}.{node}"] = [total, count]
+    for (tool,), histogram in tool_duration.children():
+        _, total, count = histogram.snapshot()
+        totals[f"tool.{tool}"] = [total, count]
+    return totals
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+async def run_scenario(
+    run: Callable[[str], Any], query: str, sessions: int, concurrency: int
+) -> Dict[str, Any]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors: List[str] = []
+
+    async def session() -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await run(query)
+            except Exception as e:
+                errors.append(f"{type(e).__name__}: {e}")
+                return
+            latencies.append(time.perf_counter() - started)
+
+    before = step_totals()
+    started = time.perf_counter()
+    await asyncio.gather(*(session() for _ in range(sessions)))
+    wall = time.perf_counter() - started
+    after = step_totals()
+
+    steps = {}
+    for name, (total, count) in sorted(after.items()):
+        prev_total, prev_count = before.get(name, [0.0, 0.0])
+        if count > prev_count:
+            steps[name] = {
+                "count": int(count - prev_count),
+                "mean": round((total - prev_total) / (count - prev_count), 4),
+            }
+
+    return {
+        "sessions": sessions,
+        "concurrency": concurrency,
+        "errors": len(errors),
+        "first_error": errors[0] if errors else None,
+        "wall_seconds": round(wall, 3),
+        "throughput_per_second": round(len(latencies) / wall, 3),
+        "latency": {
+            "mean": round(statistics.mean(latencies), 4),
+            "p50": round(percentile(latencies, 0.5), 4),
+            "p95": round(percentile(latencies, 0.95), 4),
+            "max": round(max(latencies), 4),
+        }
+        if latencies
+        else None,
+        "steps": steps,
+    }
+
+
+# --- Reporting -------------------------------------------------------------
+
+
+def git_commit() -> Optional[str]:
+    result = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip() or None
+
+
+def print_result(name: str, result: Dict[str, Any]) -> None:
+    latency = result["latency"] or {}
+    print(
+        f"\n== {name}: {result['sessions']} sessions x{result['concurrency']}, "
+        f"{result['throughput_per_second']}/s, errors={result['errors']}"
+    )
+    if result["first_error"]:
+        print(f"   first error: {result['first_error']}")
+    if latency:
+        print(
+            f"   latency mean={latency['mean']:.3f}s p50={latency['p50']:.3f}s "
+            f"p95={latency['p95']:.3f}s max={latency['max']:.3f}s"
+        )
+    for step, values in result["steps"].items():
+        print(f"   {step:<52} x{values['count']:<4} {values['mean'] * 1000:8.1f} ms")
+
+
+def print_comparison(current: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    print(f"\n== vs {baseline.get('commit')} ({baseline.get('timestamp')})")
+    for name, result in current["scenarios"].items():
+        old = baseline.get("scenarios", {}).get(name)
+        if not old or not old["latency"] or not result["latency"]:
+            continue
+        for key in ("p50", "p95"):
+            new_value, old_value = result["latency"][key], old["latency"][key]
+            change = (new_value - old_value) / old_value * 100 if old_value else 0.0
+            print(
+                f"   {name:<12} {key} {old_value:.3f}s -> {new_value:.3f}s "
+                f"({change:+.1f}%)"
+            )
+        old_tput = old["throughput_per_second"]
+        new_tput = result["throughput_per_second"]
+        print(f"   {name:<12} throughput {old_tput}/s -> {new_tput}/s")
+
+
+async def main(args: argparse.Namespace) -> Dict[str, Any]:
+    scenarios = build_scenarios()
+    results = {}
+    for name in args.scenarios:
+        # Warm caches and lazy imports outside the measurement
+        await scenarios[name](QUERIES[name])
+        results[name] = await run_scenario(
+            scenarios[name], QUERIES[name], args.sessions, args.concurrency
+        )
+        print_result(name, results[name])
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS)
+    )
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=5)
+    parser.add_argument("--llm-latency", type=float, default=0.2)
+    parser.add_argument("--upstream-latency", type=float, default=0.05)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--compare", type=Path)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        install_stand_ins(Path(data_dir), args.llm_latency, args.upstream_latency)
+        results = asyncio.run(main(args))
+
+        from app.services.news_service import news_service
+
+        news_service.parser.shutdown()
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "config": {
+            key: getattr(args, key)
+            for key in ("sessions", "concurrency", "llm_latency", "upstream_latency")
+        },
+        "scenarios": results,
+    }
+
+    output = args.output or ROOT / "benchmarks" / "results" / f"e2e-{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    print(f"\nSaved {output}")
+
+    if args.compare:
+        print_comparison(report, json.loads(args.compare.read_text()))
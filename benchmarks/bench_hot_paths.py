@@ -0,0 +1,412 @@
+"""
+Microbenchmarks of the pure-Python hot paths.
+
+Synthetic fixtures sized like real ECOS payloads (1k-100k rows) for:
+- build_statistic_data: StatisticSearch rows -> StatisticData
+- StatisticItem(**row) for StatisticItemList rows
+- response bytes -> StatisticData / List[StatisticItem], via json.loads plus
+  per-row Python (`*_loads`) and via one TypeAdapter.validate_json (`*_adapter`)
+- format_date
+- get_stats_data: catalog CSV loading
+- vector index load (index.json / mmap snapshot) and similarity search
+- prompt assembly of generate_node and select_parameters_node
+
+Reports ops/sec (best of several repeats) and the peak memory allocated by one
+call (tracemalloc). Results are saved as JSON; pass --compare with an earlier
+result file to print the change per benchmark.
+
+Usage:
+    uv run python benchmarks/bench_hot_paths.py
+    uv run python benchmarks/bench_hot_paths.py --only statistic_data format_date
+    uv run python benchmarks/bench_hot_paths.py --compare <earlier result>.json
+"""
+
+import argparse
+import csv
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+ROW_COUNTS = (1_000, 10_000, 100_000)
+INDEX_SIZES = (1_000, 10_000)
+CYCLES = ("A", "Q", "M", "D")
+
+
+# --- Fixtures --------------------------------------------------------------
+
+
+def time_label(cycle: str, n: int) -> str:
+    year = 1960 + n // 400
+    if cycle == "A":
+        return str(year)
+    if cycle == "Q":
+        return f"{year}Q{n % 4 + 1}"
+    if cycle == "M":
+        return f"{year}{n % 12 + 1:02d}"
+    return f"{year}{n % 12 + 1:02d}{n % 28 + 1:02d}"
+
+
+def search_rows(count: int, labels: int = 50) -> List[Dict[str, str]]:
+    """StatisticSearch rows: `labels` item combinations, rest spread over time."""
+    return [
+        {
+            "STAT_CODE": "901Y009",
+            "STAT_NAME": "소비자물가지수",
+            "ITEM_CODE1": f"A{n % labels:03d}",
+            "ITEM_NAME1": f"품목 {n % labels}",
+            "ITEM_NAME2": "전국" if n % 2 else None,
+            "ITEM_NAME3": None,
+            "ITEM_NAME4": None,
+            "UNIT_NAME": "2020=100",
+            "TIME": time_label("M", n // labels),
+            "DATA_VALUE": f"{100 + (n % 997) / 10:.3f}",
+        }
+        for n in range(count)
+    ]
+
+
+def item_rows(count: int) -> List[Dict[str, Any]]:
+    """StatisticItemList rows with a shallow hierarchy."""
+    return [
+        {
+            "STAT_CODE": "901Y009",
+            "STAT_NAME": "소비자물가지수",
+            "GRP_CODE": "Group1",
+            "GRP_NAME": "품목별",
+            "ITEM_CODE": f"A{n:05d}",
+            "ITEM_NAME": f"품목 {n} {'총지수' if n % 100 == 0 else '세부'}",
+            "P_ITEM_CODE": None if n % 100 == 0 else f"A{n - n % 100:05d}",
+            "P_ITEM_NAME": None,
+            "CYCLE": CYCLES[n % 4],
+            "START_TIME": "1965",
+            "END_TIME": "2025",
+            "DATA_CNT": 720,
+            "UNIT_NAME": "2020=100",
+            "WEIGHT": None,
+        }
+        for n in range(count)
+    ]
+
+
+def write_catalog(path: Path, count: int) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["STAT_CODE", "STAT_NAME", "CYCLE", "FULL_PATH"])
+        for n in range(count):
+            name = f"통계표 {n}"
+            writer.writerow(
+                [
+                    f"{n % 999:03d}Y{n:03d}",
+                    name,
+                    CYCLES[n % 4],
+                    f"분류 > {n % 40} > {name}",
+                ]
+            )
+
+
+def build_index(folder: Path, count: int, dim: int) -> Tuple[Any, Any]:
+    """index.json plus mmap snapshot of `count` random unit vectors."""
+    import numpy as np
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+    from langchain_core.vectorstores import InMemoryVectorStore
+
+    from app.core.vector_index import write_snapshot
+
+    embedding = DeterministicFakeEmbedding(size=dim)
+    store = InMemoryVectorStore(embedding=embedding)
+    rng = np.random.default_rng(0)
+    for n, vector in enumerate(rng.standard_normal((count, dim), dtype=np.float32)):
+        store.store[str(n)] = {
+            "id": str(n),
+            "vector": vector.tolist(),
+            "text": f"분류 > {n % 40} > 통계표 {n}",
+            "metadata": {"stat_code": f"{n:06d}", "stat_name": f"통계표 {n}"},
+        }
+    folder.mkdir(parents=True, exist_ok=True)
+    store.dump(str(folder / "index.json"))
+    write_snapshot(store, folder, None)
+    return embedding, rng.standard_normal(dim).tolist()
+
+
+def statistic_results(items: int, periods: int) -> List[Dict[str, Any]]:
+    """generate_node input: one statistic with `items` series of `periods` values."""
+    from app.schema.statistics import Statistic, StatisticData, StatisticItem
+
+    statistic = Statistic(
+        STAT_CODE="901Y009",
+        STAT_NAME="소비자물가지수",
+        CYCLE="M",
+        FULL_PATH="물가 > 소비자물가지수",
+    )
+    fetched = []
+    for n in range(items):
+        item = StatisticItem(
+            ITEM_CODE=f"A{n:03d}",
+            ITEM_NAME=f"품목 {n}",
+            START_TIME="196501",
+            END_TIME="202509",
+            CYCLE="M",
+        )
+        values = {time_label("M", p): f"{100 + p / 10:.1f}" for p in range(periods)}
+        data = StatisticData(unit="2020=100", data={item.name: values})
+        fetched.append({"item": item, "data": data})
+    return [
+        {
+            "statistic": statistic,
+            "sub_query": None,
+            "fetched_items": fetched,
+            "error_message": None,
+        }
+    ]
+
+
+# --- Measurement -----------------------------------------------------------
+
+
+def measure(fn: Callable[[], Any], min_time: float, repeat: int) -> Dict[str, float]:
+    """ops/sec (best repeat, auto-sized loops) and peak KiB allocated per call."""
+    fn()
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "ops_per_second": round(number / best, 2),
+        "mean_ms": round(best / number * 1000, 4),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def benchmarks(work_dir: Path, dim: int) -> Dict[str, Callable[[], Any]]:
+    """name -> zero-argument callable, with fixtures prepared up front."""
+    from app.core.dependencies import get_stats_data
+    from app.core.utils import format_date
+    from app.schema.statistics import StatisticItem
+    from app.services.ecos_service import (
+        build_statistic_data,
+        item_list_response_adapter,
+        parse_response,
+        search_response_adapter,
+    )
+    from app.workflow.ecos.item_ranker import rank_items
+    from app.workflow.ecos.nodes.generate import _build_messages as generate_messages
+    from app.workflow.ecos.nodes.select_parameters import (
+        _build_messages as select_parameters_messages,
+    )
+
+    cases: Dict[str, Callable[[], Any]] = {}
+
+    for count in ROW_COUNTS:
+        rows = search_rows(count)
+        cases[f"statistic_data[{count}]"] = lambda rows=rows: build_statistic_data(rows)
+
+    for count in ROW_COUNTS[:2]:
+        rows = item_rows(count)
+        cases[f"statistic_items[{count}]"] = lambda rows=rows: [
+            StatisticItem(**row) for row in rows
+        ]
+
+    # Whole response bodies, as get_statistic_data / get_statistic_item_list see them
+    for count in ROW_COUNTS[:2]:
+        body = json.dumps(
+            {"StatisticSearch": {"list_total_count": count, "row": search_rows(count)}},
+            ensure_ascii=False,
+        ).encode()
+        cases[f"search_body_loads[{count}]"] = lambda body=body: build_statistic_data(
+            json.loads(body)["StatisticSearch"]["row"]
+        )
+        cases[f"search_body_adapter[{count}]"] = lambda body=body: build_statistic_data(
+            parse_response(search_response_adapter, body)["StatisticSearch"]["row"]
+        )
+
+        body = json.dumps(
+            {"StatisticItemList": {"list_total_count": count, "row": item_rows(count)}},
+            ensure_ascii=False,
+        ).encode()
+        cases[f"items_body_loads[{count}]"] = lambda body=body: [
+            StatisticItem(**row) for row in json.loads(body)["StatisticItemList"]["row"]
+        ]
+        cases[f"items_body_adapter[{count}]"] = lambda body=body: parse_response(
+            item_list_response_adapter, body
+        )["StatisticItemList"]["row"]
+
+    rng = random.Random(0)
+    dates = []
+    for n in range(10_000):
+        cycle = CYCLES[n % 4]
+        label = time_label(cycle, rng.randrange(20_000))
+        dates.append((f"{label[:4]}-{label[4:]}" if n % 2 else label, cycle))
+    cases["format_date[10000]"] = lambda: [format_date(d, c) for d, c in dates]
+
+    for count in (640, 10_000):
+        catalog_dir = work_dir / f"catalog_{count}"
+        catalog_dir.mkdir()
+        write_catalog(catalog_dir / "ecos_statistics.csv", count)
+
+        def load_catalog(folder: Path = catalog_dir):
+            os.environ["BENCH_CATALOG"] = str(folder)
+            return get_stats_data.__wrapped__()
+
+        cases[f"stats_catalog[{count}]"] = load_catalog
+
+    for count in INDEX_SIZES:
+        from langchain_core.vectorstores import InMemoryVectorStore
+
+        from app.core.vector_index import MmapVectorIndex
+
+        folder = work_dir / f"index_{count}"
+        embedding, query = build_index(folder, count, dim)
+        store = InMemoryVectorStore.load(str(folder / "index.json"), embedding)
+        mmap_index = MmapVectorIndex(folder, embedding)
+
+        cases[f"index_load_json[{count}]"] = lambda f=folder, e=embedding: (
+            InMemoryVectorStore.load(str(f / "index.json"), e)
+        )
+        cases[f"index_load_mmap[{count}]"] = lambda f=folder, e=embedding: (
+            MmapVectorIndex(f, e)
+        )
+        cases[f"search_memory[{count}]"] = lambda s=store, q=query: (
+            s.similarity_search_by_vector(q, k=10)
+        )
+        cases[f"search_mmap[{count}]"] = lambda s=mmap_index, q=query: (
+            s.similarity_search_by_vector(q, k=10)
+        )
+
+    results = statistic_results(items=20, periods=240)
+    generate_state = {"query": "품목별 소비자물가 추이", "statistic_results": results}
+    cases["generate_prompt[20x240]"] = lambda: generate_messages(generate_state)
+
+    items = [StatisticItem(**row) for row in item_rows(1_000)]
+    branch_state = {
+        "query": "품목 42 소비자물가",
+        "sub_query": None,
+        "selected_statistic": results[0]["statistic"],
+        "found_items": items,
+        "failed_requests": [],
+        "retry_counts": {},
+    }
+
+    def select_parameters_prompt():
+        shown = rank_items(branch_state["query"], items, 30)
+        options = "\n".join(str(item) for item in shown)
+        return select_parameters_messages(branch_state, options)
+
+    cases["select_parameters_prompt[1000]"] = select_parameters_prompt
+    return cases
+
+
+# --- Reporting -------------------------------------------------------------
+
+
+def git_commit() -> Optional[str]:
+    result = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip() or None
+
+
+def print_comparison(current: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    print(f"\n== vs {baseline.get('commit')} ({baseline.get('timestamp')})")
+    for name, result in current["benchmarks"].items():
+        old = baseline.get("benchmarks", {}).get(name)
+        if not old:
+            continue
+        speedup = result["ops_per_second"] / old["ops_per_second"]
+        print(
+            f"{name:<36} {old['ops_per_second']:>12.1f} -> "
+            f"{result['ops_per_second']:>12.1f} ops/s ({speedup:.2f}x), "
+            f"peak {old['peak_kib']} -> {result['peak_kib']} KiB"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--only", nargs="*", help="Benchmark name prefixes to run")
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--compare", type=Path)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        # get_stats_data reads DATA_DIR from settings; point it at the fixtures
+        os.environ["DATA_DIR"] = work_dir
+        os.environ.setdefault("OPENAI_API_KEY", "bench")
+
+        import app.core.dependencies as dependencies
+
+        dependencies.get_data_path = lambda: (
+            Path(os.environ["BENCH_CATALOG"]) / "ecos_statistics.csv"
+        )
+        # Importing the ECOS nodes builds the statistics repository: use the
+        # real catalog with fake embeddings for that
+        os.environ["BENCH_CATALOG"] = str(ROOT / "data")
+        from langchain_core.embeddings import DeterministicFakeEmbedding
+
+        embeddings = DeterministicFakeEmbedding(size=64)
+        dependencies.get_embeddings = lambda: embeddings
+
+        cases = benchmarks(Path(work_dir), args.dim)
+        selected = {
+            name: fn
+            for name, fn in cases.items()
+            if not args.only or any(name.startswith(prefix) for prefix in args.only)
+        }
+
+        print(f"{'benchmark':<36} {'ops/s':>12} {'mean ms':>10} {'peak KiB':>10}")
+        results = {}
+        for name, fn in selected.items():
+            results[name] = measure(fn, args.min_time, args.repeat)
+            r = results[name]
+            print(
+                f"{name:<36} {r['ops_per_second']:>12.1f} "
+                f"{r['mean_ms']:>10.3f} {r['peak_kib']:>10.1f}"
+            )
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "benchmarks": results,
+    }
+    output = args.output or ROOT / "benchmarks" / "results" / f"micro-{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    print(f"\nSaved {output}")
+
+    if args.compare:
+        print_comparison(report, json.loads(args.compare.read_text()))
@@ -0,0 +1,153 @@
+"""
+Per-worker memory and startup time of the statistics catalog and index.
+
+Starts N worker processes at once (like `uvicorn --workers N`); each loads the
+statistics repository and runs one search. Reports per-worker load time, RSS,
+PSS (shared pages split between processes) and private memory, for the
+'memory' (parsed index.json per worker) and 'mmap' (shared snapshot) backends.
+
+By default a synthetic 1536-dim index over the real catalog is built in a
+temporary DATA_DIR, so no network access is needed.
+
+Usage:
+    uv run python benchmarks/bench_shared_index.py
+    uv run python benchmarks/bench_shared_index.py --workers 1 4 8 --data-dir /data
+"""
+
+import argparse
+import multiprocessing
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+
+def memory_kib() -> dict:
+    """Rss/Pss/Private of this process from /proc (Linux only)."""
+    values = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            if key in ("Rss", "Pss", "Private_Clean", "Private_Dirty"):
+                values[key] = int(rest.split()[0])
+    return {
+        "rss": values["Rss"],
+        "pss": values["Pss"],
+        "private": values["Private_Clean"] + values["Private_Dirty"],
+    }
+
+
+def worker(env: dict, start: multiprocessing.Barrier, done, results) -> None:
+    os.environ.update(env)
+    from app.core.dependencies import get_vector_store
+    from app.repository.statistics import get_statistics_repository
+
+    start.wait()
+    before = memory_kib()
+    started = time.perf_counter()
+    get_statistics_repository()
+    get_vector_store().similarity_search_by_vector([0.1] * int(env["BENCH_DIM"]), k=5)
+    elapsed = time.perf_counter() - started
+    after = memory_kib()
+
+    # Stay alive until every worker has measured, so shared pages are shared
+    done.wait()
+    results.put(
+        {
+            "seconds": elapsed,
+            **{key: after[key] for key in after},
+            "rss_delta": after["rss"] - before["rss"],
+        }
+    )
+    done.wait()
+
+
+def build_synthetic_data(folder: Path, dim: int) -> None:
+    from langchain_core.documents import Document
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+    from langchain_core.vectorstores import InMemoryVectorStore
+
+    from app.core.dependencies import get_stats_data
+
+    shutil.copy(ROOT / "data" / "ecos_statistics.csv", folder / "ecos_statistics.csv")
+    documents = [
+        Document(
+            page_content=stat.full_path,
+            metadata={"stat_code": stat.stat_code, "stat_name": stat.stat_name},
+        )
+        for stat in get_stats_data()
+    ]
+    store = InMemoryVectorStore.from_documents(
+        documents, DeterministicFakeEmbedding(size=dim)
+    )
+    store.dump(str(folder / "index.json"))
+
+
+def run(backend: str, workers: int, data_dir: str, dim: int) -> dict:
+    env = {
+        "DATA_DIR": data_dir,
+        "VECTOR_INDEX_BACKEND": backend,
+        "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY") or "benchmark",
+        "BENCH_DIM": str(dim),
+    }
+    context = multiprocessing.get_context("spawn")
+    start = context.Barrier(workers)
+    done = context.Barrier(workers)
+    results = context.Queue()
+    processes = [
+        context.Process(target=worker, args=(env, start, done, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    rows = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    return {
+        key: statistics.mean(row[key] for row in rows)
+        for key in ("seconds", "rss", "pss", "private", "rss_delta")
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir
+        if data_dir is None:
+            data_dir = tmp
+            os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+            build_synthetic_data(Path(tmp), args.dim)
+
+        # Build the shared snapshot once, as the first worker of a deployment would
+        run("mmap", 1, data_dir, args.dim)
+
+        print(f"DATA_DIR: {data_dir}")
+        print(
+            f"{'backend':<8} {'workers':>7} {'load s':>7} {'RSS MiB':>8} "
+            f"{'PSS MiB':>8} {'private':>8} {'index Δ':>8}"
+        )
+        for backend in args.backends:
+            for workers in args.workers:
+                r = run(backend, workers, data_dir, args.dim)
+                print(
+                    f"{backend:<8} {workers:>7} {r['seconds']:>7.3f} "
+                    f"{r['rss'] / 1024:>8.1f} {r['pss'] / 1024:>8.1f} "
+                    f"{r['private'] / 1024:>8.1f} {r['rss_delta'] / 1024:>8.1f}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--data-dir", help="Use this DATA_DIR (with index.json)")
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 4, 8])
+    parser.add_argument(
+        "--backends", nargs="+", default=["memory", "mmap"], choices=["memory", "mmap"]
+    )
+    parser.add_argument("--dim", type=int, default=1536, help="Synthetic index size")
+    main(parser.parse_args())
@@ -0,0 +1,314 @@
+"""
+Concurrent-session load test of the MCP streamable HTTP endpoint.
+
+Starts the app (uvicorn, `app.main:app`) in a subprocess with the local
+ECOS/Naver/LLM stand-ins of bench_e2e.py, then opens many MCP sessions that
+call `ask_ecos_agent` / `ask_news_agent` in a configurable mix. Each step of
+the ramp runs N sessions for a fixed duration and reports p50/p95/p99 call
+latency, throughput, error rate, the server RSS over time and the latency of
+/health probes sent alongside (a proxy for event-loop blocking). The step
+where throughput stops growing and latency takes off is the concurrency knee.
+
+Usage:
+    uv run python benchmarks/load_mcp.py
+    uv run python benchmarks/load_mcp.py --sessions 10 50 100 200 --duration 30
+    uv run python benchmarks/load_mcp.py --mix ecos=0.3,news=0.7 --llm-latency 0.5
+    uv run python benchmarks/load_mcp.py --url http://localhost:8000 --server-pid 1234
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+TOOLS = {
+    "ecos": ("ask_ecos_agent", "GDP 성장률과 실업률"),
+    "news": ("ask_news_agent", "한국은행 기준금리 전망"),
+}
+
+
+# --- Server ----------------------------------------------------------------
+
+
+def serve(port: int, llm_latency: float, upstream_latency: float) -> None:
+    """Run the app on `port` with stubbed upstreams (subprocess entry point)."""
+    import uvicorn
+    from bench_e2e import install_stand_ins
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        install_stand_ins(Path(data_dir), llm_latency, upstream_latency)
+        uvicorn.run("app.main:app", host="127.0.0.1", port=port, log_level="warning")
+
+
+def start_server(args: argparse.Namespace) -> subprocess.Popen:
+    command = [
+        sys.executable,
+        __file__,
+        "--serve",
+        "--port",
+        str(args.port),
+        "--llm-latency",
+        str(args.llm_latency),
+        "--upstream-latency",
+        str(args.upstream_latency),
+    ]
+    env = {**os.environ, "LOG_LEVEL": os.environ.get("LOG_LEVEL", "WARNING")}
+    return subprocess.Popen(command, cwd=ROOT, env=env)
+
+
+async def wait_ready(url: str, timeout: float = 120.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(f"{url}/ready")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.5)
+    raise TimeoutError(f"{url} not ready after {timeout:.0f}s")
+
+
+def rss_mib(pid: int) -> Optional[float]:
+    """Resident memory of a process, from /proc (Linux only)."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+
+# --- Load ------------------------------------------------------------------
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name not in TOOLS:
+            raise argparse.ArgumentTypeError(f"Unknown tool '{name}' in mix")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(int(q * len(ordered)), len(ordered) - 1)], 4)
+
+
+async def session_worker(
+    url: str, mix: Dict[str, float], stop_at: float, results: Dict[str, list]
+) -> None:
+    """One MCP session calling tools back to back until `stop_at`."""
+    from mcp import ClientSession
+    from mcp.client.streamable_http import streamablehttp_client
+
+    names, weights = list(mix), list(mix.values())
+    try:
+        async with streamablehttp_client(f"{url}/mcp", timeout=120) as (
+            read,
+            write,
+            _,
+        ):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                while time.monotonic() < stop_at:
+                    tool, query = TOOLS[random.choices(names, weights)[0]]
+                    started = time.perf_counter()
+                    try:
+                        result = await session.call_tool(tool, {"query": query})
+                        ok = not result.isError
+                    except Exception as e:
+                        ok = False
+                        results["errors"].append(f"{type(e).__name__}: {e}")
+                    elapsed = time.perf_counter() - started
+                    results["latencies" if ok else "failed"].append(elapsed)
+                    results["by_tool"].setdefault(tool, []).append(elapsed)
+    except Exception as e:
+        results["errors"].append(f"session: {type(e).__name__}: {e}")
+
+
+async def monitor(
+    url: str, pid: Optional[int], stop: asyncio.Event, samples: Dict[str, list]
+) -> None:
+    """RSS and /health latency every 0.5s while the step runs."""
+    started = time.monotonic()
+    async with httpx.AsyncClient(timeout=30) as client:
+        while not stop.is_set():
+            probe_started = time.perf_counter()
+            try:
+                await client.get(f"{url}/health")
+                samples["health"].append(time.perf_counter() - probe_started)
+            except httpx.HTTPError:
+                samples["health_errors"].append(time.monotonic() - started)
+            if pid:
+                rss = rss_mib(pid)
+                if rss is not None:
+                    samples["rss"].append((round(time.monotonic() - started, 1), rss))
+            try:
+                await asyncio.wait_for(stop.wait(), 0.5)
+            except asyncio.TimeoutError:
+                pass
+
+
+async def run_step(
+    url: str, sessions: int, duration: float, mix: Dict[str, float], pid: Optional[int]
+) -> Dict[str, Any]:
+    results: Dict[str, list] = {"latencies": [], "failed": [], "errors": []}
+    results["by_tool"] = {}
+    samples: Dict[str, list] = {"health": [], "health_errors": [], "rss": []}
+    stop = asyncio.Event()
+    monitor_task = asyncio.create_task(monitor(url, pid, stop, samples))
+
+    started = time.monotonic()
+    stop_at = started + duration
+    await asyncio.gather(
+        *(session_worker(url, mix, stop_at, results) for _ in range(sessions))
+    )
+    wall = time.monotonic() - started
+    stop.set()
+    await monitor_task
+
+    latencies = results["latencies"]
+    calls = len(latencies) + len(results["failed"])
+    rss = [value for _, value in samples["rss"]]
+    return {
+        "sessions": sessions,
+        "wall_seconds": round(wall, 2),
+        "calls": calls,
+        "throughput_per_second": round(len(latencies) / wall, 3),
+        "error_rate": round(len(results["failed"]) / calls, 4) if calls else None,
+        "session_errors": len(
+            [e for e in results["errors"] if e.startswith("session:")]
+        ),
+        "first_error": results["errors"][0] if results["errors"] else None,
+        "latency": {
+            "p50": percentile(latencies, 0.5),
+            "p95": percentile(latencies, 0.95),
+            "p99": percentile(latencies, 0.99),
+        },
+        "latency_by_tool": {
+            tool: {"calls": len(values), "p50": percentile(values, 0.5)}
+            for tool, values in results["by_tool"].items()
+        },
+        "health_probe": {
+            "p50": percentile(samples["health"], 0.5),
+            "p99": percentile(samples["health"], 0.99),
+            "max": round(max(samples["health"]), 4) if samples["health"] else None,
+            "errors": len(samples["health_errors"]),
+        },
+        "rss_mib": {
+            "start": round(rss[0], 1) if rss else None,
+            "max": round(max(rss), 1) if rss else None,
+            "end": round(rss[-1], 1) if rss else None,
+            "samples": samples["rss"],
+        },
+    }
+
+
+def print_step(step: Dict[str, Any]) -> None:
+    latency, health, rss = step["latency"], step["health_probe"], step["rss_mib"]
+
+    def fmt(value: Optional[float]) -> str:
+        return f"{value:.3f}" if value is not None else "-"
+
+    print(
+        f"{step['sessions']:>8} {step['calls']:>7} "
+        f"{step['throughput_per_second']:>8.2f} {fmt(latency['p50']):>7} "
+        f"{fmt(latency['p95']):>7} {fmt(latency['p99']):>7} "
+        f"{(step['error_rate'] or 0) * 100:>6.1f}% "
+        f"{fmt(health['p99']):>8} {rss['max'] or 0:>8.1f}"
+    )
+    if step["first_error"]:
+        print(f"         first error: {step['first_error'][:200]}")
+
+
+def git_commit() -> Optional[str]:
+    result = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip() or None
+
+
+async def main(args: argparse.Namespace, url: str, pid: Optional[int]) -> List[dict]:
+    await wait_ready(url)
+    print(
+        f"{'sessions':>8} {'calls':>7} {'calls/s':>8} {'p50':>7} {'p95':>7} "
+        f"{'p99':>7} {'errors':>7} {'health99':>8} {'RSS MiB':>8}"
+    )
+    steps = []
+    for sessions in args.sessions:
+        step = await run_step(url, sessions, args.duration, args.mix, pid)
+        print_step(step)
+        steps.append(step)
+    return steps
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[10, 50, 100])
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("ecos=0.5,news=0.5"))
+    parser.add_argument("--llm-latency", type=float, default=0.2)
+    parser.add_argument("--upstream-latency", type=float, default=0.05)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--url", help="Load an already running server instead")
+    parser.add_argument("--server-pid", type=int, help="PID of --url, for RSS")
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.port, args.llm_latency, args.upstream_latency)
+        sys.exit(0)
+
+    server = None
+    if args.url:
+        url, pid = args.url.rstrip("/"), args.server_pid
+    else:
+        server = start_server(args)
+        url, pid = f"http://127.0.0.1:{args.port}", server.pid
+
+    try:
+        steps = asyncio.run(main(args, url, pid))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "config": {
+            "duration": args.duration,
+            "mix": args.mix,
+            "llm_latency": args.llm_latency,
+            "upstream_latency": args.upstream_latency,
+        },
+        "steps": steps,
+    }
+    output = args.output or ROOT / "benchmarks" / "results" / f"mcp-load-{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    print(f"\nSaved {output}")
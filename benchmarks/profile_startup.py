@@ -0,0 +1,72 @@
+"""
+Import-time profile of the app.
+
+Runs `python -X importtime` in a fresh interpreter for each module and reports
+total import time, the slowest top-level packages and the slowest modules
+(cumulative, including their own imports).
+
+Usage:
+    uv run python benchmarks/profile_startup.py
+    uv run python benchmarks/profile_startup.py app.main app.routes --top 20
+"""
+
+import argparse
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_MODULES = ["app.main", "app.routes", "app.mcp_server"]
+
+
+def import_times(module: str) -> List[Tuple[str, int, int, int]]:
+    """(module, self_us, cumulative_us, depth) for every module imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def report(module: str, top: int) -> None:
+    rows = import_times(module)
+    total_ms = sum(row[1] for row in rows) / 1000
+
+    by_package: Dict[str, int] = defaultdict(int)
+    for name, self_us, _, _ in rows:
+        by_package[name.split(".")[0]] += self_us
+
+    print(f"\n== import {module}: {total_ms:.0f} ms, {len(rows)} modules")
+    print(f"{'package':<32} {'ms':>8}")
+    for package, self_us in sorted(by_package.items(), key=lambda x: -x[1])[:top]:
+        print(f"{package:<32} {self_us / 1000:>8.1f}")
+
+    print(f"\n{'module (cumulative)':<48} {'ms':>8}")
+    # Only modules imported by the app itself or directly by it
+    app_rows = [row for row in rows if row[0].startswith("app.") or row[3] <= 2]
+    for name, _, cumulative_us, _ in sorted(app_rows, key=lambda x: -x[2])[:top]:
+        print(f"{name:<48} {cumulative_us / 1000:>8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--top", type=int, default=12)
+    args = parser.parse_args()
+
+    for module in args.modules:
+        report(module, args.top)
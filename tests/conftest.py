@@ -0,0 +1,27 @@
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+# Unit tests never reach the real APIs; settings only need to load
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("ECOS_API_KEY", "test")
+os.environ["NLTK_DOWNLOAD"] = "false"
+
+# Index, caches and checkpoints go to a scratch copy of the data folder
+DATA_DIR = Path(tempfile.mkdtemp(prefix="ecos-agent-tests-"))
+shutil.copy(ROOT / "data" / "ecos_statistics.csv", DATA_DIR)
+os.environ["DATA_DIR"] = str(DATA_DIR)
+os.environ["VECTOR_INDEX_BACKEND"] = "memory"
+
+from langchain_core.embeddings import DeterministicFakeEmbedding  # noqa: E402
+
+import app.core.dependencies as dependencies  # noqa: E402
+
+# Importing the ECOS graph builds the statistics index: embed offline
+_embeddings = DeterministicFakeEmbedding(size=64)
+dependencies.get_embeddings = lambda: _embeddings
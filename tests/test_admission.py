@@ -0,0 +1,71 @@
+import asyncio
+import inspect
+
+import pytest
+
+from app.core.admission import AdmissionController, ServerBusyError, admitted
+
+
+def make_tool(controller, release: asyncio.Event):
+    @admitted(controller)
+    async def tool(value: int) -> int:
+        """Tool docstring"""
+        await release.wait()
+        return value
+
+    return tool
+
+
+def test_calls_over_the_queue_limit_are_rejected_at_once():
+    async def scenario():
+        controller = AdmissionController(
+            "test", max_concurrency=1, max_queue=1, queue_timeout=5
+        )
+        release = asyncio.Event()
+        tool = make_tool(controller, release)
+
+        running = asyncio.create_task(tool(1))
+        queued = asyncio.create_task(tool(2))
+        await asyncio.sleep(0)
+        assert (controller.running, controller.waiting) == (1, 1)
+
+        with pytest.raises(ServerBusyError) as busy:
+            await tool(3)
+        assert busy.value.retry_after == 5
+
+        release.set()
+        assert await asyncio.gather(running, queued) == [1, 2]
+        assert (controller.running, controller.waiting) == (0, 0)
+
+    asyncio.run(scenario())
+
+
+def test_queued_calls_time_out_and_free_their_place():
+    async def scenario():
+        controller = AdmissionController(
+            "test", max_concurrency=1, max_queue=4, queue_timeout=0.05
+        )
+        release = asyncio.Event()
+        tool = make_tool(controller, release)
+
+        running = asyncio.create_task(tool(1))
+        await asyncio.sleep(0)
+        with pytest.raises(ServerBusyError, match="no test slot within 0.05s"):
+            await tool(2)
+        assert controller.waiting == 0
+
+        release.set()
+        assert await running == 1
+        # The slot is free again
+        assert await tool(3) == 3
+
+    asyncio.run(scenario())
+
+
+def test_admitted_keeps_the_signature():
+    controller = AdmissionController(
+        "test", max_concurrency=1, max_queue=1, queue_timeout=1
+    )
+    tool = make_tool(controller, asyncio.Event())
+    assert tool.__doc__ == "Tool docstring"
+    assert list(inspect.signature(tool).parameters) == ["value"]
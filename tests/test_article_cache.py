@@ -0,0 +1,128 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.repository import article_cache
+from app.repository.article_cache import ArticleCacheRepository
+from app.schema.news import NewsItem
+from app.services import news_service as news_service_module
+from app.services.news_service import NewsService
+
+TTL = 3600
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=1_000_000.0)
+    monkeypatch.setattr(article_cache, "time", SimpleNamespace(time=lambda: clock.now))
+    return clock
+
+
+def make_cache(tmp_path, max_entries=100):
+    return ArticleCacheRepository(
+        tmp_path / "articles.sqlite", ttl_seconds=TTL, max_entries=max_entries
+    )
+
+
+def make_item(title):
+    return NewsItem(title=title, text=f"{title} 본문", publish_date="2024-12-02")
+
+
+def test_round_trip_with_validators(tmp_path, clock):
+    cache = make_cache(tmp_path)
+    cache.put("https://a.com/1", make_item("a"), '"v1"', "Mon, 02 Dec 2024")
+
+    cached = cache.get("https://a.com/1")
+    assert cached.item == make_item("a")
+    assert (cached.etag, cached.last_modified) == ('"v1"', "Mon, 02 Dec 2024")
+    assert cached.fetched_at == clock.now
+    assert cache.get("https://a.com/2") is None
+    assert cache.count() == 1
+
+
+def test_expired_entries_are_missed_and_deleted_by_the_next_put(tmp_path, clock):
+    cache = make_cache(tmp_path)
+    cache.put("https://a.com/1", make_item("a"), None, None)
+
+    clock.now += TTL + 1
+    assert cache.get("https://a.com/1") is None
+    # get() is read-only: the row is removed with the next write
+    assert cache.count() == 1
+    cache.put("https://a.com/2", make_item("b"), None, None)
+    assert cache.count() == 1
+    assert cache.evictions == 1
+
+
+def test_touch_renews_an_entry(tmp_path, clock):
+    cache = make_cache(tmp_path)
+    cache.put("https://a.com/1", make_item("a"), '"v1"', None)
+
+    clock.now += TTL - 1
+    cache.touch("https://a.com/1")
+    clock.now += TTL - 1
+    assert cache.get("https://a.com/1").fetched_at == clock.now - (TTL - 1)
+
+
+def test_overflow_evicts_least_recently_read(tmp_path, clock):
+    cache = make_cache(tmp_path, max_entries=2)
+    cache.put("https://a.com/1", make_item("a"), None, None)
+    clock.now += 1
+    cache.put("https://a.com/2", make_item("b"), None, None)
+    clock.now += 1
+    # Only noted in memory; written before the eviction of the next put
+    assert cache.get("https://a.com/1") is not None
+    clock.now += 1
+    cache.put("https://a.com/3", make_item("c"), None, None)
+
+    assert cache.get("https://a.com/2") is None
+    assert cache.get("https://a.com/1") is not None
+    assert cache.get("https://a.com/3") is not None
+    assert cache.evictions == 1
+
+
+def test_etag_revalidation_round_trip(tmp_path, monkeypatch):
+    cache = make_cache(tmp_path)
+    monkeypatch.setattr(news_service_module, "get_article_cache", lambda: cache)
+    url = "https://news.example.com/article/1"
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "text/html", "ETag": '"v1"'},
+            content=b"<html><body><main>article</main></body></html>",
+        )
+
+    async def parse(url, html, encoding=None):
+        return "제목", "기사 본문", "2024-12-02"
+
+    service = NewsService()
+    service.transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(service.parser, "parse", parse)
+
+    async def load():
+        return await service._load_article(url)
+
+    # Miss: fetched, parsed and stored with its ETag
+    first = asyncio.run(load())
+    assert cache.get(url).etag == '"v1"'
+
+    # Fresh: served from the cache without a request
+    assert asyncio.run(load()) == first
+    assert len(requests) == 1
+
+    # Stale: conditional GET, 304 renews the entry
+    # Past NEWS_ARTICLE_CACHE_FRESH_SECONDS (600), within the TTL
+    stale = cache.get(url).fetched_at - 1000
+    cache._conn.execute("UPDATE articles SET fetched_at = ?", (stale,))
+    assert asyncio.run(load()) == first
+    assert requests[-1].headers["If-None-Match"] == '"v1"'
+    assert cache.get(url).fetched_at > stale
+
+    stats = service.article_cache_stats
+    assert (stats.misses, stats.hits, stats.revalidated) == (1, 1, 1)
@@ -0,0 +1,54 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+
+from app.core.http import read_capped
+from app.services.news_service import MAIN_CONTENT_END
+
+FIXTURE = Path(__file__).parent / "fixtures" / "article_with_teasers.html"
+
+
+def chunked_response(body: bytes, chunk_size: int = 128) -> httpx.Response:
+    async def stream():
+        for start in range(0, len(body), chunk_size):
+            yield body[start : start + chunk_size]
+
+    return httpx.Response(200, content=stream())
+
+
+def read(body: bytes, max_bytes: int = 512 * 1024):
+    return asyncio.run(read_capped(chunked_response(body), max_bytes, MAIN_CONTENT_END))
+
+
+def test_teaser_cards_do_not_end_the_read():
+    html, truncated = read(FIXTURE.read_bytes())
+    text = html.decode()
+
+    # The "most read" <article> cards come first; the story must survive them
+    assert "기준금리를 연 3.25%로 동결했다" in text
+    assert "추가 인하 가능성" in text
+    assert "</main>" in text
+    assert truncated
+
+
+def test_stops_after_main_content():
+    body = FIXTURE.read_bytes()
+    html, _ = read(body)
+
+    # The footer and trailing scripts are not downloaded
+    assert len(html) < len(body)
+    assert b"tracking" not in html
+
+
+def test_byte_cap():
+    html, truncated = read(b"<html><body>" + b"x" * 10_000, max_bytes=1000)
+    assert len(html) == 1000
+    assert truncated
+
+
+def test_full_read_without_marker():
+    body = b"<html><div>" + "본문".encode() * 500 + b"</div>"
+    html, truncated = read(body)
+    assert html == body
+    assert not truncated
@@ -0,0 +1,99 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+from typing_extensions import TypedDict
+
+from app.core import checkpointer
+from app.core.checkpointer import BoundedMemorySaver, LazySqliteSaver
+
+
+class CounterState(TypedDict):
+    count: int
+
+
+def build_graph(checkpointer):
+    builder = StateGraph(CounterState)
+    builder.add_node("increment", lambda state: {"count": state["count"] + 1})
+    builder.add_edge(START, "increment")
+    builder.add_edge("increment", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+def run(graph, thread_id):
+    return graph.invoke({"count": 0}, {"configurable": {"thread_id": thread_id}})
+
+
+def has_state(graph, thread_id):
+    config = {"configurable": {"thread_id": thread_id}}
+    return graph.get_state(config).values != {}
+
+
+def test_bounded_saver_evicts_least_recently_used_thread():
+    saver = BoundedMemorySaver(max_threads=2)
+    graph = build_graph(saver)
+    run(graph, "t1")
+    run(graph, "t2")
+    # Reading t1 makes t2 the least recently used
+    assert has_state(graph, "t1")
+    run(graph, "t3")
+
+    assert not has_state(graph, "t2")
+    assert has_state(graph, "t1") and has_state(graph, "t3")
+    assert saver.stats()["threads"] == 2
+    assert saver.stats()["evictions"]["lru"] == 1
+
+
+def test_bounded_saver_evicts_by_size():
+    probe = BoundedMemorySaver()
+    run(build_graph(probe), "t1")
+    thread_bytes = probe.stats()["bytes"]
+    assert thread_bytes > 0
+
+    saver = BoundedMemorySaver(max_bytes=thread_bytes * 3 // 2)
+    graph = build_graph(saver)
+    run(graph, "t1")
+    run(graph, "t2")
+
+    assert not has_state(graph, "t1")
+    assert has_state(graph, "t2")
+    assert saver.stats()["bytes"] <= saver.max_bytes
+    assert saver.stats()["evictions"]["size"] == 1
+
+
+def test_bounded_saver_expires_idle_threads(monkeypatch):
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(
+        checkpointer, "time", SimpleNamespace(monotonic=lambda: clock.now)
+    )
+    saver = BoundedMemorySaver(ttl_seconds=60)
+    graph = build_graph(saver)
+    run(graph, "t1")
+
+    clock.now += 30
+    assert has_state(graph, "t1")
+    clock.now += 61
+    assert not has_state(graph, "t1")
+    assert saver.stats()["threads"] == 0
+    assert saver.stats()["evictions"]["ttl"] == 1
+
+
+def test_sqlite_saver_sync_and_async(tmp_path):
+    pytest.importorskip("langgraph.checkpoint.sqlite")
+    graph = build_graph(LazySqliteSaver(str(tmp_path / "checkpoints.sqlite")))
+    config = {"configurable": {"thread_id": "t1"}}
+
+    # Sync and async calls see the same file
+    assert graph.invoke({"count": 0}, config)["count"] == 1
+    assert graph.get_state(config).values["count"] == 1
+
+    async def run_async():
+        await graph.ainvoke({"count": 10}, config)
+        return await graph.aget_state(config)
+
+    assert asyncio.run(run_async()).values["count"] == 11
+    assert graph.get_state(config).values["count"] == 11
+
+    graph.checkpointer.delete_thread("t1")
+    assert graph.get_state(config).values == {}
@@ -0,0 +1,89 @@
+import asyncio
+import time
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from app.agent.middleware import deadline_model_call
+from app.core.deadline import DeadlineExceeded, DeadlineMiddleware, deadline_scope
+
+
+def call_model(handler, deadline):
+    async def run():
+        with deadline_scope(deadline):
+            return await deadline_model_call.awrap_model_call(None, handler)
+
+    return asyncio.run(run())
+
+
+def test_model_call_within_budget():
+    async def handler(request):
+        return AIMessage(content="answer")
+
+    assert call_model(handler, time.time() + 60).content == "answer"
+
+
+def test_model_call_is_cut_to_the_remaining_budget():
+    async def handler(request):
+        await asyncio.sleep(30)
+
+    started = time.perf_counter()
+    with pytest.raises(asyncio.TimeoutError):
+        call_model(handler, time.time() + 0.2)
+    # Never below the minimum timeout, far below LLM_TIMEOUT
+    assert time.perf_counter() - started < 5
+
+
+def test_no_model_call_after_the_deadline():
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+
+    with pytest.raises(DeadlineExceeded):
+        call_model(handler, time.time() - 1)
+    assert calls == []
+
+
+def run_asgi(app, path="/ecos"):
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "path": path, "method": "POST", "headers": []}
+    asyncio.run(app(scope, receive, send))
+    return messages
+
+
+def test_run_without_response_gets_504_at_the_deadline():
+    async def slow_app(scope, receive, send):
+        await asyncio.sleep(30)
+
+    started = time.perf_counter()
+    messages = run_asgi(DeadlineMiddleware(slow_app, budget=0.1))
+
+    assert time.perf_counter() - started < 5
+    assert messages[0]["status"] == 504
+
+
+def test_started_stream_is_closed_at_the_deadline():
+    async def streaming_app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"event", "more_body": True})
+        await asyncio.sleep(30)
+
+    messages = run_asgi(DeadlineMiddleware(streaming_app, budget=0.1))
+    assert [message.get("status") for message in messages] == [200, None]
+
+
+def test_other_paths_have_no_deadline():
+    async def app(scope, receive, send):
+        await asyncio.sleep(0.2)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    messages = run_asgi(DeadlineMiddleware(app, budget=0.05), path="/health")
+    assert messages[0]["status"] == 200
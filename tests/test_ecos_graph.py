@@ -0,0 +1,116 @@
+import asyncio
+import time
+import uuid
+
+import httpx
+from langchain_core.messages import AIMessage
+
+from app.core.deadline import DEADLINE_KEY
+from app.schema.statistics import Statistic, StatisticData, StatisticItem
+from app.workflow.ecos.graph import ecos_graph
+from app.workflow.ecos.nodes import fetch_statistics, generate
+from app.workflow.ecos.retry import retry_metrics
+
+PREVIOUS_RESULTS = [
+    {
+        "statistic": Statistic(
+            stat_code="901Y009",
+            stat_name="소비자물가지수",
+            cycle="M",
+            full_path="물가 > 소비자물가지수",
+        ),
+        "sub_query": None,
+        "fetched_items": [
+            {
+                "item": StatisticItem(
+                    code="0",
+                    name="총지수",
+                    start_time="196501",
+                    end_time="202412",
+                    cycle="M",
+                ),
+                "data": StatisticData(
+                    unit="2020=100", data={"총지수": {"202412": "114.91"}}
+                ),
+            }
+        ],
+        "error_message": None,
+    }
+]
+
+
+class RecordingLLM:
+    def __init__(self):
+        self.prompts = []
+
+    async def ainvoke(self, messages):
+        self.prompts.append("\n".join(message.content for message in messages))
+        return AIMessage(content="answer")
+
+
+def run_second_query(monkeypatch, deadline: float):
+    """Reuse a thread that holds results, with a query that finds nothing."""
+    llm = RecordingLLM()
+    monkeypatch.setattr(generate, "get_chat_model", lambda: llm)
+    monkeypatch.setattr(
+        fetch_statistics.statistics_service, "search", lambda query, k: []
+    )
+
+    async def run():
+        config = {
+            "configurable": {"thread_id": str(uuid.uuid4()), DEADLINE_KEY: deadline}
+        }
+        await ecos_graph.aupdate_state(config, {"statistic_results": PREVIOUS_RESULTS})
+        result = await ecos_graph.ainvoke(
+            {"query": "없는 통계", "messages": [], "retry_counts": {}}, config=config
+        )
+        return result, llm
+
+    return asyncio.run(run())
+
+
+def test_failed_query_clears_previous_results(monkeypatch):
+    result, llm = run_second_query(monkeypatch, deadline=time.time() + 3600)
+
+    assert result["statistic_results"] == []
+    assert result["error_kind"] == "no_data"
+    assert llm.prompts == []
+
+
+def test_early_answer_does_not_use_previous_results(monkeypatch):
+    # Budget below the reserve: the failed search goes straight to the answer
+    result, llm = run_second_query(monkeypatch, deadline=time.time() + 1)
+
+    assert result["statistic_results"] == []
+    assert len(llm.prompts) == 1
+    assert "114.91" not in llm.prompts[0]
+
+
+def test_transient_search_errors_are_retried(monkeypatch):
+    calls = []
+
+    def search(query, k):
+        calls.append(query)
+        raise httpx.ConnectError("embeddings unreachable")
+
+    monkeypatch.setattr(fetch_statistics.statistics_service, "search", search)
+    before = retry_metrics.retries[("fetch_statistics", "transient")]
+
+    async def run():
+        config = {
+            "configurable": {
+                "thread_id": str(uuid.uuid4()),
+                DEADLINE_KEY: time.time() + 3600,
+            }
+        }
+        return await ecos_graph.ainvoke(
+            {"query": "소비자물가", "messages": [], "retry_counts": {}}, config=config
+        )
+
+    result = asyncio.run(run())
+
+    # First attempt plus the two retries of the budget, then give up
+    assert len(calls) == 3
+    assert result["error_kind"] == "transient"
+    assert result["retry_counts"]["fetch_statistics"] == 3
+    assert retry_metrics.retries[("fetch_statistics", "transient")] == before + 2
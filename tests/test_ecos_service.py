@@ -0,0 +1,145 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from app.services.ecos_service import (
+    EcosApiError,
+    EcosService,
+    build_statistic_data,
+    item_list_response_adapter,
+    parse_response,
+    search_response_adapter,
+)
+
+ROWS = [
+    {
+        "ITEM_NAME1": "총지수",
+        "ITEM_NAME2": None,
+        "UNIT_NAME": "2020=100",
+        "TIME": "202401",
+        "DATA_VALUE": "113.15",
+    },
+    {
+        "ITEM_NAME1": "총지수",
+        "ITEM_NAME2": None,
+        "UNIT_NAME": "2020=100",
+        "TIME": "202402",
+        "DATA_VALUE": "113.77",
+    },
+    {
+        "ITEM_NAME1": "식료품",
+        "ITEM_NAME2": "쌀",
+        "UNIT_NAME": "2020=100",
+        "TIME": "202401",
+        "DATA_VALUE": "120.3",
+    },
+]
+
+
+def body(payload: dict) -> bytes:
+    return json.dumps(payload, ensure_ascii=False).encode()
+
+
+def error_body(code: str, message: str = "해당하는 데이터가 없습니다.") -> bytes:
+    return body({"RESULT": {"CODE": code, "MESSAGE": message}})
+
+
+def test_parse_search_response():
+    content = body(
+        {"StatisticSearch": {"list_total_count": 3, "row": ROWS}},
+    )
+    data = parse_response(search_response_adapter, content)
+    # Only the declared fields are kept
+    assert data["StatisticSearch"] == {"row": ROWS}
+
+
+def test_parse_item_list_response():
+    content = body(
+        {
+            "StatisticItemList": {
+                "list_total_count": 1,
+                "row": [
+                    {
+                        "STAT_CODE": "901Y009",
+                        "ITEM_CODE": "0",
+                        "ITEM_NAME": "총지수",
+                        "CYCLE": "M",
+                        "START_TIME": "196501",
+                        "END_TIME": "202412",
+                        "P_ITEM_CODE": None,
+                    }
+                ],
+            }
+        }
+    )
+    (item,) = parse_response(item_list_response_adapter, content)["StatisticItemList"][
+        "row"
+    ]
+    assert (item.code, item.name, item.cycle.value) == ("0", "총지수", "M")
+
+
+def test_parse_error_envelope():
+    data = parse_response(search_response_adapter, error_body("INFO-200"))
+    assert data == {
+        "RESULT": {"CODE": "INFO-200", "MESSAGE": "해당하는 데이터가 없습니다."}
+    }
+
+
+def test_parse_invalid_json_raises_json_decode_error():
+    with pytest.raises(json.JSONDecodeError):
+        parse_response(search_response_adapter, b"<html>Service Unavailable</html>")
+
+
+def test_parse_unexpected_shape_raises_validation_error():
+    with pytest.raises(ValidationError):
+        parse_response(search_response_adapter, body({"StatisticSearch": {}}))
+
+
+def test_build_statistic_data_groups_rows_by_item():
+    data = build_statistic_data(ROWS)
+    assert data.unit == "2020=100"
+    assert data.data == {
+        "총지수": {"202401": "113.15", "202402": "113.77"},
+        "식료품 > 쌀": {"202401": "120.3"},
+    }
+
+
+def test_build_statistic_data_labels_rows_without_names():
+    data = build_statistic_data([{"TIME": "2024", "DATA_VALUE": "1"}])
+    assert data.data == {"Total": {"2024": "1"}}
+    assert data.unit == ""
+
+
+def fetch(content: bytes):
+    service = EcosService()
+    service.api_key = "test"
+    service.transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, content=content)
+    )
+    return asyncio.run(
+        service.get_statistic_data("901Y009", "M", "202401", "202402", "0")
+    )
+
+
+def test_get_statistic_data_from_search_rows():
+    content = body({"StatisticSearch": {"list_total_count": 3, "row": ROWS}})
+    assert fetch(content) == build_statistic_data(ROWS)
+
+
+@pytest.mark.parametrize(
+    "code, hint",
+    [
+        ("INFO-200", "Check the date"),
+        ("ERROR-400", "Narrow the date range"),
+        ("ERROR-101", "Check the cycle"),
+        ("ERROR-500", None),
+    ],
+)
+def test_get_statistic_data_raises_on_error_envelope(code, hint):
+    with pytest.raises(EcosApiError) as error:
+        fetch(error_body(code))
+    assert error.value.code == code
+    assert (hint in str(error.value)) if hint else "Hint" not in str(error.value)
@@ -0,0 +1,83 @@
+import csv
+import io
+import json
+
+import pytest
+
+from app.schema.statistics import SeriesSpec, StatisticData
+from app.services.export_service import (
+    CSV_COLUMNS,
+    ArrowEncoder,
+    CsvEncoder,
+    SeriesResult,
+    encode_ndjson,
+)
+
+SPEC = SeriesSpec(
+    stat_code="901Y009",
+    item_code="0",
+    cycle="M",
+    start_time="202401",
+    end_time="202402",
+)
+OK = SeriesResult(
+    0,
+    SPEC,
+    data=StatisticData(
+        unit="2020=100", data={"총지수": {"202401": "113.15", "202402": "113.77"}}
+    ),
+)
+FAILED = SeriesResult(1, SPEC.model_copy(update={"item_code": None}), error="No data")
+
+
+def test_ndjson_is_one_object_per_series():
+    lines = (encode_ndjson(OK) + encode_ndjson(FAILED)).decode().splitlines()
+    ok, failed = map(json.loads, lines)
+
+    assert ok == {
+        "index": 0,
+        "stat_code": "901Y009",
+        "item_code": "0",
+        "cycle": "M",
+        "start_time": "202401",
+        "end_time": "202402",
+        "unit": "2020=100",
+        "data": {"총지수": {"202401": "113.15", "202402": "113.77"}},
+    }
+    assert failed["index"] == 1
+    assert failed["error"] == "No data"
+    assert "data" not in failed
+
+
+def test_csv_has_a_header_and_one_row_per_value():
+    encoder = CsvEncoder()
+    body = encoder.header() + encoder.encode(OK) + encoder.encode(FAILED)
+    body += encoder.close()
+
+    rows = list(csv.reader(io.StringIO(body.decode())))
+    assert rows == [
+        CSV_COLUMNS,
+        ["0", "901Y009", "0", "M", "총지수", "202401", "113.15", "2020=100", ""],
+        ["0", "901Y009", "0", "M", "총지수", "202402", "113.77", "2020=100", ""],
+        ["1", "901Y009", "", "M", "", "", "", "", "No data"],
+    ]
+
+
+def test_csv_chunks_do_not_repeat_earlier_rows():
+    encoder = CsvEncoder()
+    encoder.header()
+    encoder.encode(OK)
+    assert encoder.encode(FAILED).decode().count("\n") == 1
+
+
+def test_arrow_stream_round_trip():
+    pa = pytest.importorskip("pyarrow")
+    encoder = ArrowEncoder()
+    body = encoder.header() + encoder.encode(OK) + encoder.encode(FAILED)
+    body += encoder.close()
+
+    table = pa.ipc.open_stream(body).read_all()
+    assert table.column_names == CSV_COLUMNS
+    assert table.num_rows == 3
+    assert table.column("value").to_pylist() == ["113.15", "113.77", ""]
+    assert table.column("error").to_pylist() == ["", "", "No data"]
@@ -0,0 +1,67 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.schema.statistics import Statistic
+from app.workflow.ecos.nodes import fetch_statistics
+from app.workflow.ecos.nodes.fetch_statistics import (
+    fetch_statistics_node,
+    merge_candidates,
+    split_query,
+)
+
+
+def make_stat(code):
+    return Statistic(
+        stat_code=code, stat_name=code, cycle="M", full_path=f"테스트 > {code}"
+    )
+
+
+@pytest.mark.parametrize(
+    "query, parts",
+    [
+        ("GDP 성장률, 실업률 및 소비자물가", ["GDP 성장률", "실업률", "소비자물가"]),
+        ("수출 vs 수입 추이", ["수출", "수입 추이"]),
+        ("기준금리 / 환율", ["기준금리", "환율"]),
+        # Particles and slashes inside words are not separators
+        ("금리 인상 효과 분석", []),
+        ("코로나 이후 경제 결과 보고", []),
+        ("원/달러 환율 추이", []),
+        # One-character fragments are dropped
+        ("원, 달러 환율", ["달러 환율"]),
+    ],
+)
+def test_split_query(query, parts):
+    assert split_query(query) == parts
+
+
+def test_merge_keeps_candidates_of_every_indicator():
+    query_hits = [make_stat(f"Q{i}") for i in range(10)]
+    first = [make_stat("Q0"), make_stat("A1"), make_stat("A2")]
+    second = [make_stat("B1"), make_stat("B2")]
+
+    merged = merge_candidates([query_hits, first, second], limit=6)
+    codes = [stat.stat_code for stat in merged]
+    assert codes == ["Q0", "B1", "Q1", "A1", "B2", "Q2"]
+
+
+def test_searches_run_concurrently_off_the_event_loop(monkeypatch):
+    query = "GDP 성장률, 실업률 및 소비자물가"
+    # Every search waits for all the others: completes only if they overlap
+    barrier = threading.Barrier(1 + len(split_query(query)), timeout=5)
+
+    def search(keyword, k):
+        barrier.wait()
+        return [make_stat(keyword)]
+
+    monkeypatch.setattr(fetch_statistics.statistics_service, "search", search)
+    result = asyncio.run(fetch_statistics_node({"query": query}))
+
+    assert [stat.stat_code for stat in result["found_statistics"]] == [
+        query,
+        "GDP 성장률",
+        "실업률",
+        "소비자물가",
+    ]
+    assert result["error_message"] is None
@@ -0,0 +1,67 @@
+from app.schema.statistics import StatisticItem
+from app.workflow.ecos.item_ranker import best_item, rank_items
+
+
+def make_item(code, name, parent_code=None, cycle="M"):
+    return StatisticItem(
+        code=code,
+        name=name,
+        start_time="200001",
+        end_time="202412",
+        cycle=cycle,
+        parent_code=parent_code,
+    )
+
+
+ITEMS = [
+    make_item("0", "총지수"),
+    make_item("A", "식료품 및 비주류음료", "0"),
+    make_item("A1", "식료품", "A"),
+    make_item("A2", "비주류음료", "A"),
+    make_item("B", "주류 및 담배", "0"),
+    make_item("B1", "주류", "B"),
+    make_item("B2", "담배", "B"),
+    make_item("C", "교통", "0"),
+    make_item("C1", "개인운송장비", "C"),
+    make_item("C2", "운송연료", "C"),
+]
+
+
+def codes(items):
+    return [item.code for item in items]
+
+
+def test_short_lists_are_returned_unchanged():
+    assert rank_items("담배", ITEMS, top_k=len(ITEMS)) is ITEMS
+
+
+def test_keeps_matches_with_their_parents_and_totals_in_order():
+    ranked = rank_items("담배 물가", ITEMS, top_k=1)
+    # The match, its parent chain up to the root (a total), nothing else
+    assert codes(ranked) == ["0", "B", "B2"]
+
+
+def test_item_listed_once_per_cycle_counts_once():
+    items = ITEMS + [make_item("B2", "담배", "B", cycle="Q")]
+    ranked = rank_items("담배", items, top_k=1)
+    assert codes(ranked) == ["0", "B", "B2", "B2"]
+
+
+def test_flat_tables_keep_named_totals_only():
+    items = [
+        make_item("X", "합계"),
+        make_item("Y", "수출"),
+        make_item("Z", "수입"),
+    ]
+    assert codes(rank_items("수출 실적", items, top_k=1)) == ["X", "Y"]
+
+
+def test_best_item_picks_the_closest_name():
+    assert best_item("담배 가격", ITEMS).code == "B2"
+    assert best_item("운송연료 물가", ITEMS).code == "C2"
+
+
+def test_best_item_falls_back_to_the_first_top_level_item():
+    assert best_item("", ITEMS).code == "0"
+    assert best_item("GDP", ITEMS[1:]).code == "A"
+    assert best_item("담배", []) is None
@@ -0,0 +1,68 @@
+from app.core.utils import canonicalize_url
+from app.schema.news import News
+from app.services.news_dedup import cluster_news, hamming_distance, simhash
+
+MAX_DISTANCE = 12
+
+
+def make_news(title, link, description="", pub_date="Mon, 02 Dec 2024 09:00:00"):
+    return News(
+        title=title, original_link=link, description=description, pub_date=pub_date
+    )
+
+
+def test_canonicalize_url_drops_tracking_and_sorts_query():
+    assert (
+        canonicalize_url(
+            "HTTPS://News.Example.com:443/econ/article/?b=2&utm_source=naver"
+            "&a=1&fbclid=xyz#comments"
+        )
+        == "https://news.example.com/econ/article?a=1&b=2"
+    )
+
+
+def test_canonicalize_url_keeps_non_default_port_and_blank_values():
+    assert (
+        canonicalize_url("http://example.com:8080/?q=&ref=home")
+        == "http://example.com:8080/?q="
+    )
+    assert canonicalize_url("http://example.com:80") == "http://example.com/"
+
+
+def test_same_link_with_tracking_params_is_one_cluster():
+    items = [
+        make_news("한국은행 기준금리 동결", "https://a.com/1?utm_source=naver"),
+        make_news("전혀 다른 제목의 기사", "https://a.com/1/#top"),
+    ]
+    clustered = cluster_news(items, MAX_DISTANCE)
+    assert len(clustered) == 1
+    assert clustered[0].title == "한국은행 기준금리 동결"
+    assert clustered[0].cluster_size == 2
+
+
+def test_syndicated_copies_collapse_onto_the_first_result():
+    description = (
+        "한국은행 금융통화위원회는 28일 기준금리를 연 3.25%에서 3.00%로 "
+        "0.25%포인트 인하했다고 밝혔다."
+    )
+    items = [
+        make_news(
+            "<b>한국은행</b>, 기준금리 0.25%p 인하", "https://a.com/1", description
+        ),
+        make_news("한국은행 기준금리 0.25%p 인하", "https://b.com/9", description),
+        make_news("반도체 수출 3개월 연속 증가", "https://c.com/3", "반도체 수출 증가"),
+    ]
+    clustered = cluster_news(items, MAX_DISTANCE)
+
+    assert [item.original_link for item in clustered] == [
+        "https://a.com/1",
+        "https://c.com/3",
+    ]
+    assert [item.cluster_size for item in clustered] == [2, 1]
+    # The input results are not modified
+    assert items[0].cluster_size == 1
+
+
+def test_simhash_ignores_markup_and_spacing():
+    assert simhash("<b>기준금리</b> 동결") == simhash("기준금리동결")
+    assert hamming_distance(simhash("기준금리 동결"), simhash("수출 증가")) > 0
@@ -0,0 +1,48 @@
+from app.services.passage_ranker import PASSAGE_SEPARATOR, select_passages, tokenize
+
+# One sentence per line, so the split is the same with or without punkt
+ARTICLE = "\n".join(
+    [
+        "서울 날씨는 오늘 맑고 포근하겠습니다.",
+        "한국은행은 28일 기준금리를 연 3.00%로 인하했다.",
+        "금융통화위원회는 경기 둔화 우려를 인하 배경으로 꼽았다.",
+        "주말에는 전국에 비 소식이 있습니다.",
+        "프로야구 개막전은 다음 달 열린다.",
+        "시장에서는 내년 상반기 기준금리 추가 인하 가능성을 점친다.",
+    ]
+)
+
+
+def test_short_text_is_returned_as_is():
+    assert (
+        select_passages("짧은 기사 본문.", "기준금리", budget=100) == "짧은 기사 본문."
+    )
+
+
+def test_selects_relevant_sentences_in_original_order():
+    selected = select_passages(ARTICLE, "기준금리 인하", budget=120)
+
+    passages = selected.split(PASSAGE_SEPARATOR)
+    assert passages == [
+        "한국은행은 28일 기준금리를 연 3.00%로 인하했다. "
+        "금융통화위원회는 경기 둔화 우려를 인하 배경으로 꼽았다.",
+        "시장에서는 내년 상반기 기준금리 추가 인하 가능성을 점친다.",
+    ]
+    assert len(selected) <= 120
+    assert "날씨" not in selected and "프로야구" not in selected
+
+
+def test_budget_keeps_only_the_best_sentences():
+    selected = select_passages(ARTICLE, "기준금리 인하", budget=40)
+    assert selected in ARTICLE.split("\n")
+    assert "기준금리" in selected
+
+
+def test_falls_back_to_the_lead_without_matches():
+    assert select_passages(ARTICLE, "반도체 수출", budget=30) == ARTICLE[:30]
+
+
+def test_korean_words_match_with_particles():
+    shared = set(tokenize("기준금리")) & set(tokenize("기준금리를"))
+    assert {"기준", "준금", "금리"} <= shared
+    assert "3.00%" in tokenize("연 3.00%로")
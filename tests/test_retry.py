@@ -0,0 +1,122 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+from langgraph.graph import END
+
+from app.core.deadline import deadline_scope
+from app.services.ecos_service import EcosApiError
+from app.workflow.ecos.retry import (
+    FailureKind,
+    classify_error,
+    route_on_failure,
+    stage_failure,
+)
+
+RETRY_TARGETS = {
+    FailureKind.TRANSIENT: "fetch_data",
+    FailureKind.BAD_PARAMETERS: "select_parameters",
+}
+
+
+def http_status_error(status: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "http://ecos.bok.or.kr/api")
+    response = httpx.Response(status, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+@pytest.mark.parametrize(
+    "code, kind",
+    [
+        ("INFO-200", FailureKind.NO_DATA),
+        ("INFO-100", FailureKind.FATAL),
+        ("ERROR-500", FailureKind.TRANSIENT),
+        ("ERROR-600", FailureKind.TRANSIENT),
+        ("ERROR-602", FailureKind.TRANSIENT),
+        # Fail the same way every time: the request has to change
+        ("ERROR-400", FailureKind.BAD_PARAMETERS),
+        ("ERROR-601", FailureKind.BAD_PARAMETERS),
+        ("ERROR-101", FailureKind.BAD_PARAMETERS),
+    ],
+)
+def test_classify_ecos_codes(code, kind):
+    assert classify_error(EcosApiError("message", code)) == kind
+
+
+@pytest.mark.parametrize(
+    "error, kind",
+    [
+        (http_status_error(503), FailureKind.TRANSIENT),
+        (http_status_error(429), FailureKind.TRANSIENT),
+        (http_status_error(404), FailureKind.FATAL),
+        (httpx.ConnectError("refused"), FailureKind.TRANSIENT),
+        (asyncio.TimeoutError(), FailureKind.TRANSIENT),
+        (json.JSONDecodeError("bad", "{", 0), FailureKind.TRANSIENT),
+        (RuntimeError("bug"), FailureKind.FATAL),
+    ],
+)
+def test_classify_other_errors(error, kind):
+    assert classify_error(error) == kind
+
+
+def failed_state(stage: str, kind: FailureKind, times: int = 1) -> dict:
+    state: dict = {"retry_counts": {}}
+    for _ in range(times):
+        state.update(stage_failure(state, stage, "failed", kind))
+    return state
+
+
+def route(state: dict, stage: str = "fetch_data", on_success: str = END) -> str:
+    return route_on_failure(
+        state,
+        stage,
+        on_success=on_success,
+        retry_targets=RETRY_TARGETS,
+        on_give_up="generate_error",
+        on_deadline="generate",
+    )
+
+
+def test_route_success():
+    assert route({"error_message": None}) == END
+
+
+def test_route_retries_within_budget():
+    # fetch_data allows two transient retries
+    assert route(failed_state("fetch_data", FailureKind.TRANSIENT, 1)) == "fetch_data"
+    assert route(failed_state("fetch_data", FailureKind.TRANSIENT, 2)) == "fetch_data"
+    state = failed_state("fetch_data", FailureKind.BAD_PARAMETERS)
+    assert route(state) == "select_parameters"
+
+
+def test_route_gives_up_when_budget_spent():
+    state = failed_state("fetch_data", FailureKind.TRANSIENT, 3)
+    assert route(state) == "generate_error"
+
+
+def test_route_gives_up_without_target_or_budget():
+    # No retry target for NO_DATA, and fetch_items has no BAD_PARAMETERS budget
+    assert route(failed_state("fetch_data", FailureKind.NO_DATA)) == "generate_error"
+    state = failed_state("fetch_items", FailureKind.BAD_PARAMETERS)
+    assert route(state, stage="fetch_items") == "generate_error"
+    assert route(failed_state("fetch_data", FailureKind.FATAL)) == "generate_error"
+
+
+def test_route_budget_low_skips_retry():
+    state = failed_state("fetch_data", FailureKind.TRANSIENT)
+    with deadline_scope(time.time() + 1):
+        assert route(state) == "generate"
+
+
+def test_route_budget_low_skips_next_stage():
+    with deadline_scope(time.time() + 1):
+        assert route({}, on_success="select_parameters") == "generate"
+        # The last stage still finishes normally
+        assert route({}, on_success=END) == END
+
+
+def test_route_budget_left_continues():
+    with deadline_scope(time.time() + 3600):
+        assert route({}, on_success="select_parameters") == "select_parameters"
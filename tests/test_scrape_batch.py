@@ -0,0 +1,51 @@
+import asyncio
+
+from app.core.config import settings
+from app.schema.news import NewsItem
+from app.services.news_service import news_service
+
+
+def test_urls_over_the_batch_limit_are_reported(monkeypatch):
+    async def scrape_article(url, query=None):
+        return NewsItem(title=url, text="본문", publish_date=None)
+
+    monkeypatch.setattr(news_service, "scrape_article", scrape_article)
+    limit = settings.NEWS_SCRAPE_MAX_URLS
+    urls = [f"https://news.example.com/{n}" for n in range(limit + 3)]
+
+    results = asyncio.run(news_service.scrape_articles(urls, timeout=5))
+
+    assert [result.url for result in results] == urls
+    assert all(result.article for result in results[:limit])
+    for result in results[limit:]:
+        assert result.article is None
+        assert result.error.startswith("skipped: batch limit")
+
+
+def test_limits_are_shared_across_concurrent_batches(monkeypatch):
+    running = {"now": 0, "max": 0}
+
+    async def scrape_article(url, query=None):
+        running["now"] += 1
+        running["max"] = max(running["max"], running["now"])
+        await asyncio.sleep(0.01)
+        running["now"] -= 1
+        return NewsItem(title=url, text="본문", publish_date=None)
+
+    monkeypatch.setattr(news_service, "scrape_article", scrape_article)
+
+    async def run_batches():
+        batches = [
+            [f"https://news.example.com/{batch}/{n}" for n in range(4)]
+            for batch in range(3)
+        ]
+        return await asyncio.gather(
+            *(news_service.scrape_articles(urls, timeout=5) for urls in batches)
+        )
+
+    results = asyncio.run(run_batches())
+
+    assert all(result.article for batch in results for result in batch)
+    # One host: the per-domain cap holds for all batches together
+    assert running["max"] == settings.NEWS_SCRAPE_MAX_PER_DOMAIN
+    assert news_service._domain_limits == {}
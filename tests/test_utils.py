@@ -0,0 +1,35 @@
+import pytest
+
+from app.core.utils import shift_period
+
+
+@pytest.mark.parametrize(
+    "period, cycle, offset, expected",
+    [
+        ("2024", "A", -11, "2013"),
+        ("2024S1", "S", -1, "2023S2"),
+        ("2023S2", "S", 1, "2024S1"),
+        ("2024S1", "S", -5, "2021S2"),
+        ("2024Q1", "Q", -1, "2023Q4"),
+        ("2024Q3", "Q", 6, "2026Q1"),
+        ("2024Q2", "Q", -11, "2021Q3"),
+        ("202401", "M", -1, "202312"),
+        ("202412", "M", 1, "202501"),
+        ("202403", "M", -14, "202301"),
+        ("202401S1", "SM", -1, "202312S2"),
+        ("202412S2", "SM", 1, "202501S1"),
+        ("20240301", "D", -1, "20240229"),
+        ("20230301", "D", -1, "20230228"),
+        ("20240228", "D", 1, "20240229"),
+        ("20241231", "D", 1, "20250101"),
+    ],
+)
+def test_shift_period(period, cycle, offset, expected):
+    assert shift_period(period, cycle, offset) == expected
+
+
+@pytest.mark.parametrize(
+    "period, cycle", [("2024S2", "S"), ("2024Q3", "Q"), ("202406S2", "SM")]
+)
+def test_shift_period_round_trip(period, cycle):
+    assert shift_period(shift_period(period, cycle, -7), cycle, 7) == period